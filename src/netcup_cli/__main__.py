@@ -1,6 +1,6 @@
 """Allow running as python -m netcup_cli."""
 
-from .cli.main import main
+from .launcher import main
 
 if __name__ == "__main__":
     main()
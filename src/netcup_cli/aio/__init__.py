@@ -0,0 +1,94 @@
+"""Asyncio counterparts of the API resource modules."""
+
+from .base import close_async_client, get_async_client
+from .client import AsyncAPIClient
+from .rdns import (
+    rdns_delete_ipv4,
+    rdns_delete_ipv6,
+    rdns_get_ipv4,
+    rdns_get_ipv6,
+    rdns_set_ipv4,
+    rdns_set_ipv6,
+)
+from .servers import (
+    server_get,
+    server_get_many,
+    server_list,
+    server_patch,
+)
+from .servers_interfaces import (
+    firewall_get,
+    firewall_put,
+    firewall_reapply,
+    firewall_restore_copied_policies,
+    interface_create,
+    interface_delete,
+    interface_get,
+    interface_update,
+    interfaces_list,
+)
+from .servers_metrics import (
+    metrics_cpu,
+    metrics_disk,
+    metrics_network,
+    metrics_network_packet,
+)
+from .servers_snapshots import (
+    snapshot_create,
+    snapshot_delete,
+    snapshot_export,
+    snapshot_get,
+    snapshot_revert,
+    snapshots_dryrun,
+    snapshots_list,
+)
+from .tasks import task_cancel, task_get, task_list
+from .user_failoverips import (
+    failoverips_v4_list,
+    failoverips_v4_route,
+    failoverips_v6_list,
+    failoverips_v6_route,
+)
+
+__all__ = [
+    "AsyncAPIClient",
+    "get_async_client",
+    "close_async_client",
+    "server_list",
+    "server_get",
+    "server_get_many",
+    "server_patch",
+    "rdns_get_ipv4",
+    "rdns_set_ipv4",
+    "rdns_delete_ipv4",
+    "rdns_get_ipv6",
+    "rdns_set_ipv6",
+    "rdns_delete_ipv6",
+    "task_list",
+    "task_get",
+    "task_cancel",
+    "metrics_cpu",
+    "metrics_disk",
+    "metrics_network",
+    "metrics_network_packet",
+    "interfaces_list",
+    "interface_get",
+    "interface_create",
+    "interface_update",
+    "interface_delete",
+    "firewall_get",
+    "firewall_put",
+    "firewall_reapply",
+    "firewall_restore_copied_policies",
+    "snapshots_list",
+    "snapshot_get",
+    "snapshot_create",
+    "snapshot_delete",
+    "snapshot_export",
+    "snapshot_revert",
+    "snapshots_dryrun",
+    "failoverips_v4_list",
+    "failoverips_v4_route",
+    "failoverips_v6_list",
+    "failoverips_v6_route",
+]
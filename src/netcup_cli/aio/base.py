@@ -0,0 +1,30 @@
+"""Base helpers for async API modules."""
+
+from ..api.base import client_options
+from ..config import API_BASE_URL
+from .client import AsyncAPIClient
+
+_default_client: AsyncAPIClient | None = None
+
+
+def get_async_client(max_concurrency: int | None = None) -> AsyncAPIClient:
+    """Return shared async API client, built with the configure_client() options.
+    Passing max_concurrency replaces it."""
+    global _default_client
+    if _default_client is not None and max_concurrency not in (
+        None,
+        _default_client.max_concurrency,
+    ):
+        close_async_client()
+    if _default_client is None:
+        kwargs = {"max_concurrency": max_concurrency} if max_concurrency else {}
+        _default_client = AsyncAPIClient(base_url=API_BASE_URL, **kwargs, **client_options())
+    return _default_client
+
+
+def close_async_client() -> None:
+    """Close the shared async client."""
+    global _default_client
+    if _default_client is not None:
+        _default_client.close()
+        _default_client = None
@@ -0,0 +1,117 @@
+"""Asyncio HTTP client for SCP API.
+
+requests is blocking, so each request runs on a pooled APIClient in a worker
+thread, and retries, token handling and keep-alive behave exactly like the sync
+client. Concurrency is bounded by an asyncio.Semaphore per event loop: any
+number of coroutines (e.g. hundreds of server_get() calls gathered on one loop)
+wait on the loop, and only `max_concurrency` of them hold a thread and a
+connection at a time. The thread pool has the same size, so an admitted request
+never queues for a thread. All clients share the process-wide access token cache
+in auth.py.
+"""
+
+import asyncio
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import requests
+
+from ..client import APIClient
+from ..config import API_BASE_URL, ASYNC_MAX_CONCURRENCY
+
+
+class AsyncAPIClient:
+    """Async API client; at most `max_concurrency` requests are in flight at once.
+
+    Other keyword `options` (retry_policy, rate_limiter, cache, ...) are passed to
+    the underlying APIClient.
+    """
+
+    def __init__(
+        self,
+        access_token: str | None = None,
+        base_url: str = API_BASE_URL,
+        *,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+        **options: Any,
+    ):
+        self.max_concurrency = max_concurrency
+        self.sync_client = APIClient(
+            access_token, base_url, pool_maxsize=max_concurrency, **options
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="netcup-aio"
+        )
+        # Semaphores are bound to the loop they are first used on, so keep one per loop
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        """Async counterpart of APIClient.request (same keyword arguments)."""
+        call = functools.partial(self.sync_client.request, method, path, **kwargs)
+        async with self._get_semaphore():
+            return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    async def get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        accept: str | None = None,
+    ) -> requests.Response:
+        return await self.request("GET", path, params=params, accept=accept)
+
+    async def post(
+        self,
+        path: str,
+        json: dict | None = None,
+        data: dict | None = None,
+        content_type: str | None = None,
+        params: dict[str, Any] | None = None,
+        retry: bool | None = None,
+    ) -> requests.Response:
+        return await self.request(
+            "POST",
+            path,
+            json=json,
+            data=data,
+            content_type=content_type,
+            params=params,
+            retry=retry,
+        )
+
+    async def put(self, path: str, json: dict | None = None) -> requests.Response:
+        return await self.request("PUT", path, json=json)
+
+    async def patch(
+        self,
+        path: str,
+        json: dict | None = None,
+        content_type: str = "application/merge-patch+json",
+        params: dict[str, Any] | None = None,
+        retry: bool | None = None,
+    ) -> requests.Response:
+        return await self.request(
+            "PATCH", path, json=json, content_type=content_type, params=params, retry=retry
+        )
+
+    async def delete(self, path: str) -> requests.Response:
+        return await self.request("DELETE", path)
+
+    def close(self) -> None:
+        """Stop the worker pool and close the connection pool."""
+        self._executor.shutdown(wait=True)
+        self.sync_client.close()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,82 @@
+"""Async Servers API."""
+
+from collections.abc import Iterable
+from typing import Any
+
+from ..concurrency import AIMDController, fan_out_async
+from .base import get_async_client
+
+
+async def server_list(
+    *,
+    limit: int | None = None,
+    offset: int | None = None,
+    ip: str | None = None,
+    name: str | None = None,
+    q: str | None = None,
+) -> list[dict]:
+    """GET /api/v1/servers - List servers with optional filters."""
+    client = get_async_client()
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if ip:
+        params["ip"] = ip
+    if name:
+        params["name"] = name
+    if q:
+        params["q"] = q
+    resp = await client.get("/servers", params=params or None)
+    return resp.json()
+
+
+async def server_get(server_id: int, load_server_live_info: bool = True) -> dict:
+    """GET /api/v1/servers/{serverId} - Get one server."""
+    client = get_async_client()
+    resp = await client.get(
+        f"/servers/{server_id}",
+        params={"loadServerLiveInfo": load_server_live_info},
+    )
+    return resp.json()
+
+
+async def server_get_many(
+    server_ids: Iterable[int],
+    load_server_live_info: bool = True,
+    *,
+    controller: AIMDController | None = None,
+    max_workers: int | None = None,
+) -> list[tuple[int, dict | None, BaseException | None]]:
+    """Get many servers concurrently; return (server_id, server, error) in completion
+    order.
+
+    Parallelism is adapted by an AIMD controller (pass one to read its summary
+    afterwards) unless max_workers fixes it; the async client's max_concurrency
+    bounds both. Failures are returned, not raised.
+    """
+
+    async def fetch(server_id: int) -> dict:
+        return await server_get(server_id, load_server_live_info=load_server_live_info)
+
+    if max_workers is not None:
+        return await fan_out_async(fetch, server_ids, max_workers=max_workers)
+    controller = controller or AIMDController()
+    with controller.observing(get_async_client().sync_client):
+        return await fan_out_async(fetch, server_ids, controller=controller)
+
+
+async def server_patch(
+    server_id: int,
+    body: dict,
+    state_option: str | None = None,
+) -> dict | None:
+    """PATCH /api/v1/servers/{serverId} - Patch server (state, hostname, etc.).
+    Returns JSON or None for 204."""
+    client = get_async_client()
+    params = {"stateOption": state_option} if state_option else None
+    resp = await client.patch(f"/servers/{server_id}", json=body, params=params)
+    if resp.status_code == 204:
+        return None
+    return resp.json() if resp.text else None
@@ -0,0 +1,61 @@
+"""Async Server snapshots API."""
+
+from .base import get_async_client
+
+
+async def snapshots_list(server_id: int) -> list[dict]:
+    """GET /api/v1/servers/{serverId}/snapshots."""
+    client = get_async_client()
+    resp = await client.get(f"/servers/{server_id}/snapshots")
+    return resp.json()
+
+
+async def snapshot_get(server_id: int, name: str) -> dict:
+    """GET /api/v1/servers/{serverId}/snapshots/{name}."""
+    client = get_async_client()
+    resp = await client.get(f"/servers/{server_id}/snapshots/{name}")
+    return resp.json()
+
+
+async def snapshot_create(server_id: int, body: dict) -> dict | None:
+    """POST /api/v1/servers/{serverId}/snapshots - body: name, optional
+    description, diskName, onlineSnapshot."""
+    client = get_async_client()
+    resp = await client.post(f"/servers/{server_id}/snapshots", json=body)
+    if resp.status_code == 204:
+        return None
+    return resp.json() if resp.text else None
+
+
+async def snapshot_delete(server_id: int, name: str) -> dict | None:
+    """DELETE /api/v1/servers/{serverId}/snapshots/{name}."""
+    client = get_async_client()
+    resp = await client.delete(f"/servers/{server_id}/snapshots/{name}")
+    if resp.status_code == 204:
+        return None
+    return resp.json() if resp.text else None
+
+
+async def snapshot_export(server_id: int, name: str) -> dict | None:
+    """POST /api/v1/servers/{serverId}/snapshots/{name}/export."""
+    client = get_async_client()
+    resp = await client.post(f"/servers/{server_id}/snapshots/{name}/export")
+    if resp.status_code == 204:
+        return None
+    return resp.json() if resp.text else None
+
+
+async def snapshot_revert(server_id: int, name: str) -> dict | None:
+    """POST /api/v1/servers/{serverId}/snapshots/{name}/revert."""
+    client = get_async_client()
+    resp = await client.post(f"/servers/{server_id}/snapshots/{name}/revert")
+    if resp.status_code == 204:
+        return None
+    return resp.json() if resp.text else None
+
+
+async def snapshots_dryrun(server_id: int, body: dict) -> list[dict]:
+    """POST /api/v1/servers/{serverId}/snapshots:dryrun - Check if snapshot creation is possible."""
+    client = get_async_client()
+    resp = await client.post(f"/servers/{server_id}/snapshots:dryrun", json=body)
+    return resp.json()
@@ -1,16 +1,60 @@
 """Base helpers for API modules."""
 
+import threading
+from typing import Any
+
 from ..client import APIClient
+from ..client_setup import take_client_options
 from ..config import API_BASE_URL
+from ..session import close_session
 
 _default_client: APIClient | None = None
+_client_options: dict[str, Any] = {}
+_client_lock = threading.Lock()
+
+
+def configure_client(**options: Any) -> None:
+    """Set APIClient keyword options (e.g. retry_policy) for the shared client.
+    Replaces an already created shared client."""
+    global _default_client
+    _client_options.update(options)
+    _default_client = None
+
+
+def _apply_deferred_options() -> None:
+    deferred = take_client_options()
+    if deferred is not None:
+        configure_client(**deferred)
+
+
+def client_options() -> dict[str, Any]:
+    """Current configure_client() options, for clients built elsewhere (e.g. the
+    asyncio client)."""
+    with _client_lock:
+        _apply_deferred_options()
+        return dict(_client_options)
 
 
 def get_client(base_url: str | None = None) -> APIClient:
-    """Return shared API client (or one with optional base_url override)."""
+    """Return shared API client (or one with optional base_url override).
+    Both use the configure_client() options and the shared pooled session; options
+    deferred via client_setup.defer_client_options() are applied first."""
+    global _default_client
+    with _client_lock:
+        _apply_deferred_options()
+        if _default_client is None:
+            _default_client = APIClient(base_url=API_BASE_URL, **_client_options)
+        client = _default_client
     if base_url is not None:
-        return APIClient(base_url=base_url)
+        options = {**_client_options, "session": client.session}
+        return APIClient(base_url=base_url, **options)
+    return client
+
+
+def close_client() -> None:
+    """Close the shared client and its pooled connections."""
     global _default_client
-    if _default_client is None:
-        _default_client = APIClient(base_url=API_BASE_URL)
-    return _default_client
+    if _default_client is not None:
+        _default_client.close()
+        _default_client = None
+    close_session()
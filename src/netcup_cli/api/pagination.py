@@ -0,0 +1,29 @@
+"""Lazy limit/offset pagination for list endpoints."""
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import PAGE_SIZE
+
+
+def paginate(
+    fetch_page: Callable[[int, int], list[dict]],
+    page_size: int = PAGE_SIZE,
+    prefetch: bool = True,
+) -> Iterator[dict]:
+    """Yield records from fetch_page(limit, offset) until a short page is returned.
+
+    With prefetch, page N+1 is requested in a background thread while page N is
+    being consumed, so at most two pages are held in memory.
+    """
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="netcup-page") as pool:
+        offset = 0
+        pending = pool.submit(fetch_page, page_size, offset)
+        while pending is not None:
+            page = pending.result()
+            offset += len(page)
+            more = len(page) >= page_size
+            pending = pool.submit(fetch_page, page_size, offset) if more and prefetch else None
+            yield from page
+            if more and not prefetch:
+                pending = pool.submit(fetch_page, page_size, offset)
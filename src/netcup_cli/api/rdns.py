@@ -11,9 +11,9 @@ def rdns_get_ipv4(ip: str) -> dict:
 
 
 def rdns_set_ipv4(ip: str, rdns: str) -> None:
-    """POST /api/v1/rdns/ipv4 - Set rDNS for IPv4."""
+    """POST /api/v1/rdns/ipv4 - Set rDNS for IPv4 (idempotent, so retried)."""
     client = get_client()
-    client.post("/rdns/ipv4", json={"ip": ip, "rdns": rdns})
+    client.post("/rdns/ipv4", json={"ip": ip, "rdns": rdns}, retry=True)
 
 
 def rdns_delete_ipv4(ip: str) -> None:
@@ -30,9 +30,9 @@ def rdns_get_ipv6(ip: str) -> dict:
 
 
 def rdns_set_ipv6(ip: str, rdns: str) -> None:
-    """POST /api/v1/rdns/ipv6 - Set rDNS for IPv6."""
+    """POST /api/v1/rdns/ipv6 - Set rDNS for IPv6 (idempotent, so retried)."""
     client = get_client()
-    client.post("/rdns/ipv6", json={"ip": ip, "rdns": rdns})
+    client.post("/rdns/ipv6", json={"ip": ip, "rdns": rdns}, retry=True)
 
 
 def rdns_delete_ipv6(ip: str) -> None:
@@ -1,8 +1,12 @@
 """Servers API."""
 
+from collections.abc import Iterable, Iterator
 from typing import Any
 
+from ..concurrency import AIMDController, fan_out
+from ..config import PAGE_SIZE
 from .base import get_client
+from .pagination import paginate
 
 
 def server_list(
@@ -53,3 +57,41 @@ def server_patch(
     if resp.status_code == 204:
         return None
     return resp.json() if resp.text else None
+
+
+def iter_servers(
+    *,
+    ip: str | None = None,
+    name: str | None = None,
+    q: str | None = None,
+    page_size: int = PAGE_SIZE,
+) -> Iterator[dict]:
+    """Iterate over all servers matching the filters, fetching pages lazily."""
+    return paginate(
+        lambda limit, offset: server_list(limit=limit, offset=offset, ip=ip, name=name, q=q),
+        page_size,
+    )
+
+
+def server_get_many(
+    server_ids: Iterable[int],
+    load_server_live_info: bool = True,
+    *,
+    controller: AIMDController | None = None,
+    max_workers: int | None = None,
+) -> Iterator[tuple[int, dict | None, Exception | None]]:
+    """Get many servers concurrently; yield (server_id, server, error) as each completes.
+
+    Parallelism is adapted by an AIMD controller (pass one to read its summary
+    afterwards) unless max_workers fixes it. Failures are yielded, not raised.
+    """
+
+    def fetch(server_id: int) -> dict:
+        return server_get(server_id, load_server_live_info=load_server_live_info)
+
+    if max_workers is not None:
+        yield from fan_out(fetch, server_ids, max_workers=max_workers)
+        return
+    controller = controller or AIMDController()
+    with controller.observing(get_client()):
+        yield from fan_out(fetch, server_ids, controller=controller)
@@ -1,8 +1,11 @@
 """Server logs API."""
 
+from collections.abc import Iterator
 from typing import Any
 
+from ..config import PAGE_SIZE
 from .base import get_client
+from .pagination import paginate
 
 
 def server_logs_list(
@@ -17,3 +20,11 @@ def server_logs_list(
         params["offset"] = offset
     resp = client.get(f"/servers/{server_id}/logs", params=params or None)
     return resp.json()
+
+
+def iter_server_logs(server_id: int, page_size: int = PAGE_SIZE) -> Iterator[dict]:
+    """Iterate over all log entries of a server, fetching pages lazily."""
+    return paginate(
+        lambda limit, offset: server_logs_list(server_id, limit=limit, offset=offset),
+        page_size,
+    )
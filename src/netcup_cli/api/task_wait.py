@@ -0,0 +1,170 @@
+"""Waiting for async tasks (TaskInfo) with adaptive polling."""
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+
+from ..config import TASK_POLL_MAX, TASK_POLL_MIN
+from ..exceptions import TaskTimeoutError
+from ..timeutil import parse_timestamp
+from .tasks import iter_tasks, task_get
+
+# TaskState values after which a task no longer changes
+FINAL_STATES = frozenset({"FINISHED", "ERROR", "CANCELED"})
+# TaskState values of unfinished tasks that GET /tasks can filter by, most common
+# first (the state filter rejects ROLLBACK; such tasks are read with task_get)
+ACTIVE_STATES = ("RUNNING", "PENDING", "WAITING_FOR_CANCEL")
+
+
+def next_poll_interval(
+    task: dict,
+    previous: float | None = None,
+    min_interval: float = TASK_POLL_MIN,
+    max_interval: float = TASK_POLL_MAX,
+) -> float:
+    """Seconds until the next poll of task, from its TaskProgress.
+
+    Polls at half the expected remaining time (from expectedFinishedAt, or
+    extrapolated from progressInPercent and startedAt), so polling is sparse early
+    and tightens towards completion. Without progress data the interval grows by
+    1.5x from min_interval.
+    """
+    now = time.time()
+    progress = task.get("taskProgress") or {}
+    remaining = None
+    expected = parse_timestamp(progress.get("expectedFinishedAt"))
+    percent = progress.get("progressInPercent")
+    started = parse_timestamp(task.get("startedAt"))
+    if expected is not None:
+        remaining = expected - now
+    elif percent and 0 < percent < 100 and started is not None:
+        remaining = (now - started) * (100 - percent) / percent
+    if remaining is not None:
+        interval = remaining / 2
+    elif previous is None:
+        interval = min_interval
+    else:
+        interval = previous * 1.5
+    return max(min_interval, min(max_interval, interval))
+
+
+def wait_for_task(
+    task: str | dict,
+    timeout: float | None = None,
+    on_update: Callable[[dict], None] | None = None,
+    min_interval: float = TASK_POLL_MIN,
+    max_interval: float = TASK_POLL_MAX,
+) -> dict:
+    """Poll a task (UUID or TaskInfo returned by a mutating call) until it reaches a
+    final state; return the final TaskInfo.
+
+    on_update(task) is called after every poll. Raises TaskTimeoutError (with the
+    last TaskInfo seen) when timeout seconds pass first.
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    if isinstance(task, str):
+        current = task_get(task)
+    else:
+        current = task
+    uuid = current["uuid"]
+    interval = None
+    while True:
+        if on_update is not None:
+            on_update(current)
+        if current.get("state") in FINAL_STATES:
+            return current
+        interval = next_poll_interval(current, interval, min_interval, max_interval)
+        if deadline is not None:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise TaskTimeoutError(f"Timed out waiting for task {uuid}", task=current)
+            interval = min(interval, left)
+        time.sleep(interval)
+        current = task_get(uuid)
+
+
+class TaskWatcher:
+    """Wait for many tasks at once with one task list request per tick.
+
+    Each tick lists unfinished tasks (optionally only those of server_id), one
+    request per ACTIVE_STATES value until every watched task has been seen, and
+    calls task_get only for watched tasks missing from those lists, e.g. to read
+    their final state or a ROLLBACK. Finished tasks are emitted by poll() / watch().
+    """
+
+    def __init__(
+        self,
+        tasks: Iterable[str | dict] = (),
+        server_id: int | None = None,
+        min_interval: float = TASK_POLL_MIN,
+        max_interval: float = TASK_POLL_MAX,
+    ):
+        self.server_id = server_id
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        # Last TaskInfo seen per watched UUID
+        self.pending: dict[str, dict] = {}
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task: str | dict) -> None:
+        """Watch a task (UUID or TaskInfo)."""
+        if isinstance(task, str):
+            self.pending[task] = {"uuid": task}
+        else:
+            self.pending[task["uuid"]] = task
+
+    def poll(self, on_update: Callable[[dict], None] | None = None) -> list[dict]:
+        """Refresh all pending tasks once; return (and stop watching) finished ones."""
+        if not self.pending:
+            return []
+        active = {}
+        if len(self.pending) > 1:
+            for state in ACTIVE_STATES:
+                for task in iter_tasks(state=state, server_id=self.server_id):
+                    if task.get("uuid") in self.pending:
+                        active[task["uuid"]] = task
+                if len(active) == len(self.pending):
+                    break
+        finished = []
+        for uuid in list(self.pending):
+            task = active.get(uuid) or task_get(uuid)
+            self.pending[uuid] = task
+            if on_update is not None:
+                on_update(task)
+            if task.get("state") in FINAL_STATES:
+                finished.append(self.pending.pop(uuid))
+        return finished
+
+    def next_interval(self, previous: float | None = None) -> float:
+        """Seconds until the next tick: the shortest interval of any pending task."""
+        return min(
+            (
+                next_poll_interval(task, previous, self.min_interval, self.max_interval)
+                for task in self.pending.values()
+            ),
+            default=self.min_interval,
+        )
+
+    def watch(
+        self,
+        timeout: float | None = None,
+        on_update: Callable[[dict], None] | None = None,
+    ) -> Iterator[dict]:
+        """Yield tasks as they reach a final state until none are pending.
+
+        Raises TaskTimeoutError after timeout seconds; unfinished tasks stay in
+        self.pending.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        interval = None
+        while True:
+            yield from self.poll(on_update)
+            if not self.pending:
+                return
+            interval = self.next_interval(interval)
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    raise TaskTimeoutError(f"Timed out waiting for {len(self.pending)} task(s)")
+                interval = min(interval, left)
+            time.sleep(interval)
@@ -1,8 +1,11 @@
 """Tasks API."""
 
+from collections.abc import Iterator
 from typing import Any
 
+from ..config import PAGE_SIZE
 from .base import get_client
+from .pagination import paginate
 
 
 def task_list(
@@ -43,3 +46,18 @@ def task_cancel(uuid: str) -> dict | None:
     if resp.status_code == 204:
         return None
     return resp.json() if resp.text else None
+
+
+def iter_tasks(
+    q: str | None = None,
+    server_id: int | None = None,
+    state: str | None = None,
+    page_size: int = PAGE_SIZE,
+) -> Iterator[dict]:
+    """Iterate over all tasks matching the filters, fetching pages lazily."""
+    return paginate(
+        lambda limit, offset: task_list(
+            limit=limit, offset=offset, q=q, server_id=server_id, state=state
+        ),
+        page_size,
+    )
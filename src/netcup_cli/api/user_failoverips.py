@@ -22,12 +22,14 @@ def failoverips_v4_list(
 
 
 def failoverips_v4_route(user_id: int, id: int, server_id: int) -> dict | None:
-    """PATCH /api/v1/users/{userId}/failoverips/v4/{id} - Route failover IPv4 to server."""
+    """PATCH /api/v1/users/{userId}/failoverips/v4/{id} - Route failover IPv4 to server
+    (idempotent, so retried)."""
     client = get_client()
     resp = client.patch(
         f"/users/{user_id}/failoverips/v4/{id}",
         json={"serverId": server_id},
         content_type="application/json",
+        retry=True,
     )
     if resp.status_code == 204:
         return None
@@ -51,12 +53,14 @@ def failoverips_v6_list(
 
 
 def failoverips_v6_route(user_id: int, id: int, server_id: int) -> dict | None:
-    """PATCH /api/v1/users/{userId}/failoverips/v6/{id}."""
+    """PATCH /api/v1/users/{userId}/failoverips/v6/{id} - Route failover IPv6 to server
+    (idempotent, so retried)."""
     client = get_client()
     resp = client.patch(
         f"/users/{user_id}/failoverips/v6/{id}",
         json={"serverId": server_id},
         content_type="application/json",
+        retry=True,
     )
     if resp.status_code == 204:
         return None
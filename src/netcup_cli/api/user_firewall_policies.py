@@ -1,8 +1,11 @@
 """User firewall policies API."""
 
+from collections.abc import Iterator
 from typing import Any
 
+from ..config import PAGE_SIZE
 from .base import get_client
+from .pagination import paginate
 
 
 def firewall_policies_list(
@@ -58,3 +61,15 @@ def firewall_policy_delete(user_id: int, policy_id: int) -> None:
     """DELETE /api/v1/users/{userId}/firewall-policies/{id}."""
     client = get_client()
     client.delete(f"/users/{user_id}/firewall-policies/{policy_id}")
+
+
+def iter_firewall_policies(
+    user_id: int,
+    q: str | None = None,
+    page_size: int = PAGE_SIZE,
+) -> Iterator[dict]:
+    """Iterate over all firewall policies of a user, fetching pages lazily."""
+    return paginate(
+        lambda limit, offset: firewall_policies_list(user_id, limit=limit, offset=offset, q=q),
+        page_size,
+    )
@@ -1,4 +1,4 @@
-"""User ISOs (S3) API - list, delete, get download URL."""
+"""User ISOs (S3) API - list, delete, get download URL, multipart upload."""
 
 from .base import get_client
 
@@ -24,3 +24,36 @@ def user_iso_download_url(user_id: int, key: str) -> str | dict:
     if isinstance(data, str):
         return data
     return data.get("presignedUrl", data) if isinstance(data, dict) else data
+
+
+def user_iso_download_info(user_id: int, key: str) -> dict:
+    """GET /api/v1/users/{userId}/isos/{key} - Download infos (S3DownloadInfos):
+    presignedUrl and the headers to send with it. A bare URL response is returned as
+    {"presignedUrl": url}."""
+    client = get_client()
+    resp = client.get(f"/users/{user_id}/isos/{key}")
+    data = resp.json()
+    return {"presignedUrl": data} if isinstance(data, str) else data
+
+
+def user_iso_upload_start(user_id: int, key: str) -> str:
+    """POST /api/v1/users/{userId}/isos/{key}?multipart=true - Start a multipart
+    upload. Returns the uploadId."""
+    client = get_client()
+    resp = client.post(f"/users/{user_id}/isos/{key}", params={"multipart": "true"})
+    return resp.json()["uploadId"]
+
+
+def user_iso_upload_part_url(user_id: int, key: str, upload_id: str, part_number: int) -> str:
+    """GET /api/v1/users/{userId}/isos/{key}/{uploadId}/parts/{partNumber} - Get the
+    presigned URL to PUT one part (1-based) to."""
+    client = get_client()
+    resp = client.get(f"/users/{user_id}/isos/{key}/{upload_id}/parts/{part_number}")
+    return resp.json()["url"]
+
+
+def user_iso_upload_complete(user_id: int, key: str, upload_id: str, parts: list[dict]) -> None:
+    """PUT /api/v1/users/{userId}/isos/{key}/{uploadId} - Complete a multipart upload.
+    parts: [{"ETag", "partNumber"}] for every uploaded part."""
+    client = get_client()
+    client.put(f"/users/{user_id}/isos/{key}/{upload_id}", json=parts)
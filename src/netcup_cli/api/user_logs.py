@@ -1,8 +1,11 @@
 """User logs API."""
 
+from collections.abc import Iterator
 from typing import Any
 
+from ..config import PAGE_SIZE
 from .base import get_client
+from .pagination import paginate
 
 
 def user_logs_list(
@@ -19,3 +22,11 @@ def user_logs_list(
         params["offset"] = offset
     resp = client.get(f"/users/{user_id}/logs", params=params or None)
     return resp.json()
+
+
+def iter_user_logs(user_id: int, page_size: int = PAGE_SIZE) -> Iterator[dict]:
+    """Iterate over all log entries of a user, fetching pages lazily."""
+    return paginate(
+        lambda limit, offset: user_logs_list(user_id, limit=limit, offset=offset),
+        page_size,
+    )
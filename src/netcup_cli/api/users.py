@@ -1,20 +1,19 @@
 """User and userinfo API."""
 
-import requests
-
-from ..auth import get_access_token
+from ..auth import decode_token_claims, get_access_token, load_credentials, save_credentials
 from ..config import BASE_URL
+from ..session import get_session
+from ..stats import measure
 from .base import get_client
 
 
 def user_info() -> dict:
     """OpenID Connect userinfo - get current user id and profile."""
     token = get_access_token()
-    resp = requests.get(
-        f"{BASE_URL}/realms/scp/protocol/openid-connect/userinfo",
-        headers={"Authorization": f"Bearer {token}"},
-        timeout=30,
-    )
+    url = f"{BASE_URL}/realms/scp/protocol/openid-connect/userinfo"
+    with measure("GET", url) as measurement:
+        resp = get_session().get(url, headers={"Authorization": f"Bearer {token}"}, timeout=30)
+        measurement.response = resp
     resp.raise_for_status()
     return resp.json()
 
@@ -34,5 +33,17 @@ def user_update(user_id: int, body: dict) -> dict:
 
 
 def get_current_user_id() -> int:
-    """Return current user ID from userinfo (for commands that need userId)."""
-    return int(user_info()["id"])
+    """Return current user ID (for commands that need userId).
+
+    Taken from the access token's `id` claim when present, else from the ID cached
+    in the credentials file; only as a last resort from userinfo (then cached).
+    """
+    claim = decode_token_claims(get_access_token()).get("id")
+    if isinstance(claim, int) or (isinstance(claim, str) and claim.isdigit()):
+        return int(claim)
+    creds = load_credentials()
+    if isinstance(creds.get("user_id"), int):
+        return creds["user_id"]
+    user_id = int(user_info()["id"])
+    save_credentials(creds["refresh_token"], user_id=user_id)
+    return user_id
@@ -1,22 +1,46 @@
 """Authentication: device code flow, refresh token, credential storage."""
 
+import base64
+import hashlib
 import json
+import threading
 import time
 from pathlib import Path
 
 import requests
 
-from .config import AUTH_URL, CLIENT_ID, SCOPE, credentials_path, ensure_config_dir
+from .config import (
+    AUTH_URL,
+    CLIENT_ID,
+    SCOPE,
+    TOKEN_REFRESH_MARGIN,
+    credentials_path,
+    ensure_config_dir,
+    token_cache_on_disk,
+    token_cache_path,
+)
 from .exceptions import AuthError, ConfigError
+from .session import get_session
+from .stats import measure
+
+# In-memory access tokens, keyed by a hash of the refresh token they came from
+_token_cache: dict[str, dict] = {}
+_token_lock = threading.Lock()
+
+
+def _post(url: str, data: dict) -> requests.Response:
+    """POST a form to the auth server over the shared session."""
+    with measure("POST", url) as measurement:
+        measurement.response = get_session().post(url, data=data, timeout=30)
+    return measurement.response
 
 
 def request_device_code() -> dict:
     """Request device code for OAuth2 device flow. Returns dict with
     device_code, user_code, verification_uri_complete, etc."""
-    resp = requests.post(
+    resp = _post(
         f"{AUTH_URL}/auth/device",
         data={"client_id": CLIENT_ID, "scope": SCOPE},
-        timeout=30,
     )
     resp.raise_for_status()
     return resp.json()
@@ -24,14 +48,13 @@ def request_device_code() -> dict:
 
 def exchange_device_code(device_code: str) -> dict:
     """Exchange device code for access and refresh tokens."""
-    resp = requests.post(
+    resp = _post(
         f"{AUTH_URL}/token",
         data={
             "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
             "device_code": device_code,
             "client_id": CLIENT_ID,
         },
-        timeout=30,
     )
     resp.raise_for_status()
     return resp.json()
@@ -39,14 +62,13 @@ def exchange_device_code(device_code: str) -> dict:
 
 def refresh_access_token(refresh_token: str) -> dict:
     """Get new access token using refresh token."""
-    resp = requests.post(
+    resp = _post(
         f"{AUTH_URL}/token",
         data={
             "client_id": CLIENT_ID,
             "refresh_token": refresh_token,
             "grant_type": "refresh_token",
         },
-        timeout=30,
     )
     if resp.status_code != 200:
         raise AuthError(f"Token refresh failed: {resp.status_code} - {resp.text}")
@@ -55,14 +77,13 @@ def refresh_access_token(refresh_token: str) -> dict:
 
 def revoke_refresh_token(refresh_token: str) -> None:
     """Revoke a refresh token."""
-    resp = requests.post(
+    resp = _post(
         f"{AUTH_URL}/revoke",
         data={
             "client_id": CLIENT_ID,
             "token": refresh_token,
             "token_type_hint": "refresh_token",
         },
-        timeout=30,
     )
     resp.raise_for_status()
 
@@ -81,27 +102,125 @@ def load_credentials(path: Path | None = None) -> dict:
     return data
 
 
-def save_credentials(refresh_token: str, path: Path | None = None) -> None:
-    """Persist refresh token to config directory."""
+def save_credentials(
+    refresh_token: str, path: Path | None = None, user_id: int | None = None
+) -> None:
+    """Persist refresh token (and optionally the account's user ID) to config directory."""
     p = path or credentials_path()
     ensure_config_dir()
-    p.write_text(json.dumps({"refresh_token": refresh_token}, indent=2))
+    data: dict = {"refresh_token": refresh_token}
+    if user_id is not None:
+        data["user_id"] = user_id
+    p.write_text(json.dumps(data, indent=2))
     try:
         p.chmod(0o600)
     except OSError:
         pass
 
 
-def get_access_token(refresh_token: str | None = None) -> str:
+def decode_token_claims(access_token: str) -> dict:
+    """Return the (unverified) JWT payload of an access token, or {} if not a JWT."""
+    try:
+        payload = access_token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, ValueError):
+        return {}
+
+
+def _token_key(refresh_token: str) -> str:
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+def _token_expires_at(result: dict) -> float:
+    """Absolute expiry (epoch seconds) of a token response, from `exp` or `expires_in`."""
+    exp = decode_token_claims(result["access_token"]).get("exp")
+    if isinstance(exp, (int, float)):
+        return float(exp)
+    return time.time() + float(result.get("expires_in", 60))
+
+
+def _token_valid(entry: dict | None) -> bool:
+    return bool(entry) and entry.get("expires_at", 0) - TOKEN_REFRESH_MARGIN > time.time()
+
+
+def _read_token_file() -> dict:
+    try:
+        data = json.loads(token_cache_path().read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_token_file(data: dict) -> None:
+    p = token_cache_path()
+    try:
+        ensure_config_dir()
+        tmp = p.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data))
+        tmp.chmod(0o600)
+        tmp.replace(p)
+    except OSError:
+        pass
+
+
+def _store_token(key: str, entry: dict) -> None:
+    _token_cache[key] = entry
+    if token_cache_on_disk():
+        data = {k: v for k, v in _read_token_file().items() if _token_valid(v)}
+        data[key] = entry
+        _write_token_file(data)
+
+
+def clear_token_cache() -> None:
+    """Drop all cached access tokens (memory and disk)."""
+    with _token_lock:
+        _token_cache.clear()
+        try:
+            token_cache_path().unlink()
+        except OSError:
+            pass
+
+
+def invalidate_access_token(refresh_token: str | None = None) -> None:
+    """Forget the cached access token for refresh_token (default: stored credentials)."""
+    token = refresh_token or load_credentials()["refresh_token"]
+    key = _token_key(token)
+    with _token_lock:
+        _token_cache.pop(key, None)
+        if token_cache_on_disk():
+            data = _read_token_file()
+            if data.pop(key, None) is not None:
+                _write_token_file(data)
+
+
+def get_access_token(refresh_token: str | None = None, *, force_refresh: bool = False) -> str:
     """
     Return a valid access token. Uses refresh_token from argument or from stored credentials.
+
+    Tokens are cached in memory (and, unless NETCUP_TOKEN_CACHE=0, in the config dir) and
+    reused until TOKEN_REFRESH_MARGIN seconds before they expire.
     """
     token = refresh_token
     if not token:
         creds = load_credentials()
         token = creds["refresh_token"]
-    result = refresh_access_token(token)
-    return result["access_token"]
+    key = _token_key(token)
+    with _token_lock:
+        if not force_refresh:
+            entry = _token_cache.get(key)
+            if not _token_valid(entry) and token_cache_on_disk():
+                entry = _read_token_file().get(key)
+                if _token_valid(entry):
+                    _token_cache[key] = entry
+            if _token_valid(entry):
+                return entry["access_token"]
+        result = refresh_access_token(token)
+        _store_token(
+            key,
+            {"access_token": result["access_token"], "expires_at": _token_expires_at(result)},
+        )
+        return result["access_token"]
 
 
 def wait_for_device_authorization(
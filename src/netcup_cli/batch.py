@@ -0,0 +1,154 @@
+"""Batch execution: run many API operations from one file in a single process."""
+
+import importlib
+import inspect
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from . import api
+from .api.base import get_client
+from .api.users import get_current_user_id
+from .concurrency import AIMDController, fan_out
+from .exceptions import SCPError
+
+# api modules that are plumbing rather than operations
+_EXCLUDED_MODULES = frozenset({"base", "pagination"})
+
+
+def resolve_operation(name: str) -> Callable[..., Any]:
+    """Return the API function for an operation name.
+
+    Names are "module.function" (e.g. "servers.server_patch", "rdns.rdns_set_ipv4")
+    for any public function defined in a netcup_cli.api module, or a bare function
+    name exported by netcup_cli.api (e.g. "server_patch").
+    """
+    module_name, _, func_name = name.rpartition(".")
+    if not module_name:
+        if func_name not in api.__all__:
+            raise ValueError(f"Unknown operation: {name}")
+        return getattr(api, func_name)
+    if (
+        not module_name.isidentifier()
+        or module_name.startswith("_")
+        or module_name in _EXCLUDED_MODULES
+        or func_name.startswith("_")
+    ):
+        raise ValueError(f"Unknown operation: {name}")
+    try:
+        module = importlib.import_module(f"{api.__name__}.{module_name}")
+    except ImportError:
+        raise ValueError(f"Unknown operation: {name}") from None
+    fn = getattr(module, func_name, None)
+    if not inspect.isfunction(fn) or fn.__module__ != module.__name__:
+        raise ValueError(f"Unknown operation: {name}")
+    return fn
+
+
+def read_operations(lines: Iterable[str]) -> Iterator[dict]:
+    """Parse JSONL operation records ({"op", "args", "id"}); blank lines and lines
+    starting with # are skipped. Records without "id" get their line number.
+    Unparseable lines are yielded with an "error" key."""
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield {"id": lineno, "error": f"Invalid JSON: {e}"}
+            continue
+        if not isinstance(record, dict):
+            yield {"id": lineno, "error": "Operation must be a JSON object"}
+            continue
+        record.setdefault("id", lineno)
+        yield record
+
+
+class _Runner:
+    def __init__(self):
+        self._user_id: int | None = None
+        self._lock = threading.Lock()
+
+    def user_id(self) -> int:
+        with self._lock:
+            if self._user_id is None:
+                self._user_id = get_current_user_id()
+            return self._user_id
+
+    def __call__(self, record: dict) -> Any:
+        if "error" in record:
+            raise ValueError(record["error"])
+        fn = resolve_operation(str(record.get("op", "")))
+        args = record.get("args") or {}
+        if not isinstance(args, dict):
+            raise ValueError('"args" must be a JSON object')
+        signature = inspect.signature(fn)
+        if "user_id" in signature.parameters and "user_id" not in args:
+            args = {**args, "user_id": self.user_id()}
+        # Report bad arguments before making any request
+        signature.bind(**args)
+        result = fn(**args)
+        if isinstance(result, Iterator):
+            result = list(result)
+        return result
+
+
+def _observed(controller: AIMDController, results: Iterator) -> Iterator:
+    with controller.observing(get_client()):
+        yield from results
+
+
+def run_batch(
+    records: Iterable[dict],
+    *,
+    controller: AIMDController | None = None,
+    max_workers: int | None = None,
+    stop_on_error: bool = False,
+) -> Iterator[dict]:
+    """Run operation records concurrently; yield one result per operation as it
+    completes: {"id", "op", "ok", "result"|"error", "elapsed"} (plus "status" for
+    API errors).
+
+    Parallelism is adapted by an AIMD controller unless max_workers fixes it.
+    `user_id` is filled in with the current user when the function takes it and
+    the record does not set it. With stop_on_error no new operations start after a
+    failure; operations already running still report.
+    """
+    runner = _Runner()
+    failed = threading.Event()
+    started: dict[int, float] = {}
+
+    def pending() -> Iterator[dict]:
+        for record in records:
+            if stop_on_error and failed.is_set():
+                return
+            yield record
+
+    def run(record: dict) -> Any:
+        started[id(record)] = time.monotonic()
+        return runner(record)
+
+    if max_workers is not None:
+        results = fan_out(run, pending(), max_workers=max_workers)
+    else:
+        controller = controller or AIMDController()
+        results = _observed(controller, fan_out(run, pending(), controller=controller))
+    for record, result, error in results:
+        elapsed = time.monotonic() - started.pop(id(record), time.monotonic())
+        out = {"id": record.get("id"), "op": record.get("op"), "ok": error is None}
+        if error is None:
+            out["result"] = result
+        else:
+            failed.set()
+            if isinstance(error, SCPError):
+                out["error"] = str(error)
+            else:
+                out["error"] = f"{type(error).__name__}: {error}"
+            status = getattr(error, "status_code", None)
+            if status is not None:
+                out["status"] = status
+        out["elapsed"] = round(elapsed, 3)
+        yield out
@@ -3,6 +3,7 @@
 import click
 
 from ..auth import (
+    clear_token_cache,
     load_credentials,
     request_device_code,
     save_credentials,
@@ -49,10 +50,11 @@ def login(no_save: bool) -> None:
     )
 
 
-@auth_group.command("logout", help="Remove stored refresh token.")
+@auth_group.command("logout", help="Remove stored refresh token and cached access tokens.")
 def logout() -> None:
     from ..config import credentials_path
 
+    clear_token_cache()
     p = credentials_path()
     if not p.exists():
         click.echo("No stored credentials.")
@@ -71,6 +73,7 @@ def revoke() -> None:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
     revoke_refresh_token(creds["refresh_token"])
+    clear_token_cache()
     from ..config import credentials_path
 
     p = credentials_path()
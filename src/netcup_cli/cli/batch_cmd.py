@@ -0,0 +1,57 @@
+"""Batch CLI: run a file of API operations in one process."""
+
+import time
+
+import click
+
+from ..batch import read_operations, run_batch
+from ..concurrency import AIMDController
+from ..config import FANOUT_MAX_CONCURRENCY
+from ..exceptions import APIError, ConfigError
+from ..output import print_json_stream
+
+
+@click.group("batch", help="Run many API operations from a file.")
+def batch_group():
+    pass
+
+
+@batch_group.command(
+    "run",
+    help="Run operations from a JSONL file (- for stdin), one per line: "
+    '{"op": "servers.server_patch", "args": {"server_id": 1, "body": {"nickname": "x"}}, '
+    '"id": "optional"}. Results stream as they complete; exit code 1 if any failed.',
+)
+@click.argument("file", type=click.File("r"))
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1, max=FANOUT_MAX_CONCURRENCY),
+    help="Fixed number of parallel operations (default: adapt to API health).",
+)
+@click.option("--stop-on-error", is_flag=True, help="Start no new operations after a failure.")
+def run(file, workers: int | None, stop_on_error: bool) -> None:
+    controller = AIMDController() if workers is None else None
+    counts = {"ok": 0, "failed": 0}
+    started = time.monotonic()
+
+    def results():
+        for result in run_batch(
+            read_operations(file),
+            controller=controller,
+            max_workers=workers,
+            stop_on_error=stop_on_error,
+        ):
+            counts["ok" if result["ok"] else "failed"] += 1
+            yield result
+
+    try:
+        print_json_stream(results())
+    except (APIError, ConfigError) as e:
+        click.echo(click.style(str(e), fg="red"), err=True)
+        raise SystemExit(1) from e
+    summary = f"{counts['ok']} ok, {counts['failed']} failed, {time.monotonic() - started:.1f}s"
+    if controller is not None:
+        summary += f", concurrency settled at {controller.limit}"
+    click.echo(summary, err=True)
+    if counts["failed"]:
+        raise SystemExit(1)
@@ -0,0 +1,76 @@
+"""Daemon CLI: keep a warm process that runs forwarded commands."""
+
+import os
+import subprocess
+import sys
+import time
+
+import click
+
+from ..config import daemon_log_path, daemon_socket_path, ensure_config_dir
+from ..daemon import control, serve
+from ..output import print_json
+
+
+@click.group("daemon", help="Background daemon that keeps connections and tokens warm.")
+def daemon_group():
+    pass
+
+
+@daemon_group.command(
+    "start",
+    help="Start the daemon. While it runs, netcup commands are forwarded to it "
+    "(set NETCUP_NO_DAEMON=1 to bypass).",
+)
+@click.option("--foreground", is_flag=True, help="Run in the foreground (e.g. under systemd).")
+@click.option("--idle-timeout", type=float, help="Exit after this many idle seconds.")
+def start(foreground: bool, idle_timeout: float | None) -> None:
+    status = control("ping")
+    if status is not None:
+        click.echo(f"Daemon already running (pid {status['pid']}).")
+        return
+    if foreground:
+        try:
+            serve(idle_timeout=idle_timeout)
+        except KeyboardInterrupt:
+            pass
+        return
+    ensure_config_dir()
+    args = [sys.executable, "-m", "netcup_cli", "daemon", "start", "--foreground"]
+    if idle_timeout is not None:
+        args += ["--idle-timeout", str(idle_timeout)]
+    with open(daemon_log_path(), "ab") as log:
+        subprocess.Popen(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+            env={**os.environ, "NETCUP_NO_DAEMON": "1"},
+        )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        status = control("ping")
+        if status is not None:
+            click.echo(f"Daemon started (pid {status['pid']}).")
+            return
+        time.sleep(0.05)
+    click.echo(click.style(f"Daemon did not start; see {daemon_log_path()}", fg="red"), err=True)
+    raise SystemExit(1)
+
+
+@daemon_group.command("stop", help="Stop the daemon.")
+def stop() -> None:
+    if control("stop") is None:
+        click.echo("Daemon not running.")
+        return
+    click.echo("Daemon stopped.")
+
+
+@daemon_group.command("status", help="Show daemon status (exit code 1 if not running).")
+def status() -> None:
+    info = control("ping")
+    if info is None:
+        print_json({"running": False, "socket": str(daemon_socket_path())})
+        raise SystemExit(1)
+    print_json({"running": True, **info})
@@ -0,0 +1,98 @@
+"""Failover CLI: switch all failover IPs between servers."""
+
+import click
+
+from ..config import FAILOVER_MAX_AGE
+from ..exceptions import APIError, ConfigError
+from ..output import print_json
+from .helpers import (
+    EXIT_TASK_TIMEOUT,
+    echo_task_progress,
+    resolve_user_id,
+    tasks_exit_code,
+    user_id_option,
+)
+
+
+@click.group("failover", help="Move failover IPs between servers.")
+def failover_group():
+    pass
+
+
+@failover_group.command(
+    "switch",
+    help="Route every failover IPv4 and IPv6 subnet of one server to another. The IPs "
+    "are read from the inventory (netcup inventory sync) when fresh, else from the API; "
+    "keep --max-age short, as IPs from the inventory are not re-read before they are "
+    "routed. All routes are changed in parallel and the tasks awaited together. Exit "
+    "code as for `tasks wait`, or 1 if a route request or polling the tasks failed.",
+)
+@user_id_option
+@click.option("--from", "from_server", type=int, required=True, help="Source server ID.")
+@click.option("--to", "to_server", type=int, required=True, help="Target server ID.")
+@click.option(
+    "--max-age",
+    type=click.IntRange(min=0),
+    default=FAILOVER_MAX_AGE,
+    show_default=True,
+    help="Max age of inventory data in seconds; older data is re-read from the API.",
+)
+@click.option("--no-inventory", is_flag=True, help="Always read the failover IPs from the API.")
+@click.option("--dry-run", is_flag=True, help="Print the IPs that would be switched.")
+@click.option("--no-wait", is_flag=True, help="Do not wait for the routing tasks.")
+@click.option("--timeout", type=float, help="Give up waiting after this many seconds.")
+def switch(
+    user_id: int | None,
+    from_server: int,
+    to_server: int,
+    max_age: int,
+    no_inventory: bool,
+    dry_run: bool,
+    no_wait: bool,
+    timeout: float | None,
+) -> None:
+    from ..failover import plan_switch, switch_failover
+
+    if from_server == to_server:
+        raise click.UsageError("--from and --to must be different servers.")
+    uid = resolve_user_id(user_id)
+    try:
+        if dry_run:
+            print_json(
+                plan_switch(uid, from_server, use_inventory=not no_inventory, max_age=max_age)
+            )
+            return
+        result = switch_failover(
+            uid,
+            from_server,
+            to_server,
+            use_inventory=not no_inventory,
+            max_age=max_age,
+            wait=not no_wait,
+            timeout=timeout,
+            on_update=echo_task_progress,
+        )
+    except (APIError, ConfigError) as e:
+        click.echo(click.style(str(e), fg="red"), err=True)
+        raise SystemExit(1) from e
+    print_json(result)
+    routes = result["routes"]
+    if not routes:
+        click.echo(f"No failover IPs routed to server {from_server}.", err=True)
+    switched = sum(1 for r in routes if r["ok"])
+    click.echo(
+        f"{switched} of {len(routes)} failover IPs switched to server {to_server}"
+        f" in {result['timings']['total']:.2f}s ({result['source']})",
+        err=True,
+    )
+    if result.get("error"):
+        click.echo(click.style(f"Polling the tasks failed: {result['error']}", fg="red"), err=True)
+        raise SystemExit(1)
+    if any("task" not in r and not r["ok"] for r in routes):
+        raise SystemExit(1)
+    states = [r.get("state") for r in routes]
+    if "TIMEOUT" in states:
+        raise SystemExit(EXIT_TASK_TIMEOUT)
+    code = tasks_exit_code(states)
+    if code:
+        raise SystemExit(code)
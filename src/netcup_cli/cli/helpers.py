@@ -1,8 +1,17 @@
 """Shared CLI helpers."""
 
+import functools
+import sys
+from collections.abc import Iterable
+
 import click
 
-from ..api.users import get_current_user_id
+from ..config import INVENTORY_MAX_AGE, TRANSFER_WORKERS
+from ..exceptions import APIError, ConfigError, TaskTimeoutError
+
+# Every command module imports this one: import the inventory (sqlite3), the task
+# and user APIs and output inside the helpers that use them, so a command (or its
+# --help) loads only what it needs
 
 
 def user_id_option(f):
@@ -19,4 +28,164 @@ def resolve_user_id(user_id: int | None) -> int:
     """Return user_id or current user ID from token."""
     if user_id is not None:
         return user_id
+    from ..api.users import get_current_user_id
+
     return get_current_user_id()
+
+
+def all_pages_option(f):
+    """Click option that adds --all (fetch every page lazily and stream the records)."""
+    return click.option(
+        "--all",
+        "fetch_all",
+        is_flag=True,
+        help="Fetch all pages and stream the records (cannot be combined with --limit/--offset).",
+    )(f)
+
+
+def check_all_pages(fetch_all: bool, limit: int | None, offset: int | None) -> None:
+    """Reject --all together with manual --limit/--offset paging."""
+    if fetch_all and (limit is not None or offset is not None):
+        raise click.UsageError("--all cannot be combined with --limit/--offset.")
+
+
+def cached_options(f):
+    """Click options --cached / --max-age for reads served from the local inventory."""
+    f = click.option(
+        "--max-age",
+        type=click.IntRange(min=0),
+        default=INVENTORY_MAX_AGE,
+        show_default=True,
+        help="With --cached: max age of inventory data in seconds.",
+    )(f)
+    return click.option(
+        "--cached",
+        is_flag=True,
+        help="Read from the local inventory (netcup inventory sync); "
+        "falls back to the API if missing or stale.",
+    )(f)
+
+
+def load_cached(
+    kind: str, scope: object, cached: bool, max_age: int, *filters: object
+) -> list[dict] | None:
+    """Return inventory records for --cached reads, or None to query the API."""
+    if not cached:
+        return None
+    if any(x is not None for x in filters):
+        raise click.UsageError("--cached cannot be combined with filters or paging.")
+    from ..inventory import Inventory
+
+    with Inventory() as inventory:
+        data = inventory.load(kind, scope, max_age=max_age)
+    if data is None:
+        click.echo(f"No {kind} inventory younger than {max_age}s; querying API.", err=True)
+    return data
+
+
+# Exit codes of commands that wait for tasks
+EXIT_TASK_ERROR = 3
+EXIT_TASK_CANCELED = 4
+EXIT_TASK_TIMEOUT = 124
+
+
+def task_exit_code(state: str | None) -> int:
+    """Exit code for a task's final TaskState."""
+    if state == "ERROR":
+        return EXIT_TASK_ERROR
+    if state == "CANCELED":
+        return EXIT_TASK_CANCELED
+    return 0
+
+
+def tasks_exit_code(states: Iterable[str | None]) -> int:
+    """Exit code for the final TaskStates of several tasks. ERROR takes precedence
+    over CANCELED, although its code is lower."""
+    codes = {task_exit_code(state) for state in states}
+    for code in (EXIT_TASK_ERROR, EXIT_TASK_CANCELED):
+        if code in codes:
+            return code
+    return 0
+
+
+def echo_task_progress(task: dict) -> None:
+    """Show a task's state/progress on stderr (one updating line on a terminal)."""
+    progress = (task.get("taskProgress") or {}).get("progressInPercent")
+    text = f"{task.get('uuid', '')} {task.get('state', '?')}"
+    if progress is not None:
+        text += f" {progress:.0f}%"
+    if sys.stderr.isatty():
+        click.echo(f"\r\033[K{text}", nl=False, err=True)
+        if task.get("state") in ("FINISHED", "ERROR", "CANCELED"):
+            click.echo("", err=True)
+    else:
+        click.echo(text, err=True)
+
+
+def transfer_options(f):
+    """Click option --workers for parallel object transfers."""
+    return click.option(
+        "--workers",
+        type=click.IntRange(min=1, max=64),
+        default=TRANSFER_WORKERS,
+        show_default=True,
+        help="Parts transferred in parallel.",
+    )(f)
+
+
+def transfer_progress(label: str):
+    """Return an on_progress(done, total) callback showing transferred bytes on
+    stderr; silent unless stderr is a terminal."""
+    if not sys.stderr.isatty():
+        return None
+
+    def show(done: int, total: int) -> None:
+        percent = done * 100 / total if total else 100.0
+        text = f"{label}: {percent:.0f}% ({done / 2**20:.1f} of {total / 2**20:.1f} MiB)"
+        click.echo(f"\r\033[K{text}", nl=False, err=True)
+        if done >= total:
+            click.echo("", err=True)
+
+    return show
+
+
+def task_command(f):
+    """Add --wait/--timeout to a command that returns a TaskInfo (or None).
+
+    The wrapped command returns the API result instead of printing it; it is
+    printed here ("OK" when None). With --wait the task is polled until it
+    finishes, progress goes to stderr, and the final task is printed with an exit
+    code like `tasks wait`.
+    """
+
+    @click.option("--wait", is_flag=True, help="Wait until the task finishes.")
+    @click.option("--timeout", type=float, help="With --wait: give up after this many seconds.")
+    @functools.wraps(f)
+    def wrapper(*args, wait: bool, timeout: float | None, **kwargs):
+        from ..api.task_wait import wait_for_task
+        from ..output import print_json
+
+        result = f(*args, **kwargs)
+        if not wait or not isinstance(result, dict) or not result.get("uuid"):
+            if wait:
+                click.echo("No task returned; nothing to wait for.", err=True)
+            if result is not None:
+                print_json(result)
+            else:
+                click.echo("OK")
+            return
+        try:
+            task = wait_for_task(result, timeout=timeout, on_update=echo_task_progress)
+        except TaskTimeoutError as e:
+            click.echo(click.style(str(e), fg="red"), err=True)
+            print_json(e.task)
+            raise SystemExit(EXIT_TASK_TIMEOUT) from e
+        except (APIError, ConfigError) as e:
+            click.echo(click.style(str(e), fg="red"), err=True)
+            raise SystemExit(1) from e
+        print_json(task)
+        code = task_exit_code(task.get("state"))
+        if code:
+            raise SystemExit(code)
+
+    return wrapper
@@ -0,0 +1,57 @@
+"""Local inventory cache CLI."""
+
+import click
+
+from ..exceptions import APIError, ConfigError
+from ..inventory import KINDS, Inventory, sync_inventory
+from ..output import print_json
+from .helpers import resolve_user_id, user_id_option
+
+
+@click.group("inventory", help="Local SQLite cache of servers, interfaces, VLANs, IPs, SSH keys.")
+def inventory_group():
+    pass
+
+
+@inventory_group.command("sync", help="Fetch inventory data concurrently into the local cache.")
+@user_id_option
+@click.option(
+    "--kind",
+    "kinds",
+    type=click.Choice(list(KINDS)),
+    multiple=True,
+    help="Only sync this kind (repeatable; default: all).",
+)
+def sync_cmd(user_id: int | None, kinds: tuple[str, ...]) -> None:
+    uid = resolve_user_id(user_id)
+    failed = False
+
+    def report(kind: str, scope: object, result: object) -> None:
+        nonlocal failed
+        if isinstance(result, Exception):
+            failed = True
+            where = f" {scope}" if scope != "" else ""
+            click.echo(click.style(f"{kind}{where}: {result}", fg="red"), err=True)
+
+    with Inventory() as inventory:
+        try:
+            totals = sync_inventory(uid, inventory, kinds or tuple(KINDS), on_result=report)
+        except (APIError, ConfigError) as e:
+            click.echo(click.style(str(e), fg="red"), err=True)
+            raise SystemExit(1) from e
+    print_json(totals)
+    if failed:
+        raise SystemExit(1)
+
+
+@inventory_group.command("status", help="Show cached kinds, record counts and age.")
+def status_cmd() -> None:
+    with Inventory() as inventory:
+        print_json(inventory.status())
+
+
+@inventory_group.command("clear", help="Delete all cached inventory data.")
+def clear_cmd() -> None:
+    with Inventory() as inventory:
+        inventory.clear()
+    click.echo("OK")
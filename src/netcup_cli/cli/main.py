@@ -1,37 +1,155 @@
 """Main CLI entrypoint."""
 
+import importlib
+
 import click
 
 from .. import __version__
-from .auth_cmd import auth_group
-from .maintenance_cmd import maintenance_group
-from .rdns_cmd import rdns_group
-from .servers_cmd import servers_group
-from .tasks_cmd import tasks_group
-from .users_cmd import users_group
-from .vlans_cmd import vlans_standalone_group
+from ..output import OUTPUT_FORMATS, set_output_format
+
+# Command groups as "module:attribute" (relative to this package), imported on use
+_COMMAND_GROUPS = {
+    "auth": ".auth_cmd:auth_group",
+    "servers": ".servers_cmd:servers_group",
+    "rdns": ".rdns_cmd:rdns_group",
+    "tasks": ".tasks_cmd:tasks_group",
+    "users": ".users_cmd:users_group",
+    "vlans": ".vlans_cmd:vlans_standalone_group",
+    "maintenance": ".maintenance_cmd:maintenance_group",
+    "inventory": ".inventory_cmd:inventory_group",
+    "daemon": ".daemon_cmd:daemon_group",
+    "batch": ".batch_cmd:batch_group",
+    "failover": ".failover_cmd:failover_group",
+}
+
+
+class LazyGroup(click.Group):
+    """Group that imports a subcommand's module only when the subcommand is used
+    (or listed by --help), so startup does not load every command and API module."""
+
+    def __init__(self, *args, lazy_commands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name].split(":")
+            module = importlib.import_module(module_name, __package__)
+            self.add_command(getattr(module, attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
 
 
 @click.group(
+    cls=LazyGroup,
+    lazy_commands=_COMMAND_GROUPS,
     context_settings={"help_option_names": ["-h", "--help"]},
     help="netcup CLI – netcup Server Control Panel REST API client.",
 )
 @click.version_option(version=__version__, prog_name="netcup")
-def cli() -> None:
-    pass
+@click.option(
+    "-o",
+    "--output",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="json",
+    show_default=True,
+    envvar="NETCUP_OUTPUT",
+    help="json: pretty-printed; ndjson: one compact record per line, streamed.",
+)
+@click.option(
+    "--retries",
+    type=click.IntRange(min=0),
+    default=2,
+    show_default=True,
+    envvar="NETCUP_RETRIES",
+    help="Retries for transient API failures (timeouts, 429, 502-504).",
+)
+@click.option(
+    "--rate-limit",
+    type=click.FloatRange(min=0, min_open=True),
+    envvar="NETCUP_RATE_LIMIT",
+    help="Max API requests per second (default: unlimited).",
+)
+@click.option(
+    "--burst",
+    type=click.IntRange(min=1),
+    envvar="NETCUP_RATE_BURST",
+    help="Requests allowed in a burst above --rate-limit (default: the rate).",
+)
+@click.option(
+    "--shared-rate-limit",
+    is_flag=True,
+    envvar="NETCUP_RATE_LIMIT_SHARED",
+    help="Share the --rate-limit budget with other netcup processes on this host.",
+)
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    envvar="NETCUP_CACHE",
+    help="Cache GET responses on disk (per-endpoint TTLs, ETag revalidation).",
+)
+@click.option(
+    "--stats",
+    "show_stats",
+    is_flag=True,
+    envvar="NETCUP_STATS",
+    help="Print per-endpoint request timings to stderr on exit.",
+)
+@click.pass_context
+def cli(
+    ctx: click.Context,
+    output_format: str,
+    retries: int,
+    rate_limit: float | None,
+    burst: int | None,
+    shared_rate_limit: bool,
+    use_cache: bool,
+    show_stats: bool,
+) -> None:
+    from ..client_setup import close_client_if_used, defer_client_options
+
+    set_output_format(output_format)
+    if show_stats:
+        from .. import stats
+
+        collector = stats.enable()
+
+        def report() -> None:
+            stats.disable()
+            click.echo(collector.report(), err=True)
 
+        # Registered first so it runs last, after the other close callbacks
+        ctx.call_on_close(report)
 
-def _register_groups() -> None:
-    cli.add_command(auth_group)
-    cli.add_command(servers_group)
-    cli.add_command(rdns_group)
-    cli.add_command(tasks_group)
-    cli.add_command(users_group)
-    cli.add_command(vlans_standalone_group, "vlans")
-    cli.add_command(maintenance_group)
+    def client_options() -> dict:
+        # Called when a command first uses the API, so other commands skip these imports
+        from ..client import RetryPolicy
+        from ..config import rate_limit_state_path
+        from ..http_cache import ResponseCache
+        from ..ratelimit import RateLimiter
 
+        limiter = None
+        if rate_limit:
+            state_path = rate_limit_state_path() if shared_rate_limit else None
+            limiter = RateLimiter(rate_limit, burst, state_path=state_path)
+        cache = None
+        if use_cache:
+            cache = ResponseCache()
+            ctx.call_on_close(cache.close)
+        return {
+            "retry_policy": RetryPolicy(attempts=retries + 1),
+            "rate_limiter": limiter,
+            "cache": cache,
+        }
 
-_register_groups()
+    defer_client_options(client_options)
+    if not (ctx.obj or {}).get("daemon"):
+        # The daemon keeps its pooled connections open between commands
+        ctx.call_on_close(close_client_if_used)
 
 
 def main() -> None:
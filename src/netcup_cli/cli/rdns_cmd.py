@@ -10,8 +10,9 @@ from ..api.rdns import (
     rdns_set_ipv4,
     rdns_set_ipv6,
 )
+from ..config import FANOUT_MAX_CONCURRENCY
 from ..exceptions import APIError, ConfigError
-from ..output import print_json
+from ..output import print_json, print_json_stream
 
 
 @click.group("rdns", help="Get/set/delete rDNS for IPv4 or IPv6.")
@@ -95,3 +96,88 @@ def delete_ipv6(ip: str) -> None:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
     click.echo("OK")
+
+
+@rdns_group.command(
+    "apply",
+    help="Apply ip -> PTR mappings for IPv4 and IPv6 from FILE (- for stdin): CSV rows "
+    'of ip,ptr, JSON {"ip": "ptr"} or a zone file of PTR records. An empty PTR deletes '
+    "the record. Current values are fetched concurrently and only differing records "
+    "are written; the plan is printed to stderr first.",
+)
+@click.argument("file", type=click.File("r"))
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["auto", "csv", "json", "zone"]),
+    default="auto",
+    show_default=True,
+    help="Mapping format (auto: from the file name or content).",
+)
+@click.option("--dry-run", is_flag=True, help="Print the plan as JSON and change nothing.")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1, max=FANOUT_MAX_CONCURRENCY),
+    help="Fixed number of parallel requests (default: adapt to API health).",
+)
+def apply(file, fmt: str, dry_run: bool, workers: int | None) -> None:
+    import time
+
+    from ..concurrency import AIMDController
+    from ..rdns_apply import apply_rdns, guess_format, plan_rdns, read_mappings
+
+    text = file.read()
+    if fmt == "auto":
+        fmt = guess_format(file.name, text)
+    try:
+        mappings = read_mappings(text, fmt)
+    except ValueError as e:
+        click.echo(click.style(str(e), fg="red"), err=True)
+        raise SystemExit(1) from e
+    controller = AIMDController() if workers is None else None
+    started = time.monotonic()
+    try:
+        plan = plan_rdns(mappings, controller=controller, max_workers=workers)
+    except (APIError, ConfigError) as e:
+        click.echo(click.style(str(e), fg="red"), err=True)
+        raise SystemExit(1) from e
+    counts = {"set": 0, "delete": 0, "unchanged": 0, "error": 0}
+    for step in plan:
+        counts[step["action"]] += 1
+        if step["action"] == "error":
+            click.echo(click.style(f"error  {step['ip']}: {step['error']}", fg="red"), err=True)
+        elif step["action"] != "unchanged":
+            change = f"{step['current'] or '-'} -> {step['desired'] or '-'}"
+            click.echo(f"{step['action']:<6} {step['ip']}: {change}", err=True)
+    click.echo(
+        f"plan: {counts['set']} to set, {counts['delete']} to delete,"
+        f" {counts['unchanged']} unchanged, {counts['error']} failed to read",
+        err=True,
+    )
+    if dry_run:
+        print_json(plan)
+        raise SystemExit(1 if counts["error"] else 0)
+    failed = counts["error"]
+    written = 0
+
+    def results():
+        nonlocal failed, written
+        for result in apply_rdns(plan, controller=controller, max_workers=workers):
+            if result["ok"]:
+                written += 1
+            else:
+                failed += 1
+            yield result
+
+    try:
+        print_json_stream(results())
+    except (APIError, ConfigError) as e:
+        click.echo(click.style(str(e), fg="red"), err=True)
+        raise SystemExit(1) from e
+    click.echo(
+        f"{written} written, {failed} failed, {counts['unchanged']} unchanged,"
+        f" {time.monotonic() - started:.1f}s",
+        err=True,
+    )
+    if failed:
+        raise SystemExit(1)
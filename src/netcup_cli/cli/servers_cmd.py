@@ -1,10 +1,21 @@
 """Servers CLI commands."""
 
+import time
+
 import click
 
-from ..api.servers import server_get, server_list, server_patch
+from ..api.servers import iter_servers, server_get, server_get_many, server_list, server_patch
+from ..concurrency import AIMDController
+from ..config import FANOUT_MAX_CONCURRENCY
 from ..exceptions import APIError, ConfigError
-from ..output import print_json
+from ..output import print_json, print_json_stream
+from .helpers import (
+    all_pages_option,
+    cached_options,
+    check_all_pages,
+    load_cached,
+    task_command,
+)
 from .servers_disks_cmd import disks_group
 from .servers_interfaces_cmd import firewall_group, interfaces_group
 from .servers_iso_cmd import iso_group
@@ -31,10 +42,27 @@ def servers_group():
 @click.option("--ip", help="Filter by IP.")
 @click.option("--name", help="Filter by server name.")
 @click.option("-q", "query", help="Search in name, nickname, ipv4Addresses.")
+@all_pages_option
+@cached_options
 def list_servers(
-    limit: int | None, offset: int | None, ip: str | None, name: str | None, query: str | None
+    limit: int | None,
+    offset: int | None,
+    ip: str | None,
+    name: str | None,
+    query: str | None,
+    fetch_all: bool,
+    cached: bool,
+    max_age: int,
 ) -> None:
+    check_all_pages(fetch_all, limit, offset)
+    data = load_cached("servers", "", cached, max_age, limit, offset, ip, name, query)
+    if data is not None:
+        print_json(data)
+        return
     try:
+        if fetch_all:
+            print_json_stream(iter_servers(ip=ip, name=name, q=query))
+            return
         data = server_list(limit=limit, offset=offset, ip=ip, name=name, q=query)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
@@ -42,16 +70,60 @@ def list_servers(
     print_json(data)
 
 
-@servers_group.command("get", help="Get one server by ID.")
-@click.argument("server_id", type=int)
+@servers_group.command(
+    "get", help="Get servers by ID; several IDs or --all are fetched in parallel and streamed."
+)
+@click.argument("server_ids", type=int, nargs=-1, metavar="[SERVER_ID]...")
 @click.option("--no-live", is_flag=True, help="Do not load server live info.")
-def get_server(server_id: int, no_live: bool) -> None:
+@click.option("--all", "fetch_all", is_flag=True, help="Get every server in the account.")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1, max=FANOUT_MAX_CONCURRENCY),
+    help="Fixed number of parallel requests (default: adaptive).",
+)
+def get_server(
+    server_ids: tuple[int, ...], no_live: bool, fetch_all: bool, workers: int | None
+) -> None:
+    if fetch_all == bool(server_ids):
+        raise click.UsageError("Give one or more SERVER_IDs or --all.")
+    if len(server_ids) == 1:
+        try:
+            data = server_get(server_ids[0], load_server_live_info=not no_live)
+        except (APIError, ConfigError) as e:
+            click.echo(click.style(str(e), fg="red"), err=True)
+            raise SystemExit(1) from e
+        print_json(data)
+        return
+
+    ids = (s["id"] for s in iter_servers()) if fetch_all else server_ids
+    controller = AIMDController()
+    failed = 0
+    started = time.monotonic()
+
+    def results():
+        nonlocal failed
+        for server_id, data, error in server_get_many(
+            ids, load_server_live_info=not no_live, controller=controller, max_workers=workers
+        ):
+            if error is None:
+                yield data
+                continue
+            if not isinstance(error, (APIError, ConfigError)):
+                raise error
+            failed += 1
+            click.echo(click.style(f"Server {server_id}: {error}", fg="red"), err=True)
+
     try:
-        data = server_get(server_id, load_server_live_info=not no_live)
+        print_json_stream(results())
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    print_json(data)
+    summary = f"{failed} failed, {time.monotonic() - started:.1f}s"
+    if workers is None:
+        summary += f", concurrency settled at {controller.limit}"
+    click.echo(summary, err=True)
+    if failed:
+        raise SystemExit(1)
 
 
 @servers_group.command("power", help="Power on/off or powercycle server.")
@@ -63,41 +135,41 @@ def get_server(server_id: int, no_live: bool) -> None:
     type=click.Choice(["POWERCYCLE", "RESET", "POWEROFF"]),
     help="State option: for ON use POWERCYCLE/RESET, for OFF use POWEROFF.",
 )
-def power(server_id: int, state: str, state_option: str | None) -> None:
+@task_command
+def power(server_id: int, state: str, state_option: str | None) -> dict | None:
     body = {"state": state.upper()}
     try:
         result = server_patch(server_id, body, state_option=state_option)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result is not None:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @servers_group.command("set-hostname", help="Set server hostname.")
 @click.argument("server_id", type=int)
 @click.argument("hostname", type=str)
-def set_hostname(server_id: int, hostname: str) -> None:
+@task_command
+def set_hostname(server_id: int, hostname: str) -> dict | None:
     try:
-        server_patch(server_id, {"hostname": hostname})
+        result = server_patch(server_id, {"hostname": hostname})
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    click.echo("OK")
+    return result
 
 
 @servers_group.command("set-nickname", help="Set server nickname.")
 @click.argument("server_id", type=int)
 @click.argument("nickname", type=str)
-def set_nickname(server_id: int, nickname: str) -> None:
+@task_command
+def set_nickname(server_id: int, nickname: str) -> dict | None:
     try:
-        server_patch(server_id, {"nickname": nickname})
+        result = server_patch(server_id, {"nickname": nickname})
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    click.echo("OK")
+    return result
 
 
 # Register server sub-resource groups
@@ -11,6 +11,7 @@ from ..api.servers_disks import (
 )
 from ..exceptions import APIError, ConfigError
 from ..output import print_json
+from .helpers import task_command
 
 
 @click.group("disks", help="Server disks.")
@@ -55,28 +56,24 @@ def supported_drivers(server_id: int) -> None:
 @disks_group.command("set-driver", help="Patch disk driver (VIRTIO, VIRTIO_SCSI, IDE, SATA).")
 @click.argument("server_id", type=int)
 @click.argument("driver", type=click.Choice(["VIRTIO", "VIRTIO_SCSI", "IDE", "SATA"]))
-def set_driver(server_id: int, driver: str) -> None:
+@task_command
+def set_driver(server_id: int, driver: str) -> dict | None:
     try:
         result = disks_patch_driver(server_id, driver)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @disks_group.command("format", help="Format a disk (data loss!).")
 @click.argument("server_id", type=int)
 @click.argument("disk_name", type=str)
-def format_cmd(server_id: int, disk_name: str) -> None:
+@task_command
+def format_cmd(server_id: int, disk_name: str) -> dict | None:
     try:
         result = disk_format(server_id, disk_name)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
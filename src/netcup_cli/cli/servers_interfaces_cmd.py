@@ -15,6 +15,7 @@ from ..api.servers_interfaces import (
 )
 from ..exceptions import APIError, ConfigError
 from ..output import print_json
+from .helpers import cached_options, load_cached, task_command
 
 
 @click.group("interfaces", help="Server network interfaces.")
@@ -25,7 +26,15 @@ def interfaces_group():
 @interfaces_group.command("list", help="List interfaces of a server.")
 @click.argument("server_id", type=int)
 @click.option("--no-rdns", is_flag=True, help="Do not load rDNS.")
-def list_cmd(server_id: int, no_rdns: bool) -> None:
+@cached_options
+def list_cmd(server_id: int, no_rdns: bool, cached: bool, max_age: int) -> None:
+    if cached and no_rdns:
+        # The inventory holds interfaces as synced, with rDNS
+        raise click.UsageError("--cached cannot be combined with --no-rdns.")
+    data = load_cached("interfaces", server_id, cached, max_age)
+    if data is not None:
+        print_json(data)
+        return
     try:
         data = interfaces_list(server_id, load_rdns=not no_rdns)
     except (APIError, ConfigError) as e:
@@ -56,23 +65,22 @@ def get_cmd(server_id: int, mac: str, no_rdns: bool) -> None:
     required=True,
     help="Network driver.",
 )
-def create_cmd(server_id: int, vlan_id: int, driver: str) -> None:
+@task_command
+def create_cmd(server_id: int, vlan_id: int, driver: str) -> dict | None:
     try:
         result = interface_create(server_id, vlan_id, driver)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @interfaces_group.command("update", help="Update interface (--body JSON with driver etc.).")
 @click.argument("server_id", type=int)
 @click.argument("mac", type=str)
 @click.option("--body", type=str, required=True, help='JSON body e.g. {"driver":"VIRTIO"}.')
-def update_cmd(server_id: int, mac: str, body: str) -> None:
+@task_command
+def update_cmd(server_id: int, mac: str, body: str) -> dict | None:
     import json
 
     try:
@@ -85,25 +93,20 @@ def update_cmd(server_id: int, mac: str, body: str) -> None:
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @interfaces_group.command("delete", help="Delete interface.")
 @click.argument("server_id", type=int)
 @click.argument("mac", type=str)
-def delete_cmd(server_id: int, mac: str) -> None:
+@task_command
+def delete_cmd(server_id: int, mac: str) -> dict | None:
     try:
         result = interface_delete(server_id, mac)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @click.group("firewall", help="Interface firewall (server + MAC).")
@@ -130,7 +133,8 @@ def get_fw(server_id: int, mac: str, consistency_check: bool) -> None:
 @click.argument("server_id", type=int)
 @click.argument("mac", type=str)
 @click.option("--body", type=str, required=True, help="JSON body.")
-def put_fw(server_id: int, mac: str, body: str) -> None:
+@task_command
+def put_fw(server_id: int, mac: str, body: str) -> dict | None:
     import json
 
     try:
@@ -143,37 +147,30 @@ def put_fw(server_id: int, mac: str, body: str) -> None:
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @firewall_group.command("reapply", help="Reapply firewall.")
 @click.argument("server_id", type=int)
 @click.argument("mac", type=str)
-def reapply(server_id: int, mac: str) -> None:
+@task_command
+def reapply(server_id: int, mac: str) -> dict | None:
     try:
         result = firewall_reapply(server_id, mac)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @firewall_group.command("restore-copied-policies", help="Restore copied firewall policies.")
 @click.argument("server_id", type=int)
 @click.argument("mac", type=str)
-def restore(server_id: int, mac: str) -> None:
+@task_command
+def restore(server_id: int, mac: str) -> dict | None:
     try:
         result = firewall_restore_copied_policies(server_id, mac)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
@@ -5,6 +5,7 @@ import click
 from ..api.servers_iso import iso_attach, iso_detach, iso_get, isoimages_list
 from ..exceptions import APIError, ConfigError
 from ..output import print_json
+from .helpers import task_command
 
 
 @click.group("iso", help="Server ISO attach/detach.")
@@ -28,7 +29,10 @@ def get_cmd(server_id: int) -> None:
 @click.option("--iso-id", type=int, help="ISO image ID.")
 @click.option("--user-iso", "user_iso_name", help="User ISO name (key).")
 @click.option("--boot-cdrom", is_flag=True, help="Change boot device to CDROM.")
-def attach(server_id: int, iso_id: int | None, user_iso_name: str | None, boot_cdrom: bool) -> None:
+@task_command
+def attach(
+    server_id: int, iso_id: int | None, user_iso_name: str | None, boot_cdrom: bool
+) -> dict | None:
     if not iso_id and not user_iso_name:
         click.echo(click.style("Provide --iso-id or --user-iso", fg="red"), err=True)
         raise SystemExit(1)
@@ -43,10 +47,7 @@ def attach(server_id: int, iso_id: int | None, user_iso_name: str | None, boot_c
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @iso_group.command("detach", help="Detach ISO from server.")
@@ -4,10 +4,11 @@ import click
 
 from ..api.servers_guest import guest_agent_get
 from ..api.servers_image import image_setup, imageflavours_list, user_image_setup
-from ..api.servers_logs import server_logs_list
+from ..api.servers_logs import iter_server_logs, server_logs_list
 from ..api.servers_storage import storage_optimization_start
 from ..exceptions import APIError, ConfigError
-from ..output import print_json
+from ..output import print_json, print_json_stream
+from .helpers import all_pages_option, check_all_pages, task_command
 
 
 @click.group("logs", help="Server logs.")
@@ -19,8 +20,13 @@ def logs_group():
 @click.argument("server_id", type=int)
 @click.option("--limit", type=int, help="Max results.")
 @click.option("--offset", type=int, help="Offset.")
-def list_cmd(server_id: int, limit: int | None, offset: int | None) -> None:
+@all_pages_option
+def list_cmd(server_id: int, limit: int | None, offset: int | None, fetch_all: bool) -> None:
+    check_all_pages(fetch_all, limit, offset)
     try:
+        if fetch_all:
+            print_json_stream(iter_server_logs(server_id))
+            return
         data = server_logs_list(server_id, limit=limit, offset=offset)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
@@ -63,7 +69,8 @@ def flavours(server_id: int) -> None:
 @image_group.command("setup", help="Setup image (use --body JSON or key=val).")
 @click.argument("server_id", type=int)
 @click.option("--body", type=str, help='JSON body (e.g. {"imageFlavourId":1,"diskName":"vda"}).')
-def setup(server_id: int, body: str | None) -> None:
+@task_command
+def setup(server_id: int, body: str | None) -> dict | None:
     import json
 
     if not body:
@@ -79,10 +86,7 @@ def setup(server_id: int, body: str | None) -> None:
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @click.group("user-image", help="Setup user image.")
@@ -95,9 +99,10 @@ def user_image_group():
 @click.option("--name", "user_image_name", required=True, help="User image name.")
 @click.option("--disk-name", help="Disk name.")
 @click.option("--email-notification", is_flag=True, help="Send email when done.")
+@task_command
 def setup_cmd(
     server_id: int, user_image_name: str, disk_name: str | None, email_notification: bool
-) -> None:
+) -> dict | None:
     body = {"userImageName": user_image_name}
     if disk_name:
         body["diskName"] = disk_name
@@ -107,10 +112,7 @@ def setup_cmd(
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @click.group("storage-optimization", help="Storage optimization.")
@@ -127,7 +129,8 @@ def storage_opt_group():
     is_flag=True,
     help="Start server after optimization.",
 )
-def start(server_id: int, disks: tuple[str, ...], start_after_optimization: bool) -> None:
+@task_command
+def start(server_id: int, disks: tuple[str, ...], start_after_optimization: bool) -> dict | None:
     disk_list = list(disks) if disks else None
     try:
         result = storage_optimization_start(
@@ -138,7 +141,4 @@ def start(server_id: int, disks: tuple[str, ...], start_after_optimization: bool
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
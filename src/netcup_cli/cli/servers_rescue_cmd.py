@@ -5,6 +5,7 @@ import click
 from ..api.servers_rescue import rescuesystem_activate, rescuesystem_deactivate, rescuesystem_get
 from ..exceptions import APIError, ConfigError
 from ..output import print_json
+from .helpers import task_command
 
 
 @click.group("rescue", help="Server rescue system.")
@@ -25,27 +26,23 @@ def get_cmd(server_id: int) -> None:
 
 @rescue_group.command("activate", help="Activate rescue system.")
 @click.argument("server_id", type=int)
-def activate(server_id: int) -> None:
+@task_command
+def activate(server_id: int) -> dict | None:
     try:
         result = rescuesystem_activate(server_id)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @rescue_group.command("deactivate", help="Deactivate rescue system.")
 @click.argument("server_id", type=int)
-def deactivate(server_id: int) -> None:
+@task_command
+def deactivate(server_id: int) -> dict | None:
     try:
         result = rescuesystem_deactivate(server_id)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
@@ -13,6 +13,7 @@ from ..api.servers_snapshots import (
 )
 from ..exceptions import APIError, ConfigError
 from ..output import print_json
+from .helpers import task_command
 
 
 @click.group("snapshots", help="Server snapshots.")
@@ -49,13 +50,14 @@ def get_cmd(server_id: int, name: str) -> None:
 @click.option("--description", help="Description.")
 @click.option("--disk-name", help="Disk name.")
 @click.option("--online", "online_snapshot", is_flag=True, help="Online snapshot.")
+@task_command
 def create_cmd(
     server_id: int,
     name: str,
     description: str | None,
     disk_name: str | None,
     online_snapshot: bool,
-) -> None:
+) -> dict | None:
     body = {"name": name}
     if description:
         body["description"] = description
@@ -67,55 +69,46 @@ def create_cmd(
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @snapshots_group.command("delete", help="Delete snapshot.")
 @click.argument("server_id", type=int)
 @click.argument("name", type=str)
-def delete_cmd(server_id: int, name: str) -> None:
+@task_command
+def delete_cmd(server_id: int, name: str) -> dict | None:
     try:
         result = snapshot_delete(server_id, name)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @snapshots_group.command("export", help="Export snapshot.")
 @click.argument("server_id", type=int)
 @click.argument("name", type=str)
-def export_cmd(server_id: int, name: str) -> None:
+@task_command
+def export_cmd(server_id: int, name: str) -> dict | None:
     try:
         result = snapshot_export(server_id, name)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @snapshots_group.command("revert", help="Revert to snapshot.")
 @click.argument("server_id", type=int)
 @click.argument("name", type=str)
-def revert_cmd(server_id: int, name: str) -> None:
+@task_command
+def revert_cmd(server_id: int, name: str) -> dict | None:
     try:
         result = snapshot_revert(server_id, name)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @snapshots_group.command("dryrun", help="Check if snapshot creation is possible.")
@@ -2,9 +2,18 @@
 
 import click
 
-from ..api.tasks import task_cancel, task_get, task_list
-from ..exceptions import APIError, ConfigError
-from ..output import print_json
+from ..api.task_wait import TaskWatcher, wait_for_task
+from ..api.tasks import iter_tasks, task_cancel, task_get, task_list
+from ..exceptions import APIError, ConfigError, TaskTimeoutError
+from ..output import print_json, print_json_stream
+from .helpers import (
+    EXIT_TASK_TIMEOUT,
+    all_pages_option,
+    check_all_pages,
+    echo_task_progress,
+    task_exit_code,
+    tasks_exit_code,
+)
 
 
 @click.group("tasks", help="List and manage async tasks.")
@@ -18,14 +27,20 @@ def tasks_group():
 @click.option("-q", "query", help="Search in name, uuid, server name/nickname/uuid.")
 @click.option("--server-id", type=int, help="Filter by server ID.")
 @click.option("--state", type=str, help="Filter by state (e.g. RUNNING, FINISHED).")
+@all_pages_option
 def list_tasks(
     limit: int | None,
     offset: int | None,
     query: str | None,
     server_id: int | None,
     state: str | None,
+    fetch_all: bool,
 ) -> None:
+    check_all_pages(fetch_all, limit, offset)
     try:
+        if fetch_all:
+            print_json_stream(iter_tasks(q=query, server_id=server_id, state=state))
+            return
         data = task_list(limit=limit, offset=offset, q=query, server_id=server_id, state=state)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
@@ -56,3 +71,58 @@ def cancel_task(uuid: str) -> None:
         print_json(result)
     else:
         click.echo("OK")
+
+
+@tasks_group.command(
+    "wait",
+    help="Wait for tasks to finish. Exit code: 0 all FINISHED, 3 any ERROR, "
+    "4 any CANCELED, 124 timeout, 1 API error.",
+)
+@click.argument("uuids", nargs=-1, required=True, metavar="UUID...")
+@click.option("--timeout", type=float, help="Give up after this many seconds (default: never).")
+@click.option("--server-id", type=int, help="All tasks belong to this server (narrows polling).")
+@click.option("--quiet", is_flag=True, help="Do not show progress on stderr.")
+def wait_tasks(
+    uuids: tuple[str, ...], timeout: float | None, server_id: int | None, quiet: bool
+) -> None:
+    code = 0
+
+    def single():
+        nonlocal code
+        on_update = None if quiet else echo_task_progress
+        try:
+            task = wait_for_task(uuids[0], timeout=timeout, on_update=on_update)
+        except TaskTimeoutError as e:
+            click.echo(click.style(str(e), fg="red"), err=True)
+            code = EXIT_TASK_TIMEOUT
+            yield e.task
+            return
+        code = task_exit_code(task.get("state"))
+        yield task
+
+    def many():
+        # Tasks are printed in the order they finish
+        nonlocal code
+        watcher = TaskWatcher(dict.fromkeys(uuids), server_id=server_id)
+        states = []
+        try:
+            for task in watcher.watch(timeout=timeout):
+                if not quiet:
+                    echo_task_progress(task)
+                states.append(task.get("state"))
+                code = tasks_exit_code(states)
+                yield task
+        except TaskTimeoutError as e:
+            click.echo(click.style(str(e), fg="red"), err=True)
+            code = EXIT_TASK_TIMEOUT
+            yield from watcher.pending.values()
+
+    results = single() if len(uuids) == 1 else many()
+
+    try:
+        print_json_stream(results)
+    except (APIError, ConfigError) as e:
+        click.echo(click.style(str(e), fg="red"), err=True)
+        raise SystemExit(1) from e
+    if code:
+        raise SystemExit(code)
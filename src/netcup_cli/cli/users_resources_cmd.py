@@ -1,5 +1,7 @@
 """User resources CLI: failoverips, firewall-policies, ssh-keys, vlans, images, isos, logs."""
 
+import os
+
 import click
 
 from ..api.user_failoverips import (
@@ -14,15 +16,27 @@ from ..api.user_firewall_policies import (
     firewall_policy_delete,
     firewall_policy_get,
     firewall_policy_update,
+    iter_firewall_policies,
 )
 from ..api.user_images import user_image_delete, user_image_download_url, user_images_list
 from ..api.user_isos import user_iso_delete, user_iso_download_url, user_isos_list
-from ..api.user_logs import user_logs_list
+from ..api.user_logs import iter_user_logs, user_logs_list
 from ..api.user_ssh_keys import ssh_key_create, ssh_key_delete, ssh_keys_list
 from ..api.user_vlans import vlan_get, vlan_update, vlans_list
+from ..config import DOWNLOAD_CHUNK_SIZE
 from ..exceptions import APIError, ConfigError
-from ..output import print_json
-from .helpers import resolve_user_id, user_id_option
+from ..output import print_json, print_json_stream
+from .helpers import (
+    all_pages_option,
+    cached_options,
+    check_all_pages,
+    load_cached,
+    resolve_user_id,
+    task_command,
+    transfer_options,
+    transfer_progress,
+    user_id_option,
+)
 
 
 # ---- Failover IPs ----
@@ -40,8 +54,15 @@ def v4_group():
 @user_id_option
 @click.option("--ip", help="Filter by IP.")
 @click.option("--server-id", type=int, help="Filter by server.")
-def v4_list(user_id: int | None, ip: str | None, server_id: int | None) -> None:
+@cached_options
+def v4_list(
+    user_id: int | None, ip: str | None, server_id: int | None, cached: bool, max_age: int
+) -> None:
     uid = resolve_user_id(user_id)
+    data = load_cached("failoverips_v4", uid, cached, max_age, ip, server_id)
+    if data is not None:
+        print_json(data)
+        return
     try:
         data = failoverips_v4_list(uid, ip=ip, server_id=server_id)
     except (APIError, ConfigError) as e:
@@ -54,17 +75,15 @@ def v4_list(user_id: int | None, ip: str | None, server_id: int | None) -> None:
 @user_id_option
 @click.argument("id", type=int)
 @click.argument("server_id", type=int)
-def v4_route(user_id: int | None, id: int, server_id: int) -> None:
+@task_command
+def v4_route(user_id: int | None, id: int, server_id: int) -> dict | None:
     uid = resolve_user_id(user_id)
     try:
         result = failoverips_v4_route(uid, id, server_id)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 @failoverips_group.group("v6", help="Failover IPv6.")
@@ -76,8 +95,15 @@ def v6_group():
 @user_id_option
 @click.option("--ip", help="Filter by IP.")
 @click.option("--server-id", type=int, help="Filter by server.")
-def v6_list(user_id: int | None, ip: str | None, server_id: int | None) -> None:
+@cached_options
+def v6_list(
+    user_id: int | None, ip: str | None, server_id: int | None, cached: bool, max_age: int
+) -> None:
     uid = resolve_user_id(user_id)
+    data = load_cached("failoverips_v6", uid, cached, max_age, ip, server_id)
+    if data is not None:
+        print_json(data)
+        return
     try:
         data = failoverips_v6_list(uid, ip=ip, server_id=server_id)
     except (APIError, ConfigError) as e:
@@ -90,17 +116,15 @@ def v6_list(user_id: int | None, ip: str | None, server_id: int | None) -> None:
 @user_id_option
 @click.argument("id", type=int)
 @click.argument("server_id", type=int)
-def v6_route(user_id: int | None, id: int, server_id: int) -> None:
+@task_command
+def v6_route(user_id: int | None, id: int, server_id: int) -> dict | None:
     uid = resolve_user_id(user_id)
     try:
         result = failoverips_v6_route(uid, id, server_id)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
         raise SystemExit(1) from e
-    if result:
-        print_json(result)
-    else:
-        click.echo("OK")
+    return result
 
 
 # ---- Firewall policies ----
@@ -114,9 +138,20 @@ def firewall_policies_group():
 @click.option("--limit", type=int)
 @click.option("--offset", type=int)
 @click.option("-q", "query", help="Search by name or description.")
-def fp_list(user_id: int | None, limit: int | None, offset: int | None, query: str | None) -> None:
+@all_pages_option
+def fp_list(
+    user_id: int | None,
+    limit: int | None,
+    offset: int | None,
+    query: str | None,
+    fetch_all: bool,
+) -> None:
+    check_all_pages(fetch_all, limit, offset)
     uid = resolve_user_id(user_id)
     try:
+        if fetch_all:
+            print_json_stream(iter_firewall_policies(uid, q=query))
+            return
         data = firewall_policies_list(uid, limit=limit, offset=offset, q=query)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
@@ -205,8 +240,13 @@ def ssh_keys_group():
 
 @ssh_keys_group.command("list", help="List SSH keys.")
 @user_id_option
-def sk_list(user_id: int | None) -> None:
+@cached_options
+def sk_list(user_id: int | None, cached: bool, max_age: int) -> None:
     uid = resolve_user_id(user_id)
+    data = load_cached("ssh_keys", uid, cached, max_age)
+    if data is not None:
+        print_json(data)
+        return
     try:
         data = ssh_keys_list(uid)
     except (APIError, ConfigError) as e:
@@ -251,8 +291,13 @@ def vlans_group():
 @vlans_group.command("list", help="List VLANs.")
 @user_id_option
 @click.option("--server-id", type=int, help="Filter by server.")
-def vlans_list_cmd(user_id: int | None, server_id: int | None) -> None:
+@cached_options
+def vlans_list_cmd(user_id: int | None, server_id: int | None, cached: bool, max_age: int) -> None:
     uid = resolve_user_id(user_id)
+    data = load_cached("vlans", uid, cached, max_age, server_id)
+    if data is not None:
+        print_json(data)
+        return
     try:
         data = vlans_list(uid, server_id=server_id)
     except (APIError, ConfigError) as e:
@@ -288,6 +333,103 @@ def vlans_update_cmd(user_id: int | None, vlan_id: int, name: str) -> None:
     click.echo("OK")
 
 
+def upload_options(f):
+    """Click arguments/options shared by `images upload` and `isos upload`."""
+    f = transfer_options(f)
+    f = click.option(
+        "--no-resume",
+        is_flag=True,
+        help="Start a new upload even if an interrupted one of this file exists.",
+    )(f)
+    f = click.option(
+        "--part-size",
+        type=click.IntRange(min=5, max=5120),
+        help="Part size in MiB (default: 64, grown for files above 10000 parts).",
+    )(f)
+    f = click.option("--key", help="Object key (default: the file name).")(f)
+    return click.argument("file", type=click.Path(exists=True, dir_okay=False))(f)
+
+
+def run_upload(
+    kind: str,
+    user_id: int | None,
+    file: str,
+    key: str | None,
+    part_size: int | None,
+    no_resume: bool,
+    workers: int,
+) -> None:
+    """Upload a file as a user image or ISO and print the summary."""
+    from ..transfer import upload_file
+
+    uid = resolve_user_id(user_id)
+    key = key or os.path.basename(file)
+    try:
+        result = upload_file(
+            kind,
+            uid,
+            key,
+            file,
+            part_size=part_size * 1024 * 1024 if part_size else None,
+            workers=workers,
+            resume=not no_resume,
+            on_progress=transfer_progress(key),
+        )
+    except (APIError, ConfigError, OSError) as e:
+        click.echo(click.style(str(e), fg="red"), err=True)
+        raise SystemExit(1) from e
+    print_json(result)
+
+
+def download_options(f):
+    """Click arguments/options shared by `images download` and `isos download`."""
+    f = transfer_options(f)
+    f = click.option(
+        "--no-resume",
+        is_flag=True,
+        help="Download from scratch even if an interrupted download to DEST exists.",
+    )(f)
+    f = click.option(
+        "--chunk-size",
+        type=click.IntRange(min=1, max=1024),
+        default=DOWNLOAD_CHUNK_SIZE // (1024 * 1024),
+        show_default=True,
+        help="Bytes per ranged request, in MiB.",
+    )(f)
+    f = click.argument("dest", type=click.Path(), default=".")(f)
+    return click.argument("key", type=str)(f)
+
+
+def run_download(
+    kind: str,
+    user_id: int | None,
+    key: str,
+    dest: str,
+    chunk_size: int,
+    no_resume: bool,
+    workers: int,
+) -> None:
+    """Download a user image or ISO and print the summary."""
+    from ..transfer import download_file
+
+    uid = resolve_user_id(user_id)
+    try:
+        result = download_file(
+            kind,
+            uid,
+            key,
+            dest,
+            chunk_size=chunk_size * 1024 * 1024,
+            workers=workers,
+            resume=not no_resume,
+            on_progress=transfer_progress(key),
+        )
+    except (APIError, ConfigError, OSError) as e:
+        click.echo(click.style(str(e), fg="red"), err=True)
+        raise SystemExit(1) from e
+    print_json(result)
+
+
 # ---- User images ----
 @click.group("images", help="User images (S3).")
 def user_images_group():
@@ -335,6 +477,112 @@ def ui_download_url(user_id: int | None, key: str) -> None:
         print_json(url)
 
 
+@user_images_group.command(
+    "upload",
+    help="Upload a user image (multipart, parallel parts). "
+    "Run again after an interruption to resume.",
+)
+@user_id_option
+@upload_options
+def ui_upload(
+    user_id: int | None,
+    file: str,
+    key: str | None,
+    part_size: int | None,
+    no_resume: bool,
+    workers: int,
+) -> None:
+    run_upload("images", user_id, file, key, part_size, no_resume, workers)
+
+
+@user_images_group.command(
+    "download",
+    help="Download a user image to DEST (file or directory, default: .) with parallel "
+    "ranged requests. Run again after an interruption to resume.",
+)
+@user_id_option
+@download_options
+def ui_download(
+    user_id: int | None,
+    key: str,
+    dest: str,
+    chunk_size: int,
+    no_resume: bool,
+    workers: int,
+) -> None:
+    run_download("images", user_id, key, dest, chunk_size, no_resume, workers)
+
+
+@user_images_group.command(
+    "sync",
+    help="Mirror the files in DIR into the user images: upload new or changed files "
+    "(size, or modified after the upload), optionally delete images missing locally. "
+    "The plan is printed to stderr first; results stream as they complete.",
+)
+@user_id_option
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option("--delete", is_flag=True, help="Delete images that have no local file.")
+@click.option("--dry-run", is_flag=True, help="Print the plan as JSON and change nothing.")
+@click.option(
+    "--part-size",
+    type=click.IntRange(min=5, max=5120),
+    help="Part size in MiB (default: 64, grown for files above 10000 parts).",
+)
+@transfer_options
+def ui_sync(
+    user_id: int | None,
+    directory: str,
+    delete: bool,
+    dry_run: bool,
+    part_size: int | None,
+    workers: int,
+) -> None:
+    import time
+
+    from ..transfer import run_sync, sync_plan
+
+    uid = resolve_user_id(user_id)
+    try:
+        plan = sync_plan("images", uid, directory, delete=delete)
+    except (APIError, ConfigError, OSError) as e:
+        click.echo(click.style(str(e), fg="red"), err=True)
+        raise SystemExit(1) from e
+    for step in plan:
+        size = f"{step['size'] / 2**20:.1f} MiB"
+        click.echo(f"{step['action']:<6} {step['key']} ({step['reason']}, {size})", err=True)
+    if dry_run:
+        print_json(plan)
+        return
+    counts = {"ok": 0, "failed": 0}
+    started = time.monotonic()
+
+    def results():
+        for result in run_sync(
+            "images",
+            uid,
+            plan,
+            part_size=part_size * 1024 * 1024 if part_size else None,
+            workers=workers,
+            progress=transfer_progress,
+        ):
+            counts["ok" if result["ok"] else "failed"] += 1
+            yield result
+
+    try:
+        print_json_stream(results())
+    except (APIError, ConfigError) as e:
+        click.echo(click.style(str(e), fg="red"), err=True)
+        raise SystemExit(1) from e
+    skipped = sum(1 for step in plan if step["action"] == "skip")
+    click.echo(
+        f"{counts['ok']} ok, {counts['failed']} failed, {skipped} skipped,"
+        f" {time.monotonic() - started:.1f}s",
+        err=True,
+    )
+    if counts["failed"]:
+        raise SystemExit(1)
+
+
 # ---- User ISOs ----
 @click.group("isos", help="User ISOs (S3).")
 def user_isos_group():
@@ -382,6 +630,42 @@ def uiso_download_url(user_id: int | None, key: str) -> None:
         print_json(url)
 
 
+@user_isos_group.command(
+    "upload",
+    help="Upload a user ISO (multipart, parallel parts). "
+    "Run again after an interruption to resume.",
+)
+@user_id_option
+@upload_options
+def uiso_upload(
+    user_id: int | None,
+    file: str,
+    key: str | None,
+    part_size: int | None,
+    no_resume: bool,
+    workers: int,
+) -> None:
+    run_upload("isos", user_id, file, key, part_size, no_resume, workers)
+
+
+@user_isos_group.command(
+    "download",
+    help="Download a user ISO to DEST (file or directory, default: .) with parallel "
+    "ranged requests. Run again after an interruption to resume.",
+)
+@user_id_option
+@download_options
+def uiso_download(
+    user_id: int | None,
+    key: str,
+    dest: str,
+    chunk_size: int,
+    no_resume: bool,
+    workers: int,
+) -> None:
+    run_download("isos", user_id, key, dest, chunk_size, no_resume, workers)
+
+
 # ---- User logs ----
 @click.group("logs", help="User logs.")
 def user_logs_group():
@@ -392,9 +676,14 @@ def user_logs_group():
 @user_id_option
 @click.option("--limit", type=int)
 @click.option("--offset", type=int)
-def ul_list(user_id: int | None, limit: int | None, offset: int | None) -> None:
+@all_pages_option
+def ul_list(user_id: int | None, limit: int | None, offset: int | None, fetch_all: bool) -> None:
+    check_all_pages(fetch_all, limit, offset)
     uid = resolve_user_id(user_id)
     try:
+        if fetch_all:
+            print_json_stream(iter_user_logs(uid))
+            return
         data = user_logs_list(uid, limit=limit, offset=offset)
     except (APIError, ConfigError) as e:
         click.echo(click.style(str(e), fg="red"), err=True)
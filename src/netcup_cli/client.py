@@ -1,20 +1,150 @@
 """HTTP client for SCP API with Bearer token handling."""
 
-from typing import Any
+import json
+import random
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
 
 import requests
 
-from .auth import get_access_token
-from .config import API_BASE_URL
+from .auth import get_access_token, invalidate_access_token
+from .config import (
+    API_BASE_URL,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF,
+    RETRY_JITTER,
+    RETRY_MAX_BACKOFF,
+    RETRY_STATUSES,
+)
 from .exceptions import APIError
+from .ratelimit import RateLimiter
+from .session import create_session, get_session
+from .stats import measure
+
+if TYPE_CHECKING:
+    # Only for annotations: importing it loads sqlite3, needed only with --cache
+    from .http_cache import ResponseCache
+
+
+def parse_retry_after(resp: requests.Response | None) -> float | None:
+    """Return the Retry-After header of resp in seconds (delta or HTTP date), if any."""
+    value = resp.headers.get("Retry-After") if resp is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """When and how long APIClient waits before retrying a failed request.
+
+    Timeouts, connection errors and `statuses` responses are retried up to
+    `attempts` total tries with exponential backoff and jitter, or after the
+    server's Retry-After. Only `methods` are retried unless the caller opts in
+    (retry=True) for non-idempotent POST/PATCH requests.
+    """
+
+    SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+        self,
+        attempts: int = RETRY_ATTEMPTS,
+        backoff: float = RETRY_BACKOFF,
+        max_backoff: float = RETRY_MAX_BACKOFF,
+        jitter: float = RETRY_JITTER,
+        statuses: frozenset[int] = RETRY_STATUSES,
+        methods: frozenset[str] = SAFE_METHODS,
+    ):
+        self.attempts = max(1, attempts)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = statuses
+        self.methods = methods
+
+    def allows(self, method: str, retry: bool | None = None) -> bool:
+        """Whether a request with this method may be retried at all."""
+        if retry is not None:
+            return retry
+        return method.upper() in self.methods
+
+    def delay(self, attempt: int, resp: requests.Response | None = None) -> float:
+        """Seconds to wait after failed attempt number `attempt` (1-based); a
+        server's Retry-After is honoured up to max_backoff."""
+        retry_after = parse_retry_after(resp)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        base = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return base * (1 - self.jitter) + random.uniform(0, base * self.jitter)
 
 
 class APIClient:
-    """Minimal API client for SCP REST API."""
+    """Minimal API client for SCP REST API.
+
+    Requests go through a pooled keep-alive Session: the one passed as `session`, a
+    private one when `pool_maxsize` is given, or else the process-wide shared session
+    (also used by the auth helpers). Use as a context manager or call close() to
+    release a private pool. An optional RateLimiter throttles every attempt sent.
+
+    `observers` are called after every attempt as fn(method, status_code, elapsed),
+    with elapsed the time spent on the HTTP request itself; status_code is None
+    when the request failed without a response.
+    """
 
-    def __init__(self, access_token: str | None = None, base_url: str = API_BASE_URL):
+    def __init__(
+        self,
+        access_token: str | None = None,
+        base_url: str = API_BASE_URL,
+        *,
+        session: requests.Session | None = None,
+        pool_maxsize: int | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: "ResponseCache | None" = None,
+        single_flight: bool = True,
+    ):
         self.base_url = base_url.rstrip("/")
         self._access_token = access_token
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.single_flight = single_flight
+        # In-flight GETs by (url, params, accept), shared by concurrent callers
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.observers: list[Callable[[str, int | None, float], None]] = []
+        self._owns_session = session is None and pool_maxsize is not None
+        if session is not None:
+            self.session = session
+        elif pool_maxsize is not None:
+            self.session = create_session(pool_maxsize)
+        else:
+            self.session = get_session()
+
+    def close(self) -> None:
+        """Close the client's connection pool if it owns one."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "APIClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _headers(self) -> dict[str, str]:
         token = self._access_token or get_access_token()
@@ -30,64 +160,170 @@ class APIClient:
         path: str,
         *,
         params: dict[str, Any] | None = None,
-        json: dict | None = None,
+        json: dict | list | None = None,
         data: dict | None = None,
         content_type: str | None = None,
         accept: str | None = None,
+        headers: dict[str, str] | None = None,
     ) -> requests.Response:
-        url = f"{self.base_url}{path}" if path.startswith("/") else f"{self.base_url}/{path}"
-        headers = self._headers()
+        url = self._url(path)
+        all_headers = self._headers()
         if content_type:
-            headers["Content-Type"] = content_type
+            all_headers["Content-Type"] = content_type
         if accept:
-            headers["Accept"] = accept
-        resp = requests.request(
-            method,
-            url,
-            headers=headers,
-            params=params,
-            json=json,
-            data=data,
-            timeout=60,
-        )
+            all_headers["Accept"] = accept
+        if headers:
+            all_headers.update(headers)
+        queued = self.rate_limiter.acquire() if self.rate_limiter is not None else 0.0
+        with measure(method, url, queue=queued) as measurement:
+            # Observers see network time only, not token refresh or rate-limit waits
+            started = time.monotonic()
+            try:
+                resp = self.session.request(
+                    method,
+                    url,
+                    headers=all_headers,
+                    params=params,
+                    json=json,
+                    data=data,
+                    timeout=60,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                self._notify(method, None, time.monotonic() - started)
+                raise
+            self._notify(method, resp.status_code, time.monotonic() - started)
+            measurement.response = resp
         return resp
 
+    def _url(self, path: str) -> str:
+        return f"{self.base_url}{path}" if path.startswith("/") else f"{self.base_url}/{path}"
+
+    def _notify(self, method: str, status: int | None, elapsed: float) -> None:
+        for observer in list(self.observers):
+            observer(method, status, elapsed)
+
     def request(
         self,
         method: str,
         path: str,
         *,
         params: dict[str, Any] | None = None,
-        json: dict | None = None,
+        json: dict | list | None = None,
         data: dict | None = None,
         content_type: str | None = None,
         accept: str | None = None,
         raise_for_status: bool = True,
+        retry: bool | None = None,
     ) -> requests.Response:
-        resp = self._request(
-            method,
-            path,
-            params=params,
-            json=json,
-            data=data,
-            content_type=content_type,
-            accept=accept,
-        )
-        if raise_for_status and not resp.ok:
-            raise APIError(
-                f"API error: {resp.status_code}",
-                status_code=resp.status_code,
-                body=resp.text,
-            )
+        """Send a request, retrying transient failures per self.retry_policy.
+
+        retry=None retries only idempotent methods; True also retries POST/PATCH;
+        False disables retries for this call.
+
+        With self.cache, GETs are answered from or revalidated against the cache,
+        and other methods invalidate cached responses for the path they touch.
+        """
+        kwargs = dict(params=params, json=json, data=data, content_type=content_type, accept=accept)
+        if self.cache is None:
+            return self._send(method, path, kwargs, raise_for_status, retry)
+        if method.upper() != "GET":
+            try:
+                return self._send(method, path, kwargs, raise_for_status, retry)
+            finally:
+                self.cache.invalidate(path)
+        key = self.cache.key(self._url(path), params, accept)
+        entry = self.cache.get(key)
+        if entry is not None and entry.fresh:
+            return entry.response()
+        if entry is not None and entry.etag:
+            kwargs["headers"] = {"If-None-Match": entry.etag}
+        resp = self._send(method, path, kwargs, False, retry)
+        if resp.status_code == 304 and entry is not None:
+            self.cache.revalidated(key, path)
+            return entry.response("revalidated")
+        self.cache.store(key, path, resp)
+        if raise_for_status:
+            self._raise_for_status(resp)
         return resp
 
+    def _send(
+        self,
+        method: str,
+        path: str,
+        kwargs: dict[str, Any],
+        raise_for_status: bool,
+        retry: bool | None,
+    ) -> requests.Response:
+        policy = self.retry_policy
+        retryable = policy.allows(method, retry)
+        token_refreshed = False
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                resp = self._request(method, path, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if retryable and attempt < policy.attempts:
+                    time.sleep(policy.delay(attempt))
+                    continue
+                raise APIError(f"Request failed: {e}", attempts=attempt) from e
+            if resp.status_code == 401 and self._access_token is None and not token_refreshed:
+                # Cached token was revoked or expired early: refresh once and retry
+                invalidate_access_token()
+                token_refreshed = True
+                attempt -= 1
+                continue
+            if resp.status_code in policy.statuses and retryable and attempt < policy.attempts:
+                time.sleep(policy.delay(attempt, resp))
+                continue
+            break
+        resp.attempts = attempt
+        if raise_for_status:
+            self._raise_for_status(resp)
+        return resp
+
+    @staticmethod
+    def _raise_for_status(resp: requests.Response) -> None:
+        if resp.ok:
+            return
+        attempts = getattr(resp, "attempts", 1)
+        suffix = f" (after {attempts} attempts)" if attempts > 1 else ""
+        raise APIError(
+            f"API error: {resp.status_code}{suffix}",
+            status_code=resp.status_code,
+            body=resp.text,
+            attempts=attempts,
+        )
+
     def get(
         self,
         path: str,
         params: dict[str, Any] | None = None,
         accept: str | None = None,
     ) -> requests.Response:
-        return self.request("GET", path, params=params, accept=accept)
+        """GET path. With single_flight, concurrent identical GETs (same URL, params
+        and Accept) share one request and its Response (or error)."""
+        if not self.single_flight:
+            return self.request("GET", path, params=params, accept=accept)
+        key = (self._url(path), json.dumps(params, sort_keys=True, default=str), accept)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            resp = self.request("GET", path, params=params, accept=accept)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(resp)
+            return resp
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
     def post(
         self,
@@ -96,12 +332,19 @@ class APIClient:
         data: dict | None = None,
         content_type: str | None = None,
         params: dict[str, Any] | None = None,
+        retry: bool | None = None,
     ) -> requests.Response:
         return self.request(
-            "POST", path, json=json, data=data, content_type=content_type, params=params
+            "POST",
+            path,
+            json=json,
+            data=data,
+            content_type=content_type,
+            params=params,
+            retry=retry,
         )
 
-    def put(self, path: str, json: dict | None = None) -> requests.Response:
+    def put(self, path: str, json: dict | list | None = None) -> requests.Response:
         return self.request("PUT", path, json=json)
 
     def patch(
@@ -109,8 +352,12 @@ class APIClient:
         path: str,
         json: dict | None = None,
         content_type: str = "application/merge-patch+json",
+        params: dict[str, Any] | None = None,
+        retry: bool | None = None,
     ) -> requests.Response:
-        return self.request("PATCH", path, json=json, content_type=content_type)
+        return self.request(
+            "PATCH", path, json=json, content_type=content_type, params=params, retry=retry
+        )
 
     def delete(self, path: str) -> requests.Response:
         return self.request("DELETE", path)
@@ -0,0 +1,33 @@
+"""Deferred configuration of the shared API client.
+
+The CLI records how the client is to be built here at startup; api.base applies it
+when the shared client is next requested. Importing this module loads nothing else,
+so commands that never call the API do not import requests or the API package.
+"""
+
+import sys
+from collections.abc import Callable
+from typing import Any
+
+_pending: Callable[[], dict[str, Any]] | None = None
+
+
+def defer_client_options(factory: Callable[[], dict[str, Any]]) -> None:
+    """Have the next get_client() rebuild the shared client with factory()'s
+    APIClient keyword options (replacing any factory not used yet)."""
+    global _pending
+    _pending = factory
+
+
+def take_client_options() -> dict[str, Any] | None:
+    """Options of the deferred factory, if any (called once, by api.base)."""
+    global _pending
+    factory, _pending = _pending, None
+    return factory() if factory is not None else None
+
+
+def close_client_if_used() -> None:
+    """Close the shared client and its connections if the API was used at all."""
+    base = sys.modules.get("netcup_cli.api.base")
+    if base is not None:
+        base.close_client()
@@ -0,0 +1,160 @@
+"""Adaptive (AIMD) concurrency control for fan-out operations."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any
+
+from .config import FANOUT_INITIAL_CONCURRENCY, FANOUT_MAX_CONCURRENCY
+
+
+class AIMDController:
+    """Concurrency limit that grows additively while requests are healthy and is cut
+    multiplicatively on 429/5xx, connection errors or latency spikes.
+
+    Feed it by attaching it to an APIClient (observing()); fan-out helpers read
+    `limit` before starting each new unit of work.
+    """
+
+    def __init__(
+        self,
+        initial: int = FANOUT_INITIAL_CONCURRENCY,
+        minimum: int = 1,
+        maximum: int = FANOUT_MAX_CONCURRENCY,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_factor: float = 3.0,
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self._limit = float(min(self.maximum, max(self.minimum, initial)))
+        self._lock = threading.Lock()
+        self._baseline: float | None = None
+        self._last_decrease = 0.0
+        self.peak = int(self._limit)
+        self.decreases = 0
+        self.observed = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of units of work allowed in flight."""
+        return int(self._limit)
+
+    def observe(self, method: str, status: int | None, elapsed: float) -> None:
+        """APIClient observer: adjust the limit from one request's outcome."""
+        now = time.monotonic()
+        overloaded = status is None or status == 429 or status >= 500
+        with self._lock:
+            self.observed += 1
+            baseline = self._baseline
+            slow = baseline is not None and elapsed > baseline * self.latency_factor
+            if not overloaded:
+                # Track the lower envelope of latency, drifting up slowly
+                if baseline is None or elapsed < baseline:
+                    self._baseline = elapsed
+                else:
+                    self._baseline = baseline + (elapsed - baseline) * 0.05
+            if overloaded or slow:
+                # Cut at most once per round trip: ignore requests sent before the last cut
+                if now - elapsed >= self._last_decrease:
+                    self._limit = max(float(self.minimum), self._limit * self.decrease)
+                    self._last_decrease = now
+                    self.decreases += 1
+            else:
+                self._limit = min(float(self.maximum), self._limit + self.increase / self._limit)
+                self.peak = max(self.peak, int(self._limit))
+
+    @contextmanager
+    def observing(self, client: Any) -> Iterator["AIMDController"]:
+        """Attach to client (APIClient) for the duration of the block."""
+        client.observers.append(self.observe)
+        try:
+            yield self
+        finally:
+            client.observers.remove(self.observe)
+
+    def summary(self) -> dict:
+        """Settled limit and counters, for reporting."""
+        return {
+            "concurrency": self.limit,
+            "peak": self.peak,
+            "decreases": self.decreases,
+            "requests": self.observed,
+        }
+
+
+def fan_out(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    *,
+    controller: AIMDController | None = None,
+    max_workers: int = FANOUT_INITIAL_CONCURRENCY,
+) -> Iterator[tuple[Any, Any, BaseException | None]]:
+    """Run fn(item) in a thread pool; yield (item, result, error) as each completes.
+
+    With a controller, the number of items in flight follows controller.limit;
+    otherwise it is fixed at max_workers. Errors are yielded, not raised.
+    Stopping iteration early stops submitting new items.
+    """
+    workers = controller.maximum if controller is not None else max_workers
+    it = iter(items)
+    pending: dict = {}
+    exhausted = False
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="netcup-fanout") as pool:
+        try:
+            while True:
+                limit = controller.limit if controller is not None else max_workers
+                while not exhausted and len(pending) < limit:
+                    try:
+                        item = next(it)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[pool.submit(fn, item)] = item
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    error = future.exception()
+                    yield item, (None if error else future.result()), error
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def fan_out_async(
+    fn: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    *,
+    controller: AIMDController | None = None,
+    max_workers: int = FANOUT_INITIAL_CONCURRENCY,
+) -> list[tuple[Any, Any, BaseException | None]]:
+    """Asyncio counterpart of fan_out: await fn(item) for all items, return
+    (item, result, error) tuples in completion order."""
+    it = iter(items)
+    pending: dict = {}
+    results = []
+    exhausted = False
+    while True:
+        limit = controller.limit if controller is not None else max_workers
+        while not exhausted and len(pending) < limit:
+            try:
+                item = next(it)
+            except StopIteration:
+                exhausted = True
+                break
+            pending[asyncio.ensure_future(fn(item))] = item
+        if not pending:
+            return results
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            item = pending.pop(task)
+            error = task.exception()
+            results.append((item, None if error else task.result(), error))
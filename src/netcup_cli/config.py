@@ -13,6 +13,64 @@ API_BASE_URL = f"{API_ROOT}/v1"
 CLIENT_ID = "scp"
 SCOPE = "offline_access openid"
 
+# Retries of failed API requests (see client.RetryPolicy)
+RETRY_ATTEMPTS = 3  # total attempts, including the first one
+RETRY_BACKOFF = 0.5  # seconds before the first retry, doubled per attempt
+RETRY_MAX_BACKOFF = 30.0
+RETRY_JITTER = 0.5  # fraction of each delay that is randomised
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Fan-out (parallel) operations: starting and maximum concurrency
+FANOUT_INITIAL_CONCURRENCY = 4
+FANOUT_MAX_CONCURRENCY = 32
+
+# HTTP connection pooling (keep-alive); the pool holds one connection per fan-out
+# worker, as urllib3 discards connections returned to a full pool
+HTTP_POOL_CONNECTIONS = 4  # number of hosts with a cached pool
+HTTP_POOL_MAXSIZE = FANOUT_MAX_CONCURRENCY  # idle connections kept per host
+
+# Default max age (seconds) of inventory cache entries used by --cached
+INVENTORY_MAX_AGE = 3600
+
+# Max age (seconds) of inventory data used to plan a failover switch; planned IPs
+# are routed without re-reading them, so keep this short
+FAILOVER_MAX_AGE = 60
+
+# Task polling: bounds (seconds) of the adaptive interval used by wait_for_task
+TASK_POLL_MIN = 1.0
+TASK_POLL_MAX = 30.0
+
+# HTTP response cache (--cache): size bound and per-endpoint TTLs in seconds as
+# (regex on the request path, ttl); other GETs are revalidated via ETag
+HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024
+HTTP_CACHE_TTLS = (
+    (r"^/servers/\d+/imageflavours$", 86400),
+    (r"^/servers/\d+/isoimages$", 86400),
+    (r"^/servers/\d+/disks/supported-drivers$", 86400),
+    (r"^/maintenance$", 300),
+    (r"^/users/\d+/ssh-keys$", 3600),
+    (r"^/users/\d+/vlans$", 3600),
+)
+
+# Multipart uploads of user images/ISOs: default part size and parallel parts.
+# S3 needs parts of at least 5 MiB (except the last) and at most 10000 parts.
+UPLOAD_PART_SIZE = 64 * 1024 * 1024
+UPLOAD_MIN_PART_SIZE = 5 * 1024 * 1024
+UPLOAD_MAX_PARTS = 10000
+TRANSFER_WORKERS = 4
+
+# Byte range fetched per request by parallel downloads of user images/ISOs
+DOWNLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+
+# Page size used by the iter_* pagination helpers (and `list --all`)
+PAGE_SIZE = 100
+
+# Default number of in-flight requests for AsyncAPIClient
+ASYNC_MAX_CONCURRENCY = 16
+
+# Access tokens are refreshed this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 30
+
 
 # Token storage
 def _config_dir() -> Path:
@@ -20,11 +78,52 @@ def _config_dir() -> Path:
     return Path(xdg) / "netcup-cli"
 
 
+def token_cache_on_disk() -> bool:
+    """Whether access tokens are cached on disk (NETCUP_TOKEN_CACHE=0: memory only).
+    Read per call, so commands forwarded to the daemon see their own setting."""
+    return os.environ.get("NETCUP_TOKEN_CACHE", "1") != "0"
+
+
 def credentials_path() -> Path:
     """Path to stored credentials (refresh token)."""
     return _config_dir() / "credentials"
 
 
+def token_cache_path() -> Path:
+    """Path to the on-disk access token cache."""
+    return _config_dir() / "token_cache"
+
+
+def rate_limit_state_path() -> Path:
+    """Path to the rate limiter state shared by concurrent netcup processes."""
+    return _config_dir() / "ratelimit.state"
+
+
+def inventory_path() -> Path:
+    """Path to the local SQLite inventory cache."""
+    return _config_dir() / "inventory.sqlite3"
+
+
+def http_cache_path() -> Path:
+    """Path to the SQLite HTTP response cache."""
+    return _config_dir() / "http_cache.sqlite3"
+
+
+def daemon_socket_path() -> Path:
+    """Path to the Unix socket of `netcup daemon`."""
+    return _config_dir() / "daemon.sock"
+
+
+def daemon_log_path() -> Path:
+    """Path to the log of a daemon started in the background."""
+    return _config_dir() / "daemon.log"
+
+
+def transfer_state_dir() -> Path:
+    """Directory of resume state files for interrupted uploads and downloads."""
+    return _config_dir() / "transfers"
+
+
 def ensure_config_dir() -> Path:
     """Ensure config directory exists; return its path."""
     d = _config_dir()
@@ -0,0 +1,270 @@
+"""Optional background daemon that runs CLI commands in a warm process.
+
+The daemon listens on a Unix socket in the config dir (mode 0600) and executes
+forwarded command lines in-process, so the imports, pooled HTTPS connections,
+access token and inventory cache stay warm between invocations. Commands run one
+at a time (they share stdio, cwd and environment), so the launcher keeps
+long-running commands local. An unexpected error is reported to the client as
+well as logged.
+
+Protocol: the client sends one JSON line ({"argv", "cwd", "env", "tty"} to run a
+command, or {"control": "ping"|"stop"}). Command output comes back as frames of
+a 1-byte channel ("1" stdout, "2" stderr, "x" exit code) and a 4-byte length.
+
+This module only imports the standard library at the top level, so the forwarding
+client (see launcher.py) stays cheap to start.
+"""
+
+import io
+import json
+import os
+import socket
+import struct
+import sys
+import time
+import traceback
+
+from .config import daemon_socket_path, ensure_config_dir
+
+_HEADER = struct.Struct(">cI")
+_CHUNK = 65536
+
+
+def _send_frame(conn: socket.socket, channel: bytes, data: bytes) -> None:
+    conn.sendall(_HEADER.pack(channel, len(data)) + data)
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes | None:
+    buf = b""
+    while len(buf) < size:
+        chunk = conn.recv(size - len(buf))
+        if not chunk:
+            return None
+        buf += chunk
+    return buf
+
+
+def _recv_line(conn: socket.socket) -> bytes:
+    buf = b""
+    while not buf.endswith(b"\n"):
+        chunk = conn.recv(_CHUNK)
+        if not chunk:
+            break
+        buf += chunk
+    return buf
+
+
+def _connect(path: str, timeout: float | None = None) -> socket.socket | None:
+    """Connect to the daemon socket; None when no daemon is listening."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def control(command: str, path: str | None = None, timeout: float = 5.0) -> dict | None:
+    """Send a control command ("ping" or "stop"); return the reply or None when no
+    daemon is running."""
+    sock = _connect(path or str(daemon_socket_path()), timeout)
+    if sock is None:
+        return None
+    with sock:
+        try:
+            sock.sendall(json.dumps({"control": command}).encode() + b"\n")
+            line = _recv_line(sock)
+        except OSError:
+            return None
+    return json.loads(line) if line else None
+
+
+def forward(argv: list[str], path: str | None = None) -> int | None:
+    """Run a command line in the daemon, relaying its output; return the exit code,
+    or None when no daemon is running (the caller then runs the command itself)."""
+    sock = _connect(path or str(daemon_socket_path()))
+    if sock is None:
+        return None
+    try:
+        cwd = os.getcwd()
+    except OSError:
+        cwd = None
+    request = {
+        "argv": argv,
+        "cwd": cwd,
+        "env": {k: v for k, v in os.environ.items() if k.startswith("NETCUP_")},
+        "tty": [sys.stdout.isatty(), sys.stderr.isatty()],
+    }
+    outputs = {b"1": sys.stdout.buffer, b"2": sys.stderr.buffer}
+    with sock:
+        try:
+            sock.sendall(json.dumps(request).encode() + b"\n")
+        except OSError:
+            return None
+        while True:
+            header = _recv_exact(sock, _HEADER.size)
+            if header is None:
+                return 1
+            channel, size = _HEADER.unpack(header)
+            data = _recv_exact(sock, size)
+            if data is None:
+                return 1
+            if channel == b"x":
+                return int(data)
+            try:
+                outputs[channel].write(data)
+                outputs[channel].flush()
+            except BrokenPipeError:
+                # Reader went away (e.g. `| head`); closing the socket stops the command
+                devnull = os.open(os.devnull, os.O_WRONLY)
+                os.dup2(devnull, sys.stdout.fileno())
+                return 1
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that sends everything written to it to the client as frames."""
+
+    def __init__(self, conn: socket.socket, channel: bytes, tty: bool):
+        self._conn = conn
+        self._channel = channel
+        self._tty = tty
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def write(self, text: str | bytes) -> int:
+        # click may write bytes to streams that accept them
+        data = text if isinstance(text, bytes) else text.encode("utf-8", "replace")
+        if data:
+            _send_frame(self._conn, self._channel, data)
+        return len(text)
+
+
+def _run_command(conn: socket.socket, request: dict) -> int:
+    """Run one forwarded command line with stdio and environment redirected."""
+    import click
+
+    from .cli.main import cli
+
+    tty = request.get("tty") or [False, False]
+    saved_stdio = sys.stdin, sys.stdout, sys.stderr
+    saved_env = {k: v for k, v in os.environ.items() if k.startswith("NETCUP_")}
+    saved_cwd = os.getcwd()
+    sys.stdin = io.StringIO()
+    sys.stdout = _FrameWriter(conn, b"1", bool(tty[0]))
+    sys.stderr = _FrameWriter(conn, b"2", bool(tty[1]))
+    for key in saved_env:
+        del os.environ[key]
+    os.environ.update(request.get("env") or {})
+    try:
+        if request.get("cwd"):
+            os.chdir(request["cwd"])
+        rv = cli.main(
+            list(request["argv"]),
+            prog_name="netcup",
+            standalone_mode=False,
+            obj={"daemon": True},
+        )
+        return rv if isinstance(rv, int) else 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        click.echo(e.code, err=True)
+        return 1
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except Exception:
+        # Shown to the client like an uncaught error of a local run, and logged
+        text = traceback.format_exc()
+        saved_stdio[2].write(text)
+        saved_stdio[2].flush()
+        try:
+            sys.stderr.write(text)
+        except OSError:
+            pass
+        return 1
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = saved_stdio
+        for key in [k for k in os.environ if k.startswith("NETCUP_")]:
+            del os.environ[key]
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+
+def serve(path: str | None = None, idle_timeout: float | None = None) -> None:
+    """Listen on the daemon socket and run forwarded commands until stopped (or
+    idle for idle_timeout seconds)."""
+    ensure_config_dir()
+    path = path or str(daemon_socket_path())
+    if os.path.exists(path):
+        if control("ping", path) is not None:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    os.chmod(path, 0o600)
+    server.listen(16)
+    server.settimeout(idle_timeout)
+    started = time.time()
+    handled = 0
+    print(f"netcup daemon {os.getpid()} listening on {path}", file=sys.stderr, flush=True)
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break
+            with conn:
+                conn.settimeout(None)
+                try:
+                    request = json.loads(_recv_line(conn) or b"{}")
+                except ValueError:
+                    continue
+                command = request.get("control")
+                if command is not None:
+                    reply = {
+                        "pid": os.getpid(),
+                        "socket": path,
+                        "uptime": round(time.time() - started, 1),
+                        "commands": handled,
+                    }
+                    try:
+                        conn.sendall(json.dumps(reply).encode() + b"\n")
+                    except OSError:
+                        pass
+                    if command == "stop":
+                        break
+                    continue
+                if not request.get("argv") and request.get("argv") != []:
+                    continue
+                handled += 1
+                try:
+                    code = _run_command(conn, request)
+                except Exception:
+                    traceback.print_exc()
+                    code = 1
+                try:
+                    _send_frame(conn, b"x", str(code).encode())
+                except OSError:
+                    pass
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.unlink(path)
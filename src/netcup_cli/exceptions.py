@@ -12,10 +12,25 @@ class AuthError(SCPError):
 class APIError(SCPError):
     """API request error."""
 
-    def __init__(self, message: str, status_code: int | None = None, body: str | None = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        body: str | None = None,
+        attempts: int = 1,
+    ):
         super().__init__(message)
         self.status_code = status_code
         self.body = body
+        self.attempts = attempts
+
+
+class TaskTimeoutError(SCPError):
+    """Timed out waiting for an async task to finish."""
+
+    def __init__(self, message: str, task: dict | None = None):
+        super().__init__(message)
+        self.task = task
 
 
 class ConfigError(SCPError):
@@ -0,0 +1,186 @@
+"""Failover switch: move every failover IP routed to one server to another."""
+
+import time
+from collections.abc import Callable
+
+from .api.task_wait import TaskWatcher
+from .api.user_failoverips import (
+    failoverips_v4_list,
+    failoverips_v4_route,
+    failoverips_v6_list,
+    failoverips_v6_route,
+)
+from .concurrency import fan_out
+from .config import FAILOVER_MAX_AGE, FANOUT_MAX_CONCURRENCY
+from .exceptions import SCPError, TaskTimeoutError
+from .inventory import Inventory
+
+# IP version -> (inventory kind, list, route)
+_FAILOVER = {
+    4: ("failoverips_v4", failoverips_v4_list, failoverips_v4_route),
+    6: ("failoverips_v6", failoverips_v6_list, failoverips_v6_route),
+}
+
+
+def _address(version: int, record: dict) -> str:
+    if version == 4:
+        return f"{record.get('ip')}/{record.get('cidrSuffix', 32)}"
+    return f"{record.get('networkPrefix')}/{record.get('networkPrefixLength')}"
+
+
+def _server_id(record: dict) -> int | None:
+    return (record.get("server") or {}).get("id")
+
+
+def plan_switch(
+    user_id: int,
+    from_server: int,
+    *,
+    use_inventory: bool = True,
+    max_age: float = FAILOVER_MAX_AGE,
+) -> dict:
+    """Failover IPv4s and IPv6 subnets currently routed to from_server.
+
+    Read from the local inventory when it is younger than max_age (no API
+    request), else from both failover IP lists fetched in parallel. Returns
+    {"source": "inventory"|"api"|"mixed",
+     "routes": [{"version", "id", "address", "source": "inventory"|"api"}]}.
+    """
+    records: dict[int, list[dict]] = {}
+    if use_inventory:
+        with Inventory() as inventory:
+            for version, (kind, _, _) in _FAILOVER.items():
+                data = inventory.load(kind, user_id, max_age=max_age)
+                if data is not None:
+                    records[version] = [r for r in data if _server_id(r) == from_server]
+    missing = [version for version in _FAILOVER if version not in records]
+    for version, data, error in fan_out(
+        lambda v: _FAILOVER[v][1](user_id, server_id=from_server),
+        missing,
+        max_workers=len(missing) or 1,
+    ):
+        if error is not None:
+            raise error
+        # The API filters by serverId already; never route IPs of other servers
+        records[version] = [r for r in data if _server_id(r) == from_server]
+    if not missing:
+        source = "inventory"
+    else:
+        source = "api" if len(missing) == len(_FAILOVER) else "mixed"
+    routes = [
+        {
+            "version": version,
+            "id": record["id"],
+            "address": _address(version, record),
+            "source": "api" if version in missing else "inventory",
+        }
+        for version in sorted(records)
+        for record in records[version]
+    ]
+    return {"source": source, "routes": routes}
+
+
+def _update_inventory(user_id: int, routes: list[dict], to_server: int) -> None:
+    """Replace the inventory records of switched IPs with the API's current records
+    of to_server's failover IPs, so a later switch (e.g. back again) plans from
+    the new routing. Kinds that are not in the inventory are not fetched."""
+    switched: dict[int, set] = {}
+    for r in routes:
+        if r["ok"]:
+            switched.setdefault(r["version"], set()).add(r["id"])
+    with Inventory() as inventory:
+        versions = [v for v in switched if inventory.load(_FAILOVER[v][0], user_id)]
+        for version, data, error in fan_out(
+            lambda v: _FAILOVER[v][1](user_id, server_id=to_server),
+            versions,
+            max_workers=len(versions) or 1,
+        ):
+            if error is None:
+                fresh = [r for r in data if r.get("id") in switched[version]]
+                inventory.update(_FAILOVER[version][0], user_id, fresh)
+
+
+def switch_failover(
+    user_id: int,
+    from_server: int,
+    to_server: int,
+    *,
+    use_inventory: bool = True,
+    max_age: float = FAILOVER_MAX_AGE,
+    wait: bool = True,
+    timeout: float | None = None,
+    on_update: Callable[[dict], None] | None = None,
+) -> dict:
+    """Route every failover IP of from_server to to_server.
+
+    The plan comes from plan_switch() and is not re-read before routing (a stale
+    inventory entry is caught by max_age or by the API rejecting the PATCH). All
+    route PATCHes are sent at once and the resulting tasks are then awaited
+    together (TaskWatcher) unless wait=False. A route failing or its task ending
+    in ERROR/CANCELED does not stop the others. If polling the tasks fails, the
+    routes still pending get that error and "error" is set on the result. After
+    waiting, inventory records of switched IPs are refreshed.
+
+    Returns {"from", "to", "source", "routes": [{"version", "id", "address",
+    "source", "ok", "task"?, "state"?, "error"?}], "timings": {"plan", "route",
+    "tasks", "total"}, "error"?} with times in seconds; "state" is "TIMEOUT" for
+    tasks still running at timeout.
+    """
+    started = time.monotonic()
+    plan = plan_switch(user_id, from_server, use_inventory=use_inventory, max_age=max_age)
+    planned = time.monotonic()
+    routes = [dict(route, ok=False) for route in plan["routes"]]
+
+    def route(step: dict) -> dict | None:
+        return _FAILOVER[step["version"]][2](user_id, step["id"], to_server)
+
+    tasks: dict[str, dict] = {}
+    workers = max(1, min(len(routes), FANOUT_MAX_CONCURRENCY))
+    for step, task, error in fan_out(route, routes, max_workers=workers):
+        if error is not None:
+            step["error"] = str(error) if isinstance(error, SCPError) else repr(error)
+            continue
+        step["ok"] = True
+        if task and task.get("uuid"):
+            step["task"] = task["uuid"]
+            step["state"] = task.get("state")
+            tasks[task["uuid"]] = step
+    routed = time.monotonic()
+
+    poll_error = None
+    if wait and tasks:
+        watcher = TaskWatcher(tasks)
+        try:
+            for task in watcher.watch(timeout=timeout, on_update=on_update):
+                step = tasks[task["uuid"]]
+                step["state"] = task.get("state")
+                step["ok"] = step["state"] == "FINISHED"
+                if not step["ok"]:
+                    step["error"] = (task.get("message") or f"Task {step['state']}").strip()
+        except TaskTimeoutError:
+            for uuid in watcher.pending:
+                tasks[uuid].update(ok=False, state="TIMEOUT")
+        except SCPError as e:
+            # Every PATCH was sent already; report what is known instead of raising
+            poll_error = str(e)
+            for uuid in watcher.pending:
+                tasks[uuid].update(ok=False, error=poll_error)
+    finished = time.monotonic()
+
+    if wait:
+        _update_inventory(user_id, routes, to_server)
+    result = {
+        "from": from_server,
+        "to": to_server,
+        "source": plan["source"],
+        "routes": routes,
+        "timings": {
+            "plan": round(planned - started, 3),
+            "route": round(routed - planned, 3),
+            "tasks": round(finished - routed, 3),
+            "total": round(finished - started, 3),
+        },
+    }
+    if poll_error is not None:
+        result["error"] = poll_error
+    return result
@@ -0,0 +1,194 @@
+"""On-disk cache of API GET responses with TTLs and ETag revalidation."""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .config import HTTP_CACHE_MAX_BYTES, HTTP_CACHE_TTLS, ensure_config_dir, http_cache_path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    expires REAL NOT NULL,
+    used REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_path ON responses (path);
+CREATE INDEX IF NOT EXISTS responses_used ON responses (used);
+"""
+
+# Headers describing the wire encoding, which no longer applies to the stored body
+_DROP_HEADERS = ("Content-Encoding", "Content-Length", "Transfer-Encoding", "Connection")
+
+# Trailing ":action" of custom-method paths (e.g. ".../firewall:restore-copied-policies")
+_ACTION_SUFFIX = re.compile(r":[a-z][a-z-]{2,}$")
+
+
+def _resource_path(path: str) -> str:
+    path = path.split("?", 1)[0].rstrip("/")
+    return path if path.startswith("/") else f"/{path}"
+
+
+class CachedResponse:
+    """A cache entry; response() rebuilds a requests.Response from it."""
+
+    def __init__(self, url: str, status: int, headers: str, body: bytes, etag, expires):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.etag = etag
+        self.expires = expires
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires
+
+    def response(self, source: str = "hit") -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = self.status
+        resp.reason = "OK"
+        resp.url = self.url
+        resp.headers = CaseInsensitiveDict(json.loads(self.headers))
+        resp.headers["X-Netcup-Cache"] = source
+        resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+        resp._content = self.body
+        return resp
+
+
+class ResponseCache:
+    """SQLite-backed cache of successful GET responses, shared by processes using
+    the same config dir.
+
+    A response is reused without a request for the TTL of the first matching
+    (regex, seconds) rule in ttls, checked against the request path. After that,
+    or with no matching rule, it is revalidated with If-None-Match when the server
+    sent an ETag; responses without TTL or ETag are not stored. The least recently
+    used entries are evicted beyond max_bytes. invalidate(path) drops entries for
+    a resource after a mutating request.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        ttls: tuple[tuple[str, float], ...] = HTTP_CACHE_TTLS,
+        max_bytes: int = HTTP_CACHE_MAX_BYTES,
+    ):
+        if path is None:
+            ensure_config_dir()
+            path = http_cache_path()
+        self.path = path
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls]
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def key(url: str, params: dict[str, Any] | None = None, accept: str | None = None) -> str:
+        """Cache key of a GET request (URL with sorted params, and Accept)."""
+        items = sorted((k, v) for k, v in (params or {}).items() if v is not None)
+        prepared = requests.Request("GET", url, params=items).prepare()
+        return f"{accept or 'application/json'} {prepared.url}"
+
+    def ttl_for(self, path: str) -> float:
+        """Seconds a response for path may be reused without revalidation."""
+        for pattern, ttl in self.ttls:
+            if pattern.search(path):
+                return ttl
+        return 0.0
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status, headers, body, etag, expires FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            with self._db:
+                self._db.execute("UPDATE responses SET used = ? WHERE key = ?", (time.time(), key))
+        return CachedResponse(*row)
+
+    def store(self, key: str, path: str, resp: requests.Response) -> None:
+        """Store a 200 response (if it has a TTL or an ETag) and evict beyond max_bytes."""
+        path = _resource_path(path)
+        ttl = self.ttl_for(path)
+        etag = resp.headers.get("ETag")
+        cache_control = resp.headers.get("Cache-Control", "").lower()
+        if resp.status_code != 200 or "no-store" in cache_control or not (ttl > 0 or etag):
+            return
+        headers = {k: v for k, v in resp.headers.items() if k not in _DROP_HEADERS}
+        body = resp.content
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, path, url, status, headers, body, etag, expires, used, size)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, path, resp.url, 200, json.dumps(headers), body, etag, now + ttl, now, size),
+            )
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                self._evict(total - self.max_bytes)
+
+    def _evict(self, excess: int) -> None:
+        freed = 0
+        doomed = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY used"):
+            if freed >= excess:
+                break
+            doomed.append((key,))
+            freed += size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def revalidated(self, key: str, path: str) -> None:
+        """Mark an entry fresh again after a 304 Not Modified."""
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE responses SET expires = ?, used = ? WHERE key = ?",
+                (time.time() + self.ttl_for(_resource_path(path)), time.time(), key),
+            )
+
+    def invalidate(self, path: str) -> int:
+        """Drop entries for path, everything below it and its parent collection
+        (e.g. PATCH /servers/1 drops /servers/1, /servers/1/... and /servers)."""
+        path = _ACTION_SUFFIX.sub("", _resource_path(path))
+        parent = path.rsplit("/", 1)[0]
+        prefix = path.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "/%"
+        with self._lock, self._db:
+            cur = self._db.execute(
+                "DELETE FROM responses WHERE path IN (?, ?) OR path LIKE ? ESCAPE '\\'",
+                (path, parent, prefix),
+            )
+            return cur.rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
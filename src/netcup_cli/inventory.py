@@ -0,0 +1,237 @@
+"""Local SQLite inventory cache of slowly changing account data."""
+
+import json
+import sqlite3
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from .api.base import get_client
+from .api.servers import iter_servers
+from .api.servers_interfaces import interfaces_list
+from .api.user_failoverips import failoverips_v4_list, failoverips_v6_list
+from .api.user_ssh_keys import ssh_keys_list
+from .api.user_vlans import vlans_list
+from .concurrency import AIMDController, fan_out
+from .config import ensure_config_dir, inventory_path
+
+# kind -> record key field; user-scoped kinds are stored with scope=user id,
+# interfaces with scope=server id, servers with scope ""
+KINDS = {
+    "servers": "id",
+    "interfaces": "mac",
+    "vlans": "vlanId",
+    "failoverips_v4": "id",
+    "failoverips_v6": "id",
+    "ssh_keys": "id",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    kind TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, scope, key)
+);
+CREATE TABLE IF NOT EXISTS syncs (
+    kind TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (kind, scope)
+);
+"""
+
+
+class Inventory:
+    """SQLite-backed store of API list responses, keyed by (kind, scope)."""
+
+    def __init__(self, path: Path | None = None):
+        if path is None:
+            ensure_config_dir()
+            path = inventory_path()
+        self.path = path
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "Inventory":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def store(self, kind: str, scope: object, records: list[dict]) -> dict:
+        """Replace the records of (kind, scope), writing only rows that changed.
+        Returns counts of added, changed, removed and unchanged records."""
+        key_field = KINDS[kind]
+        scope = str(scope)
+        counts = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+        with self._db:
+            existing = dict(
+                self._db.execute(
+                    "SELECT key, data FROM records WHERE kind = ? AND scope = ?", (kind, scope)
+                )
+            )
+            seen = set()
+            for position, record in enumerate(records):
+                key = str(record.get(key_field, position))
+                data = json.dumps(record, sort_keys=True, default=str)
+                seen.add(key)
+                old = existing.get(key)
+                if old == data:
+                    counts["unchanged"] += 1
+                    self._db.execute(
+                        "UPDATE records SET position = ? WHERE kind = ? AND scope = ? AND key = ?",
+                        (position, kind, scope, key),
+                    )
+                    continue
+                counts["added" if old is None else "changed"] += 1
+                self._db.execute(
+                    "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)",
+                    (kind, scope, key, position, data),
+                )
+            removed = [k for k in existing if k not in seen]
+            self._db.executemany(
+                "DELETE FROM records WHERE kind = ? AND scope = ? AND key = ?",
+                [(kind, scope, k) for k in removed],
+            )
+            counts["removed"] = len(removed)
+            self._db.execute(
+                "INSERT OR REPLACE INTO syncs VALUES (?, ?, ?)", (kind, scope, time.time())
+            )
+        return counts
+
+    def update(self, kind: str, scope: object, records: Iterable[dict]) -> int:
+        """Overwrite individual cached records (e.g. after changing them through the
+        API) without touching the others or the sync time. Records not cached yet
+        are ignored. Returns the number of records updated."""
+        key_field = KINDS[kind]
+        scope = str(scope)
+        updated = 0
+        with self._db:
+            for record in records:
+                updated += self._db.execute(
+                    "UPDATE records SET data = ? WHERE kind = ? AND scope = ? AND key = ?",
+                    (
+                        json.dumps(record, sort_keys=True, default=str),
+                        kind,
+                        scope,
+                        str(record.get(key_field)),
+                    ),
+                ).rowcount
+        return updated
+
+    def load(
+        self, kind: str, scope: object = "", max_age: float | None = None
+    ) -> list[dict] | None:
+        """Return cached records of (kind, scope), or None if never synced or older
+        than max_age seconds."""
+        scope = str(scope)
+        row = self._db.execute(
+            "SELECT synced_at FROM syncs WHERE kind = ? AND scope = ?", (kind, scope)
+        ).fetchone()
+        if row is None or (max_age is not None and time.time() - row[0] > max_age):
+            return None
+        rows = self._db.execute(
+            "SELECT data FROM records WHERE kind = ? AND scope = ? ORDER BY position",
+            (kind, scope),
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def status(self) -> list[dict]:
+        """Per (kind, scope): record count and sync age in seconds."""
+        now = time.time()
+        rows = self._db.execute(
+            "SELECT s.kind, s.scope, s.synced_at, COUNT(r.key) FROM syncs s "
+            "LEFT JOIN records r ON r.kind = s.kind AND r.scope = s.scope "
+            "GROUP BY s.kind, s.scope ORDER BY s.kind, s.scope"
+        )
+        return [
+            {"kind": k, "scope": s, "records": n, "ageSeconds": round(now - t)}
+            for k, s, t, n in rows
+        ]
+
+    def prune(self, kind: str, keep_scopes: Iterable[object]) -> int:
+        """Drop records of kind whose scope is not in keep_scopes (e.g. deleted
+        servers). Returns the number of records removed."""
+        keep = {str(s) for s in keep_scopes}
+        scopes = [
+            s
+            for (s,) in self._db.execute("SELECT scope FROM syncs WHERE kind = ?", (kind,))
+            if s not in keep
+        ]
+        removed = 0
+        with self._db:
+            for scope in scopes:
+                removed += self._db.execute(
+                    "DELETE FROM records WHERE kind = ? AND scope = ?", (kind, scope)
+                ).rowcount
+                self._db.execute("DELETE FROM syncs WHERE kind = ? AND scope = ?", (kind, scope))
+        return removed
+
+    def clear(self) -> None:
+        with self._db:
+            self._db.execute("DELETE FROM records")
+            self._db.execute("DELETE FROM syncs")
+
+
+def sync_inventory(
+    user_id: int,
+    inventory: Inventory,
+    kinds: Iterable[str] = tuple(KINDS),
+    on_result: Callable[[str, object, dict | Exception], None] | None = None,
+) -> dict:
+    """Fetch the selected kinds concurrently and store them in inventory.
+
+    Account-level lists run in parallel; interfaces are then fetched per server
+    with adaptive concurrency. on_result(kind, scope, counts_or_error) is called as
+    each list is stored. Returns {"kind": counts summed over scopes, ...}.
+    """
+    kinds = [k for k in KINDS if k in set(kinds)]
+    fetchers: dict[str, tuple[object, Callable[[], list[dict]]]] = {
+        "servers": ("", lambda: list(iter_servers())),
+        "vlans": (user_id, lambda: vlans_list(user_id)),
+        "failoverips_v4": (user_id, lambda: failoverips_v4_list(user_id)),
+        "failoverips_v6": (user_id, lambda: failoverips_v6_list(user_id)),
+        "ssh_keys": (user_id, lambda: ssh_keys_list(user_id)),
+    }
+    totals = {
+        k: {"added": 0, "changed": 0, "removed": 0, "unchanged": 0, "errors": 0} for k in kinds
+    }
+
+    def record(kind: str, scope: object, records: list | None, error: Exception | None) -> None:
+        if error is None:
+            result = inventory.store(kind, scope, records)
+            for name, n in result.items():
+                totals[kind][name] += n
+        else:
+            totals[kind]["errors"] += 1
+            result = error
+        if on_result is not None:
+            on_result(kind, scope, result)
+
+    top = [k for k in kinds if k in fetchers]
+    if "interfaces" in kinds and "servers" not in top:
+        top.insert(0, "servers")
+    server_ids: list[int] | None = None
+    controller = AIMDController()
+    with controller.observing(get_client()):
+        for kind, records, error in fan_out(
+            lambda k: fetchers[k][1](), top, max_workers=len(top) or 1
+        ):
+            if kind == "servers" and error is None:
+                server_ids = [s["id"] for s in records]
+            if kind in totals:
+                record(kind, fetchers[kind][0], records, error)
+        if "interfaces" in kinds:
+            for server_id, records, error in fan_out(
+                interfaces_list, server_ids or [], controller=controller
+            ):
+                record("interfaces", server_id, records, error)
+            if server_ids is not None:
+                totals["interfaces"]["removed"] += inventory.prune("interfaces", server_ids)
+    return totals
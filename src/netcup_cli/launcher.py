@@ -0,0 +1,74 @@
+"""Console entry point: forward to a running daemon, else run the CLI in-process.
+
+Only the standard library is imported before forwarding, so commands handled by
+`netcup daemon` skip loading click, requests and the command modules.
+"""
+
+import os
+import sys
+
+from .config import daemon_socket_path
+
+# Global options taking a value (their value is not a command name)
+_VALUE_OPTIONS = {"-o", "--output", "--retries", "--rate-limit", "--burst"}
+
+# Commands that always run locally: interactive, managing the daemon itself, or
+# long-running (waits, transfers, fan-outs), since the daemon runs one command at a time
+_LOCAL_COMMANDS = (
+    ("daemon",),
+    ("auth", "login"),
+    ("tasks", "wait"),
+    ("users", "images", "upload"),
+    ("users", "images", "download"),
+    ("users", "images", "sync"),
+    ("users", "isos", "upload"),
+    ("users", "isos", "download"),
+    ("inventory", "sync"),
+    ("batch", "run"),
+    ("rdns", "apply"),
+    ("failover", "switch"),
+)
+
+# Options that make a command long-running, by command prefix (() matches any)
+_LOCAL_OPTIONS = (((), "--wait"), (("servers", "get"), "--all"))
+
+
+def _command_words(argv: list[str]) -> list[str]:
+    words = []
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg in _VALUE_OPTIONS:
+            skip = True
+        elif not arg.startswith("-"):
+            words.append(arg)
+    return words
+
+
+def _should_forward(argv: list[str]) -> bool:
+    if os.environ.get("NETCUP_NO_DAEMON") or not daemon_socket_path().exists():
+        return False
+    if "-" in argv:
+        # Reads stdin, which is not forwarded
+        return False
+    words = _command_words(argv)
+    if any(tuple(words[: len(cmd)]) == cmd for cmd in _LOCAL_COMMANDS):
+        return False
+    return not any(
+        option in argv and tuple(words[: len(cmd)]) == cmd for cmd, option in _LOCAL_OPTIONS
+    )
+
+
+def main() -> None:
+    """Entry point for console script."""
+    argv = sys.argv[1:]
+    if _should_forward(argv):
+        from .daemon import forward
+
+        code = forward(argv)
+        if code is not None:
+            sys.exit(code)
+    from .cli.main import cli
+
+    cli(prog_name="netcup")
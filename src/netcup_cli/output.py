@@ -1,14 +1,78 @@
 """Output formatting for CLI."""
 
 import json
+import os
+import sys
+from collections.abc import Iterable
 from typing import Any
 
+# "json": pretty-printed document; "ndjson": one compact JSON record per line
+OUTPUT_FORMATS = ("json", "ndjson")
+
+_output_format = "json"
+
+
+def set_output_format(fmt: str) -> None:
+    """Select the output format used by print_json / print_json_stream."""
+    global _output_format
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {fmt}")
+    _output_format = fmt
+
+
+def get_output_format() -> str:
+    """Return the current output format."""
+    return _output_format
+
 
 def format_json(data: Any, indent: int = 2) -> str:
     """Format data as JSON string."""
     return json.dumps(data, indent=indent, default=str)
 
 
+def format_ndjson_record(data: Any) -> str:
+    """Format one record as a single compact JSON line (without newline)."""
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+
+def _write(text: str) -> None:
+    try:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Reader went away (e.g. `| head`): silence the final flush and stop
+        try:
+            fileno = sys.stdout.fileno()
+        except (OSError, ValueError):
+            # Not a real file (output relayed by the daemon)
+            raise SystemExit(1) from None
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, fileno)
+        raise SystemExit(1) from None
+
+
 def print_json(data: Any, indent: int = 2) -> None:
-    """Print data as JSON to stdout."""
-    print(format_json(data, indent=indent))
+    """Print data as JSON to stdout (in ndjson mode: one line per list item)."""
+    if _output_format == "ndjson":
+        print_json_stream(data if isinstance(data, list) else [data])
+        return
+    _write(format_json(data, indent=indent) + "\n")
+
+
+def print_json_stream(items: Iterable[Any], indent: int = 2) -> None:
+    """Print items as one JSON array, writing each item as soon as it is available.
+
+    Produces the same text as print_json(list(items)) without holding the list. In
+    ndjson mode each item is written as its own line.
+    """
+    if _output_format == "ndjson":
+        for item in items:
+            _write(format_ndjson_record(item) + "\n")
+        return
+    prefix = " " * indent
+    first = True
+    for item in items:
+        text = format_json(item, indent=indent).replace("\n", "\n" + prefix)
+        _write(("[\n" if first else ",\n") + prefix + text)
+        first = False
+    _write("[]\n" if first else "\n]\n")
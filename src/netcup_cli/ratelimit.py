@@ -0,0 +1,66 @@
+"""Client-side token-bucket rate limiting for API requests."""
+
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process coordination
+    fcntl = None
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` requests/second with bursts of up to `burst`.
+
+    Thread-safe. With `state_path`, the bucket is kept in that file under an
+    exclusive flock so that all netcup processes on the host share one budget
+    (falls back to a per-process bucket where flock is unavailable).
+    """
+
+    def __init__(self, rate: float, burst: int | None = None, state_path: Path | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst if burst is not None else int(rate) or 1)
+        self.state_path = state_path if fcntl is not None else None
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.time()
+
+    def _reserve(self, tokens: float, updated: float) -> tuple[float, float, float]:
+        """Take one token from a bucket state; return (tokens, updated, wait)."""
+        now = time.time()
+        tokens = min(float(self.burst), tokens + max(0.0, now - updated) * self.rate) - 1
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        return tokens, now, wait
+
+    def _reserve_shared(self) -> float:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    tokens, updated = (float(x) for x in f.read().split())
+                except ValueError:
+                    tokens, updated = float(self.burst), time.time()
+                tokens, updated, wait = self._reserve(tokens, updated)
+                f.seek(0)
+                f.truncate()
+                f.write(f"{tokens} {updated}")
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return wait
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; return the seconds waited."""
+        with self._lock:
+            if self.state_path is not None:
+                wait = self._reserve_shared()
+            else:
+                self._tokens, self._updated, wait = self._reserve(self._tokens, self._updated)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
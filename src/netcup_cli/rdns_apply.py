@@ -0,0 +1,224 @@
+"""Bulk rDNS: read ip -> PTR mappings, diff them against the API and apply changes."""
+
+import csv
+import ipaddress
+import json
+import re
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from .api.base import get_client
+from .api.rdns import (
+    rdns_delete_ipv4,
+    rdns_delete_ipv6,
+    rdns_get_ipv4,
+    rdns_get_ipv6,
+    rdns_set_ipv4,
+    rdns_set_ipv6,
+)
+from .concurrency import AIMDController, fan_out
+from .exceptions import APIError, SCPError
+
+# (get, set, delete) per IP version
+_RDNS = {
+    4: (rdns_get_ipv4, rdns_set_ipv4, rdns_delete_ipv4),
+    6: (rdns_get_ipv6, rdns_set_ipv6, rdns_delete_ipv6),
+}
+
+MAPPING_FORMATS = ("csv", "json", "zone")
+
+_PTR_RECORD = re.compile(r"\sPTR\s", re.IGNORECASE)
+
+
+def _normalize_ptr(ptr: str | None) -> str | None:
+    """PTR without trailing dot; None (delete) for empty values."""
+    if ptr is None:
+        return None
+    ptr = str(ptr).strip().rstrip(".")
+    return ptr or None
+
+
+def _same_ptr(a: str | None, b: str | None) -> bool:
+    a, b = _normalize_ptr(a), _normalize_ptr(b)
+    return (a or "").lower() == (b or "").lower()
+
+
+def _reverse_to_ip(name: str) -> str:
+    """IP address of an in-addr.arpa / ip6.arpa name."""
+    labels = name.lower().rstrip(".").split(".")
+    if labels[-2:] == ["in-addr", "arpa"] and len(labels) == 6:
+        return ".".join(reversed(labels[:4]))
+    if labels[-2:] == ["ip6", "arpa"] and len(labels) == 34:
+        nibbles = "".join(reversed(labels[:32]))
+        return str(ipaddress.IPv6Address(int(nibbles, 16)))
+    raise ValueError(f"Not a full reverse name of an address: {name}")
+
+
+def _parse_zone(lines: Iterable[str]) -> Iterator[tuple[str, str | None]]:
+    """PTR records of a zone file (absolute names, or relative to $ORIGIN)."""
+    origin = ""
+    for lineno, line in enumerate(lines, 1):
+        line = line.split(";", 1)[0].strip()
+        if not line:
+            continue
+        fields = line.split()
+        if fields[0].upper() == "$ORIGIN" and len(fields) > 1:
+            origin = fields[1].rstrip(".")
+            continue
+        upper = [f.upper() for f in fields]
+        if "PTR" not in upper:
+            continue
+        index = upper.index("PTR")
+        if index == 0 or index + 1 >= len(fields):
+            raise ValueError(f"Line {lineno}: unsupported PTR record: {line}")
+        name = fields[0]
+        if name == "@":
+            name = origin
+        elif not name.endswith(".") and origin:
+            name = f"{name}.{origin}"
+        try:
+            yield _reverse_to_ip(name), fields[index + 1]
+        except ValueError as e:
+            raise ValueError(f"Line {lineno}: {e}") from None
+
+
+def _parse_csv(lines: Iterable[str]) -> Iterator[tuple[str, str | None]]:
+    """Rows of ip,ptr (an "ip" header row and # comments are skipped). An empty
+    ptr field ("ip,") deletes; a row without a ptr field is an error."""
+    for lineno, line in enumerate(lines, 1):
+        if line.lstrip().startswith("#"):
+            continue
+        row = next(csv.reader([line]), [])
+        if not row or not row[0].strip():
+            continue
+        if row[0].strip().lower() == "ip":
+            continue
+        if len(row) < 2:
+            raise ValueError(f"Line {lineno}: expected ip,ptr (use 'ip,' to delete): {line}")
+        yield row[0].strip(), row[1]
+
+
+def _parse_json(text: str) -> Iterator[tuple[str, str | None]]:
+    """{"ip": "ptr", ...} or [{"ip", "rdns"|"ptr"}, ...]."""
+    data = json.loads(text)
+    if isinstance(data, dict):
+        yield from data.items()
+        return
+    if not isinstance(data, list):
+        raise ValueError("JSON mappings must be an object or a list of objects")
+    for item in data:
+        if not isinstance(item, dict) or "ip" not in item:
+            raise ValueError(f"Invalid mapping: {item!r}")
+        yield item["ip"], item.get("rdns", item.get("ptr"))
+
+
+def guess_format(name: str, text: str) -> str:
+    """Mapping format from the file name, else from the content."""
+    lower = name.lower()
+    for fmt, suffixes in (("json", (".json",)), ("csv", (".csv",)), ("zone", (".zone", ".db"))):
+        if lower.endswith(suffixes):
+            return fmt
+    stripped = text.lstrip()
+    if stripped[:1] in ("{", "["):
+        return "json"
+    if _PTR_RECORD.search(text):
+        return "zone"
+    return "csv"
+
+
+def read_mappings(text: str, fmt: str) -> dict[str, str | None]:
+    """Parse mappings in format fmt ("csv", "json" or "zone") into {ip: ptr};
+    a None/empty PTR means the record is to be deleted. IPs are normalized;
+    conflicting entries for the same IP raise ValueError."""
+    if fmt == "json":
+        pairs = _parse_json(text)
+    elif fmt == "zone":
+        pairs = _parse_zone(text.splitlines())
+    elif fmt == "csv":
+        pairs = _parse_csv(text.splitlines())
+    else:
+        raise ValueError(f"Unknown mapping format: {fmt}")
+    mappings: dict[str, str | None] = {}
+    for ip, ptr in pairs:
+        try:
+            address = str(ipaddress.ip_address(str(ip).strip()))
+        except ValueError:
+            raise ValueError(f"Invalid IP address: {ip}") from None
+        ptr = _normalize_ptr(ptr)
+        if address in mappings and not _same_ptr(mappings[address], ptr):
+            raise ValueError(f"Conflicting PTRs for {address}: {mappings[address]}, {ptr}")
+        mappings[address] = ptr
+    return mappings
+
+
+def _run(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    controller: AIMDController | None,
+    max_workers: int | None,
+) -> Iterator[tuple[Any, Any, BaseException | None]]:
+    if max_workers is not None:
+        yield from fan_out(fn, items, max_workers=max_workers)
+        return
+    controller = controller or AIMDController()
+    with controller.observing(get_client()):
+        yield from fan_out(fn, items, controller=controller)
+
+
+def plan_rdns(
+    mappings: dict[str, str | None],
+    *,
+    controller: AIMDController | None = None,
+    max_workers: int | None = None,
+) -> list[dict]:
+    """Fetch the current PTR of every mapped IP concurrently and diff; return one
+    step per IP, sorted by address:
+    {"ip", "version", "current", "desired", "action": "set"|"delete"|"unchanged"|"error"}
+    ("error" steps carry "error" instead of "current")."""
+
+    def current(ip: str) -> str | None:
+        get = _RDNS[ipaddress.ip_address(ip).version][0]
+        return (get(ip) or {}).get("rdns")
+
+    plan = []
+    for ip, value, error in _run(current, mappings, controller, max_workers):
+        desired = mappings[ip]
+        step = {"ip": ip, "version": ipaddress.ip_address(ip).version, "desired": desired}
+        if error is not None:
+            step["action"] = "error"
+            step["error"] = str(error) if isinstance(error, SCPError) else repr(error)
+        else:
+            step["current"] = value
+            if _same_ptr(value, desired):
+                step["action"] = "unchanged"
+            else:
+                step["action"] = "set" if desired else "delete"
+        plan.append(step)
+    plan.sort(key=lambda step: (step["version"], ipaddress.ip_address(step["ip"])))
+    return plan
+
+
+def apply_rdns(
+    plan: list[dict],
+    *,
+    controller: AIMDController | None = None,
+    max_workers: int | None = None,
+) -> Iterator[dict]:
+    """Run the set/delete steps of a plan_rdns() plan concurrently; yield
+    {"ip", "action", "ok", "error"?, "status"?} as each completes."""
+
+    def write(step: dict) -> None:
+        _, set_rdns, delete_rdns = _RDNS[step["version"]]
+        if step["action"] == "set":
+            set_rdns(step["ip"], step["desired"])
+        else:
+            delete_rdns(step["ip"])
+
+    changes = [step for step in plan if step["action"] in ("set", "delete")]
+    for step, _, error in _run(write, changes, controller, max_workers):
+        out = {"ip": step["ip"], "action": step["action"], "ok": error is None}
+        if error is not None:
+            out["error"] = str(error) if isinstance(error, SCPError) else repr(error)
+            if isinstance(error, APIError) and error.status_code is not None:
+                out["status"] = error.status_code
+        yield out
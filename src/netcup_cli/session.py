@@ -0,0 +1,38 @@
+"""Pooled keep-alive HTTP sessions shared by the auth helpers and API clients."""
+
+import threading
+
+import requests
+
+from .config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+from .stats import TimingAdapter
+
+_shared_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def create_session(pool_maxsize: int = HTTP_POOL_MAXSIZE) -> requests.Session:
+    """Return a new Session keeping up to pool_maxsize idle connections per host."""
+    session = requests.Session()
+    adapter = TimingAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide shared Session (created on first use)."""
+    global _shared_session
+    with _session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
+
+
+def close_session() -> None:
+    """Close the shared Session and its pooled connections."""
+    global _shared_session
+    with _session_lock:
+        if _shared_session is not None:
+            _shared_session.close()
+            _shared_session = None
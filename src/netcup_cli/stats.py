@@ -0,0 +1,233 @@
+"""Per-request timing statistics (global --stats option)."""
+
+import math
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .config import API_BASE_URL, API_ROOT, AUTH_URL
+
+# Connect (DNS + TCP) and TLS seconds spent by the current thread's request
+_local = threading.local()
+
+# Collector used by measure(); None while statistics are off
+_collector: "RequestStats | None" = None
+
+# URL path prefixes replaced in endpoint names, longest first
+_PREFIXES = (
+    (urlsplit(API_BASE_URL).path, ""),
+    (urlsplit(API_ROOT).path, ""),
+    (urlsplit(AUTH_URL).path, "oidc:"),
+)
+
+_SEGMENT_PATTERNS = (
+    (re.compile(r"^\d+$"), "{id}"),
+    (re.compile(r"^[0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12}$", re.IGNORECASE), "{uuid}"),
+    (re.compile(r"^([0-9a-f]{2}:){5}[0-9a-f]{2}$", re.IGNORECASE), "{mac}"),
+    (re.compile(r"^(\d{1,3}\.){3}\d{1,3}$"), "{ip}"),
+    (re.compile(r"^[0-9a-f:]*:[0-9a-f:]*$", re.IGNORECASE), "{ip}"),
+)
+
+
+def path_template(url: str) -> str:
+    """Endpoint name of a request URL: the path below the API root, with IDs,
+    UUIDs, MAC and IP addresses replaced by placeholders."""
+    path = urlsplit(url).path
+    for prefix, label in _PREFIXES:
+        if path.startswith(prefix + "/"):
+            path = label + path[len(prefix) :]
+            break
+    segments = []
+    for segment in path.split("/"):
+        for pattern, placeholder in _SEGMENT_PATTERNS:
+            if segment and pattern.match(segment):
+                segment = placeholder
+                break
+        segments.append(segment)
+    return "/".join(segments)
+
+
+def _add_time(name: str, seconds: float) -> None:
+    setattr(_local, name, getattr(_local, name, 0.0) + seconds)
+
+
+class _TimedConnectionMixin:
+    def _new_conn(self):
+        started = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            _add_time("connect", time.perf_counter() - started)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        connect_before = getattr(_local, "connect", 0.0)
+        try:
+            super().connect()
+        finally:
+            connect = getattr(_local, "connect", 0.0) - connect_before
+            _add_time("tls", time.perf_counter() - started - connect)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimingAdapter(HTTPAdapter):
+    """HTTPAdapter whose new connections report connect and TLS time to measure()."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class RequestStats:
+    """Collected request records with a per-endpoint latency summary."""
+
+    def __init__(self):
+        self.records: list[dict] = []
+        self._lock = threading.Lock()
+
+    def add(self, record: dict) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def summary(self) -> list[dict]:
+        """Per endpoint ("METHOD path-template"): count, errors, bytes and p50/p95/max
+        of the request time in seconds, slowest total first."""
+        groups: dict[str, list[dict]] = {}
+        with self._lock:
+            for record in self.records:
+                groups.setdefault(f"{record['method']} {record['path']}", []).append(record)
+        rows = []
+        for endpoint, records in groups.items():
+            totals = sorted(r["total"] for r in records)
+            rows.append(
+                {
+                    "endpoint": endpoint,
+                    "count": len(records),
+                    "errors": sum(1 for r in records if not r["status"] or r["status"] >= 400),
+                    "bytes": sum(r["bytes"] for r in records),
+                    "p50": _percentile(totals, 0.50),
+                    "p95": _percentile(totals, 0.95),
+                    "max": totals[-1],
+                    "sum": sum(totals),
+                }
+            )
+        rows.sort(key=lambda row: row["sum"], reverse=True)
+        return rows
+
+    def report(self) -> str:
+        """Human-readable summary table (for stderr)."""
+        with self._lock:
+            records = list(self.records)
+        if not records:
+            return "stats: no API requests"
+        phases = {
+            name: sum(r[name] or 0.0 for r in records)
+            for name in ("queue", "connect", "tls", "ttfb", "total")
+        }
+        lines = [
+            f"stats: {len(records)} requests, {phases['total']:.3f}s in requests"
+            f" (queue {phases['queue']:.3f}s, connect {phases['connect']:.3f}s,"
+            f" tls {phases['tls']:.3f}s, ttfb {phases['ttfb']:.3f}s)",
+            f"{'endpoint':<48} {'count':>5} {'err':>4} {'p50':>8} {'p95':>8} {'max':>8}"
+            f" {'bytes':>9}",
+        ]
+        for row in self.summary():
+            lines.append(
+                f"{row['endpoint']:<48} {row['count']:>5} {row['errors']:>4}"
+                f" {row['p50']:>7.3f}s {row['p95']:>7.3f}s {row['max']:>7.3f}s"
+                f" {row['bytes']:>9}"
+            )
+        return "\n".join(lines)
+
+
+def _response_size(resp: requests.Response) -> int:
+    # Do not read streamed bodies just to measure them
+    if resp._content_consumed and isinstance(resp._content, bytes):
+        return len(resp._content)
+    return int(resp.headers.get("Content-Length") or 0)
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    return values[max(0, math.ceil(q * len(values)) - 1)]
+
+
+def enable() -> RequestStats:
+    """Start collecting request statistics; return the collector."""
+    global _collector
+    _collector = RequestStats()
+    return _collector
+
+
+def disable() -> None:
+    global _collector
+    _collector = None
+
+
+class Measurement:
+    """Set .response inside measure() so status, size and TTFB are recorded."""
+
+    response: requests.Response | None = None
+
+
+@contextmanager
+def measure(method: str, url: str, queue: float = 0.0) -> Iterator[Measurement]:
+    """Record one HTTP request made inside the block (no-op while stats are off).
+
+    Phases: queue (rate limiter wait, passed in), connect (DNS + TCP) and tls for
+    new connections, ttfb (time to response headers without connection setup) and
+    total (request time, excluding queue).
+    """
+    measurement = Measurement()
+    collector = _collector
+    if collector is None:
+        yield measurement
+        return
+    _local.connect = _local.tls = 0.0
+    started = time.perf_counter()
+    try:
+        yield measurement
+    finally:
+        total = time.perf_counter() - started
+        resp = measurement.response
+        connect, tls = _local.connect, _local.tls
+        ttfb = None
+        if resp is not None:
+            ttfb = max(0.0, resp.elapsed.total_seconds() - connect - tls)
+        collector.add(
+            {
+                "method": method.upper(),
+                "path": path_template(url),
+                "status": resp.status_code if resp is not None else None,
+                "bytes": _response_size(resp) if resp is not None else 0,
+                "queue": queue,
+                "connect": connect,
+                "tls": tls,
+                "ttfb": ttfb,
+                "total": total,
+            }
+        )
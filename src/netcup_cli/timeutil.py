@@ -0,0 +1,17 @@
+"""Timestamp helpers shared by API consumers."""
+
+from datetime import datetime, timezone
+
+
+def parse_timestamp(value: str | None) -> float | None:
+    """Epoch seconds of an ISO 8601 API timestamp ("Z" or offset; naive is UTC),
+    or None when value is empty or not a timestamp."""
+    if not value:
+        return None
+    try:
+        when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
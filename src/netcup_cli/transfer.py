@@ -0,0 +1,596 @@
+"""Parallel transfers of user images and ISOs to and from the S3 object store.
+
+Uploads use the SCP multipart flow: start an upload, PUT each part to its own
+presigned URL (several at a time, streamed from the file) and complete it with the
+parts' ETags. Downloads fetch byte ranges of the presigned download URL in parallel
+and write them in place into a preallocated file. Progress is kept in a state file
+in the config dir, so running the same transfer again after an interruption only
+moves the missing parts. sync_plan()/run_sync() mirror a local directory into the
+object store, uploading only new or changed files.
+"""
+
+import hashlib
+import json
+import math
+import os
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from .api import user_images, user_isos
+from .api.base import get_client
+from .concurrency import fan_out
+from .config import (
+    DOWNLOAD_CHUNK_SIZE,
+    FANOUT_MAX_CONCURRENCY,
+    TRANSFER_WORKERS,
+    UPLOAD_MAX_PARTS,
+    UPLOAD_MIN_PART_SIZE,
+    UPLOAD_PART_SIZE,
+    transfer_state_dir,
+)
+from .exceptions import APIError
+from .session import create_session
+from .stats import measure
+from .timeutil import parse_timestamp
+
+# (start, part_url, complete) API functions per object kind
+_MULTIPART = {
+    "images": (
+        user_images.user_image_upload_start,
+        user_images.user_image_upload_part_url,
+        user_images.user_image_upload_complete,
+    ),
+    "isos": (
+        user_isos.user_iso_upload_start,
+        user_isos.user_iso_upload_part_url,
+        user_isos.user_iso_upload_complete,
+    ),
+}
+
+# (list, download_info) API functions per object kind
+_DOWNLOAD = {
+    "images": (user_images.user_images_list, user_images.user_image_download_info),
+    "isos": (user_isos.user_isos_list, user_isos.user_iso_download_info),
+}
+
+# Delete API function per object kind
+_DELETE = {
+    "images": user_images.user_image_delete,
+    "isos": user_isos.user_iso_delete,
+}
+
+# Connect and read timeouts (seconds) for requests to presigned URLs
+_TIMEOUT = (30, 300)
+
+# S3 answers 500 InternalError for transient failures as well
+_RETRY_STATUSES = frozenset({500})
+
+_MIB = 1024 * 1024
+
+
+class _FileSlice:
+    """Read-only stream of `length` bytes of a file from `offset`, so a part is
+    sent from disk in small blocks instead of being read into memory."""
+
+    def __init__(self, path: Path, offset: int, length: int):
+        self._file = open(path, "rb")
+        self._file.seek(offset)
+        self._length = length
+        self._remaining = length
+
+    def __len__(self) -> int:
+        # requests takes the Content-Length from len()
+        return self._length
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _presigned_request(
+    session: requests.Session,
+    method: str,
+    url: str,
+    *,
+    body: Callable[[], Any] | None = None,
+    headers: dict[str, str] | None = None,
+    stream: bool = False,
+) -> requests.Response:
+    """Send a request to a presigned S3 URL (no API token), retrying transient
+    failures per the shared client's retry policy. body() returns a fresh request
+    body for each attempt."""
+    policy = get_client().retry_policy
+    statuses = policy.statuses | _RETRY_STATUSES
+    attempt = 0
+    while True:
+        attempt += 1
+        data = body() if body is not None else None
+        try:
+            with measure(method, url) as measurement:
+                resp = session.request(
+                    method, url, data=data, headers=headers, stream=stream, timeout=_TIMEOUT
+                )
+                measurement.response = resp
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt < policy.attempts:
+                time.sleep(policy.delay(attempt))
+                continue
+            raise APIError(f"Request failed: {e}", attempts=attempt) from e
+        finally:
+            if data is not None:
+                data.close()
+        if resp.status_code in statuses and attempt < policy.attempts:
+            resp.close()
+            time.sleep(policy.delay(attempt, resp))
+            continue
+        if not resp.ok:
+            suffix = f" (after {attempt} attempts)" if attempt > 1 else ""
+            raise APIError(
+                f"Storage error: {resp.status_code}{suffix}",
+                status_code=resp.status_code,
+                body=resp.text,
+                attempts=attempt,
+            )
+        return resp
+
+
+def choose_part_size(size: int, part_size: int | None = None) -> int:
+    """Part size in bytes for a file of `size` bytes: part_size (default
+    UPLOAD_PART_SIZE), at least UPLOAD_MIN_PART_SIZE, and grown to whole MiB so the
+    file fits in UPLOAD_MAX_PARTS parts."""
+    part_size = max(part_size or UPLOAD_PART_SIZE, UPLOAD_MIN_PART_SIZE)
+    needed = math.ceil(size / UPLOAD_MAX_PARTS)
+    if part_size < needed:
+        part_size = math.ceil(needed / _MIB) * _MIB
+    return part_size
+
+
+def _state_path(direction: str, kind: str, user_id: int, key: str, path: Path) -> Path:
+    ident = f"{user_id}:{kind}:{key}:{Path(path).resolve()}"
+    digest = hashlib.sha256(ident.encode()).hexdigest()[:24]
+    return transfer_state_dir() / f"{direction}-{digest}.json"
+
+
+def upload_state_path(kind: str, user_id: int, key: str, path: Path) -> Path:
+    """Resume state file of uploading path to key."""
+    return _state_path("upload", kind, user_id, key, path)
+
+
+def download_state_path(kind: str, user_id: int, key: str, dest: Path) -> Path:
+    """Resume state file of downloading key to dest."""
+    return _state_path("download", kind, user_id, key, dest)
+
+
+def _read_state(state_path: Path) -> dict | None:
+    try:
+        return json.loads(state_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _load_state(state_path: Path, stat: os.stat_result) -> dict | None:
+    """State of an unfinished upload of the file, unless the file changed since."""
+    state = _read_state(state_path)
+    if state is None:
+        return None
+    if state.get("size") != stat.st_size or state.get("mtime") != stat.st_mtime_ns:
+        return None
+    return state
+
+
+def _save_state(state_path: Path, state: dict) -> None:
+    tmp = state_path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state))
+    os.replace(tmp, state_path)
+
+
+def _part_range(number: int, part_size: int, size: int) -> tuple[int, int]:
+    """(offset, length) of 1-based part `number`."""
+    offset = (number - 1) * part_size
+    return offset, max(0, min(part_size, size - offset))
+
+
+def _upload_parts(
+    kind: str,
+    user_id: int,
+    key: str,
+    path: Path,
+    state: dict,
+    state_path: Path,
+    workers: int,
+    on_progress: Callable[[int, int], None] | None,
+) -> None:
+    _, part_url, complete = _MULTIPART[kind]
+    size, part_size, upload_id = state["size"], state["partSize"], state["uploadId"]
+    count = max(1, math.ceil(size / part_size))
+    done = state["parts"]
+    sent = sum(_part_range(int(n), part_size, size)[1] for n in done)
+    if on_progress is not None:
+        on_progress(sent, size)
+    session = create_session(workers)
+    errors: list[BaseException] = []
+
+    def upload_part(number: int) -> str:
+        offset, length = _part_range(number, part_size, size)
+        url = part_url(user_id, key, upload_id, number)
+        resp = _presigned_request(
+            session, "PUT", url, body=lambda: _FileSlice(path, offset, length)
+        )
+        resp.close()
+        etag = resp.headers.get("ETag")
+        if not etag:
+            raise APIError(f"No ETag in response to part {number}")
+        return etag
+
+    def pending() -> Iterator[int]:
+        for number in range(1, count + 1):
+            if errors:
+                return
+            if str(number) not in done:
+                yield number
+
+    try:
+        # Parts already in flight when one fails still finish and are recorded
+        for number, etag, error in fan_out(upload_part, pending(), max_workers=workers):
+            if error is not None:
+                errors.append(error)
+                continue
+            done[str(number)] = etag
+            _save_state(state_path, state)
+            sent += _part_range(number, part_size, size)[1]
+            if on_progress is not None:
+                on_progress(sent, size)
+    finally:
+        session.close()
+    if errors:
+        raise errors[0]
+    parts = [{"ETag": done[str(n)], "partNumber": n} for n in range(1, count + 1)]
+    complete(user_id, key, upload_id, parts)
+
+
+def upload_file(
+    kind: str,
+    user_id: int,
+    key: str,
+    path: str | Path,
+    *,
+    part_size: int | None = None,
+    workers: int = TRANSFER_WORKERS,
+    resume: bool = True,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> dict:
+    """Upload a file as user object `key` of kind "images" or "isos" with a
+    multipart upload of `workers` parts at a time.
+
+    An unfinished upload of the same file to the same key is resumed (unless
+    resume=False or the file changed), keeping its part size. on_progress(sent,
+    total) is called with byte counts as parts complete. Returns a summary:
+    {"key", "size", "partSize", "parts", "resumedParts", "elapsed"}.
+    """
+    if kind not in _MULTIPART:
+        raise ValueError(f"Unknown object kind: {kind}")
+    start = _MULTIPART[kind][0]
+    path = Path(path)
+    stat = path.stat()
+    started = time.monotonic()
+    transfer_state_dir().mkdir(parents=True, exist_ok=True)
+    state_path = upload_state_path(kind, user_id, key, path)
+    state = _load_state(state_path, stat) if resume else None
+    resumed = len(state["parts"]) if state else 0
+    stored = state is not None
+    while True:
+        if state is None:
+            state = {
+                "kind": kind,
+                "key": key,
+                "path": str(path.resolve()),
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "partSize": choose_part_size(stat.st_size, part_size),
+                "uploadId": start(user_id, key),
+                "parts": {},
+            }
+            _save_state(state_path, state)
+        try:
+            _upload_parts(kind, user_id, key, path, state, state_path, workers, on_progress)
+            break
+        except APIError as e:
+            # The stored upload expired or was aborted (even one without any
+            # completed part): start over once
+            if not stored or e.status_code != 404:
+                raise
+            state, resumed, stored = None, 0, False
+    state_path.unlink(missing_ok=True)
+    return {
+        "key": key,
+        "size": state["size"],
+        "partSize": state["partSize"],
+        "parts": len(state["parts"]),
+        "resumedParts": resumed,
+        "elapsed": round(time.monotonic() - started, 3),
+    }
+
+
+def find_object(kind: str, user_id: int, key: str) -> dict:
+    """Listing entry (S3Object) of user object `key`; APIError 404 if missing."""
+    list_objects = _DOWNLOAD[kind][0]
+    for obj in list_objects(user_id):
+        if obj.get("key") == key:
+            return obj
+    raise APIError(f"No such {kind[:-1]}: {key}", status_code=404)
+
+
+def object_size(obj: dict) -> int:
+    """Size in bytes of a listing entry (sizeInB; older responses use size)."""
+    return int(obj.get("sizeInB", obj.get("size", 0)))
+
+
+def _download_chunk(
+    session: requests.Session,
+    url: str,
+    headers: dict[str, str],
+    fd: int,
+    offset: int,
+    length: int,
+    size: int,
+) -> None:
+    """Fetch bytes [offset, offset + length) and write them at offset into fd."""
+    end = offset + length - 1
+    resp = _presigned_request(
+        session, "GET", url, headers={**headers, "Range": f"bytes={offset}-{end}"}, stream=True
+    )
+    with resp:
+        if resp.status_code != 206:
+            if not (resp.status_code == 200 and offset == 0 and length == size):
+                raise APIError(f"Storage did not honour range request ({resp.status_code})")
+        else:
+            expected = f"bytes {offset}-{end}/{size}"
+            if resp.headers.get("Content-Range") != expected:
+                raise APIError(
+                    f"Unexpected Content-Range {resp.headers.get('Content-Range')!r}"
+                    f" (expected {expected!r}; object changed?)"
+                )
+        position = offset
+        try:
+            for block in resp.iter_content(_MIB):
+                if position + len(block) > offset + length:
+                    raise APIError("Storage sent more data than requested")
+                os.pwrite(fd, block, position)
+                position += len(block)
+        except requests.RequestException as e:
+            raise APIError(f"Download interrupted: {e}") from e
+    if position != offset + length:
+        raise APIError(f"Short read: got {position - offset} of {length} bytes at {offset}")
+
+
+def download_file(
+    kind: str,
+    user_id: int,
+    key: str,
+    dest: str | Path,
+    *,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    workers: int = TRANSFER_WORKERS,
+    resume: bool = True,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> dict:
+    """Download user object `key` of kind "images" or "isos" to dest (a file, or a
+    directory to put `key` in) with `workers` ranged GETs at a time.
+
+    Ranges are written in place into a preallocated "<dest>.part" file, which is
+    renamed to dest once its size matches the listing's sizeInB. An interrupted
+    download of the same object to the same dest is resumed unless resume=False
+    or the object changed. on_progress(received, total) is called with byte
+    counts. Returns {"key", "path", "size", "chunks", "resumedChunks", "elapsed"}.
+    """
+    if kind not in _DOWNLOAD:
+        raise ValueError(f"Unknown object kind: {kind}")
+    download_info = _DOWNLOAD[kind][1]
+    dest = Path(dest)
+    if dest.is_dir():
+        dest = dest / key
+    partial = dest.with_name(dest.name + ".part")
+    started = time.monotonic()
+    obj = find_object(kind, user_id, key)
+    size = object_size(obj)
+    info = download_info(user_id, key)
+    url = info.get("presignedUrl")
+    if not url:
+        raise APIError(f"No download URL for {key}")
+    # S3DownloadInfos.headers: header name -> values to send with the request
+    headers = {name: ", ".join(values) for name, values in (info.get("headers") or {}).items()}
+
+    transfer_state_dir().mkdir(parents=True, exist_ok=True)
+    state_path = download_state_path(kind, user_id, key, dest)
+    state = _read_state(state_path) if resume else None
+    if (
+        state is None
+        or state.get("size") != size
+        or state.get("lastModified") != obj.get("lastModified")
+        or not partial.exists()
+        or partial.stat().st_size != size
+    ):
+        state = {
+            "kind": kind,
+            "key": key,
+            "path": str(dest.resolve()),
+            "size": size,
+            "lastModified": obj.get("lastModified"),
+            "chunkSize": max(chunk_size, _MIB),
+            "chunks": [],
+        }
+        with open(partial, "wb") as f:
+            f.truncate(size)
+        _save_state(state_path, state)
+    chunk_size = state["chunkSize"]
+    count = math.ceil(size / chunk_size)
+    done = set(state["chunks"])
+    resumed = len(done)
+    received = sum(_part_range(n, chunk_size, size)[1] for n in done)
+    if on_progress is not None:
+        on_progress(received, size)
+    errors: list[BaseException] = []
+
+    def pending() -> Iterator[int]:
+        for number in range(1, count + 1):
+            if errors:
+                return
+            if number not in done:
+                yield number
+
+    session = create_session(workers)
+    fd = os.open(partial, os.O_RDWR)
+    try:
+
+        def fetch(number: int) -> None:
+            offset, length = _part_range(number, chunk_size, size)
+            _download_chunk(session, url, headers, fd, offset, length, size)
+
+        for number, _, error in fan_out(fetch, pending(), max_workers=workers):
+            if error is not None:
+                errors.append(error)
+                continue
+            done.add(number)
+            state["chunks"] = sorted(done)
+            _save_state(state_path, state)
+            received += _part_range(number, chunk_size, size)[1]
+            if on_progress is not None:
+                on_progress(received, size)
+        if not errors:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+        session.close()
+    if errors:
+        raise errors[0]
+    if partial.stat().st_size != size:
+        raise APIError(f"Size mismatch: {partial} has {partial.stat().st_size} of {size} bytes")
+    os.replace(partial, dest)
+    state_path.unlink(missing_ok=True)
+    return {
+        "key": key,
+        "path": str(dest),
+        "size": size,
+        "chunks": count,
+        "resumedChunks": resumed,
+        "elapsed": round(time.monotonic() - started, 3),
+    }
+
+
+def sync_plan(kind: str, user_id: int, directory: str | Path, *, delete: bool = False) -> list:
+    """Compare the files in directory with the user's objects of kind "images" or
+    "isos"; return one step per key, sorted by key:
+    {"key", "action": "upload"|"delete"|"skip", "reason", "size", "path"?}.
+
+    A file is uploaded when it is missing remotely ("new"), its size differs
+    ("size") or it was modified after the object's lastModified ("newer").
+    Objects without a local file are deleted with delete=True, else skipped
+    ("remote-only"). Hidden files, *.part files and subdirectories are ignored.
+    """
+    if kind not in _DOWNLOAD:
+        raise ValueError(f"Unknown object kind: {kind}")
+    list_objects = _DOWNLOAD[kind][0]
+    remote = {obj["key"]: obj for obj in list_objects(user_id)}
+    plan = []
+    for path in Path(directory).iterdir():
+        name = path.name
+        if name.startswith(".") or name.endswith(".part") or not path.is_file():
+            continue
+        stat = path.stat()
+        obj = remote.pop(name, None)
+        if obj is None:
+            action, reason = "upload", "new"
+        elif object_size(obj) != stat.st_size:
+            action, reason = "upload", "size"
+        else:
+            modified = parse_timestamp(obj.get("lastModified"))
+            if modified is not None and stat.st_mtime > modified:
+                action, reason = "upload", "newer"
+            else:
+                action, reason = "skip", "unchanged"
+        plan.append(
+            {
+                "key": name,
+                "action": action,
+                "reason": reason,
+                "size": stat.st_size,
+                "path": str(path),
+            }
+        )
+    for key, obj in remote.items():
+        action = "delete" if delete else "skip"
+        plan.append(
+            {"key": key, "action": action, "reason": "remote-only", "size": object_size(obj)}
+        )
+    plan.sort(key=lambda step: step["key"])
+    return plan
+
+
+def run_sync(
+    kind: str,
+    user_id: int,
+    plan: list,
+    *,
+    part_size: int | None = None,
+    workers: int = TRANSFER_WORKERS,
+    progress: Callable[[str], Callable[[int, int], None] | None] | None = None,
+) -> Iterator[dict]:
+    """Carry out the upload and delete steps of a sync_plan(); yield
+    {"key", "action", "ok", "result"|"error", "elapsed"} per step.
+
+    Files are uploaded one at a time, each with `workers` parts in parallel (and
+    resumable like upload_file); deletes then run `workers` at a time. A failed
+    step is reported and the others still run. progress(key) may return an
+    on_progress callback for that file's upload.
+    """
+    delete_object = _DELETE[kind]
+
+    def outcome(step: dict, started: float, result: Any, error: BaseException | None) -> dict:
+        out = {"key": step["key"], "action": step["action"], "ok": error is None}
+        if error is None:
+            out["result"] = result
+        else:
+            out["error"] = str(error)
+        out["elapsed"] = round(time.monotonic() - started, 3)
+        return out
+
+    for step in plan:
+        if step["action"] != "upload":
+            continue
+        started = time.monotonic()
+        try:
+            result = upload_file(
+                kind,
+                user_id,
+                step["key"],
+                step["path"],
+                part_size=part_size,
+                workers=workers,
+                on_progress=progress(step["key"]) if progress is not None else None,
+            )
+        except (APIError, OSError) as e:
+            yield outcome(step, started, None, e)
+        else:
+            yield outcome(step, started, result, None)
+
+    deletes = [step for step in plan if step["action"] == "delete"]
+    started: dict[str, float] = {}
+
+    def remove(step: dict) -> None:
+        started[step["key"]] = time.monotonic()
+        delete_object(user_id, step["key"])
+
+    # Deletes go through the shared API client, whose pool fits FANOUT_MAX_CONCURRENCY
+    workers = min(workers, FANOUT_MAX_CONCURRENCY)
+    for step, _, error in fan_out(remove, deletes, max_workers=workers):
+        yield outcome(step, started.pop(step["key"]), None, error)
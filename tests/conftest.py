@@ -0,0 +1,130 @@
+"""Shared fixtures: a local HTTP stub server standing in for the SCP API."""
+
+import json
+import threading
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+# A route answers with (status, headers, body); body is bytes, str or JSON data
+Reply = tuple[int, dict[str, str], Any]
+
+
+class StubServer:
+    """Threaded HTTP/1.1 server answering from a route table.
+
+    `routes` maps (method, path) to a fixed Reply or to fn(request) -> Reply.
+    Every request is recorded in `requests` as
+    {"method", "path", "query", "headers", "body", "port"} (port: the client's, to
+    tell connections apart).
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], Reply | Callable[[dict], Reply]] = {}
+        self.requests: list[dict] = []
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def route(self, method: str, path: str, reply: Reply | Callable[[dict], Reply]) -> None:
+        self.routes[(method, path)] = reply
+
+    def calls(self, method: str | None = None, path: str | None = None) -> list[dict]:
+        with self.lock:
+            return [
+                r
+                for r in self.requests
+                if (method is None or r["method"] == method) and (path is None or r["path"] == path)
+            ]
+
+    def _dispatch(self, request: dict) -> Reply:
+        with self.lock:
+            self.requests.append(request)
+        reply = self.routes.get((request["method"], request["path"]))
+        if reply is None:
+            return 404, {}, {"message": "not found"}
+        return reply(request) if callable(reply) else reply
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+            def _handle(self) -> None:
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                request = {
+                    "method": self.command,
+                    "path": url.path,
+                    "query": parse_qs(url.query),
+                    "headers": dict(self.headers),
+                    "body": self.rfile.read(length) if length else b"",
+                    "port": self.client_address[1],
+                }
+                status, headers, body = stub._dispatch(request)
+                if isinstance(body, str):
+                    body = body.encode()
+                elif not isinstance(body, bytes):
+                    body = json.dumps(body).encode() if body is not None else b""
+                    headers = {"Content-Type": "application/json", **headers}
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+        for method in ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"):
+            setattr(Handler, f"do_{method}", Handler._handle)
+        return Handler
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """Keep credentials, caches and state of every test in a temporary directory."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    monkeypatch.setenv("NETCUP_NO_DAEMON", "1")
+    return tmp_path / "config"
+
+
+@pytest.fixture
+def stub():
+    server = StubServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def api(stub, monkeypatch):
+    """Point the shared API client (also when rebuilt by the CLI) at the stub server
+    with a static token."""
+    from netcup_cli import client, client_setup
+    from netcup_cli.api import base
+
+    monkeypatch.setattr(client_setup, "_pending", None)
+    monkeypatch.setattr(base, "API_BASE_URL", stub.url)
+    monkeypatch.setattr(client, "get_access_token", lambda: "test-token")
+    base.configure_client(retry_policy=client.RetryPolicy(backoff=0.0, jitter=0.0))
+    yield base.get_client()
+    base._client_options.clear()
+    base.close_client()
@@ -0,0 +1,132 @@
+"""Asyncio client against the stub server, with a sync vs async benchmark."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from netcup_cli import aio
+from netcup_cli.aio import base as aio_base
+from netcup_cli.aio import user_failoverips
+from netcup_cli.api import base, servers
+
+LATENCY = 0.05
+
+
+class InFlight:
+    """Route handler answering GET /servers/{id} after LATENCY seconds, tracking
+    the peak number of concurrent requests."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __call__(self, request: dict):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(LATENCY)
+        with self.lock:
+            self.current -= 1
+        return 200, {}, {"id": int(request["path"].rsplit("/", 1)[1])}
+
+
+@pytest.fixture
+def aio_api(api, stub, monkeypatch):
+    monkeypatch.setattr(aio_base, "API_BASE_URL", stub.url)
+    yield
+    aio.close_async_client()
+
+
+def _serve_servers(stub, count: int) -> InFlight:
+    handler = InFlight()
+    for server_id in range(count):
+        stub.route("GET", f"/servers/{server_id}", handler)
+    return handler
+
+
+async def _get_all(count: int) -> list[dict]:
+    return await asyncio.gather(*(aio.server_get(i) for i in range(count)))
+
+
+def test_concurrency_is_bounded(stub, aio_api):
+    handler = _serve_servers(stub, 12)
+    aio.get_async_client(max_concurrency=4)
+
+    results = asyncio.run(_get_all(12))
+
+    assert [r["id"] for r in results] == list(range(12))
+    assert handler.peak == 4
+
+
+def test_many_coroutines_wait_on_the_loop_not_in_the_thread_pool(stub, aio_api):
+    handler = _serve_servers(stub, 100)
+    client = aio.get_async_client(max_concurrency=4)
+    queued = []
+
+    async def main() -> list[dict]:
+        tasks = asyncio.gather(*(aio.server_get(i) for i in range(100)))
+        for _ in range(5):
+            await asyncio.sleep(LATENCY / 2)
+            queued.append(client._executor._work_queue.qsize())
+        return await tasks
+
+    assert len(asyncio.run(main())) == 100
+    # A second event loop gets its own semaphore
+    assert len(asyncio.run(_get_all(8))) == 8
+    assert handler.peak == 4
+    assert max(queued) == 0
+
+
+def test_async_client_uses_configured_options(aio_api):
+    policy = base.get_client().retry_policy
+
+    client = aio.get_async_client()
+
+    assert client.sync_client.retry_policy is policy
+
+
+def test_failover_route_is_retried(stub, aio_api):
+    replies = iter([(503, {}, {}), (202, {}, {"uuid": "t1", "state": "RUNNING"})])
+    stub.route("PATCH", "/users/7/failoverips/v4/3", lambda request: next(replies))
+
+    task = asyncio.run(user_failoverips.failoverips_v4_route(7, 3, 1))
+
+    assert task["uuid"] == "t1"
+    assert len(stub.calls("PATCH")) == 2
+
+
+def test_benchmark_async_beats_sequential_sync(stub, aio_api):
+    count = 16
+    _serve_servers(stub, count)
+    aio.get_async_client(max_concurrency=count)
+
+    started = time.perf_counter()
+    for server_id in range(count):
+        servers.server_get(server_id)
+    sync_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    asyncio.run(_get_all(count))
+    async_elapsed = time.perf_counter() - started
+
+    print(
+        f"\n{count} GETs at {LATENCY * 1000:.0f} ms: sync {sync_elapsed:.3f}s, "
+        f"async {async_elapsed:.3f}s ({sync_elapsed / async_elapsed:.1f}x)"
+    )
+    assert sync_elapsed >= count * LATENCY
+    assert async_elapsed < sync_elapsed / 3
+
+
+def test_every_resource_module_is_exported():
+    for name in (
+        "failoverips_v4_route",
+        "metrics_cpu",
+        "interfaces_list",
+        "firewall_reapply",
+        "snapshots_list",
+        "server_get_many",
+    ):
+        assert callable(getattr(aio, name)) and name in aio.__all__
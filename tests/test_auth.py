@@ -0,0 +1,89 @@
+"""Access token cache and the 401 refresh-and-retry, against the stub server."""
+
+import stat
+from urllib.parse import parse_qs
+
+import pytest
+
+from netcup_cli import auth
+from netcup_cli.client import APIClient
+from netcup_cli.config import TOKEN_REFRESH_MARGIN, token_cache_path
+from netcup_cli.exceptions import APIError
+
+
+@pytest.fixture
+def token_server(stub, monkeypatch):
+    """Token endpoint issuing access-1, access-2, ... valid for `expires_in` seconds."""
+    monkeypatch.setattr(auth, "AUTH_URL", f"{stub.url}/auth")
+    monkeypatch.setattr(auth, "_token_cache", {})
+    auth.save_credentials("refresh-token")
+    stub.expires_in = 3600
+
+    def token(request):
+        form = parse_qs(request["body"].decode())
+        assert form["grant_type"] == ["refresh_token"]
+        issued = len(stub.calls("POST", "/auth/token"))
+        return 200, {}, {"access_token": f"access-{issued}", "expires_in": stub.expires_in}
+
+    stub.route("POST", "/auth/token", token)
+    return stub
+
+
+def _refreshes(stub) -> int:
+    return len(stub.calls("POST", "/auth/token"))
+
+
+def test_token_is_reused_until_the_refresh_margin(token_server):
+    assert auth.get_access_token() == auth.get_access_token() == "access-1"
+    assert _refreshes(token_server) == 1
+
+
+def test_token_inside_the_refresh_margin_is_refreshed(token_server):
+    token_server.expires_in = TOKEN_REFRESH_MARGIN - 1
+
+    assert auth.get_access_token() == "access-1"
+    assert auth.get_access_token() == "access-2"
+
+
+def test_disk_cache_is_private_and_shared_between_processes(token_server, monkeypatch):
+    auth.get_access_token()
+    mode = stat.S_IMODE(token_cache_path().stat().st_mode)
+    # A new process starts with an empty memory cache
+    monkeypatch.setattr(auth, "_token_cache", {})
+
+    assert auth.get_access_token() == "access-1"
+    assert mode == 0o600
+    assert _refreshes(token_server) == 1
+
+
+def test_disk_cache_can_be_disabled(token_server, monkeypatch):
+    monkeypatch.setenv("NETCUP_TOKEN_CACHE", "0")
+
+    auth.get_access_token()
+    monkeypatch.setattr(auth, "_token_cache", {})
+    auth.get_access_token()
+
+    assert not token_cache_path().exists()
+    assert _refreshes(token_server) == 2
+
+
+def test_401_refreshes_the_token_and_retries_once(token_server):
+    replies = iter([(401, {}, {"message": "expired"}), (200, {}, {"id": 1})])
+    token_server.route("GET", "/servers/1", lambda request: next(replies))
+
+    resp = APIClient(None, token_server.url).get("/servers/1")
+
+    assert resp.json() == {"id": 1}
+    auths = [r["headers"]["Authorization"] for r in token_server.calls("GET")]
+    assert auths == ["Bearer access-1", "Bearer access-2"]
+
+
+def test_repeated_401_is_not_retried_again(token_server):
+    token_server.route("GET", "/servers/1", (401, {}, {"message": "denied"}))
+
+    with pytest.raises(APIError) as excinfo:
+        APIClient(None, token_server.url).get("/servers/1")
+
+    assert excinfo.value.status_code == 401
+    assert len(token_server.calls("GET")) == 2
+    assert _refreshes(token_server) == 2
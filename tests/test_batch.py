@@ -0,0 +1,129 @@
+"""Batch runs of API operations against the stub server."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from netcup_cli import batch
+from netcup_cli.batch import read_operations, run_batch
+from netcup_cli.cli.main import cli
+
+
+@pytest.fixture
+def current_user(monkeypatch):
+    lookups = []
+
+    def get_current_user_id() -> int:
+        lookups.append(1)
+        return 42
+
+    monkeypatch.setattr(batch, "get_current_user_id", get_current_user_id)
+    return lookups
+
+
+def _run(records: list[dict], **kwargs) -> list[dict]:
+    return list(run_batch(records, max_workers=kwargs.pop("max_workers", 4), **kwargs))
+
+
+def test_result_records(stub, api):
+    stub.route("GET", "/servers/1", (200, {}, {"id": 1}))
+
+    ok, failed = sorted(
+        _run(
+            [
+                {"id": "a", "op": "servers.server_get", "args": {"server_id": 1}},
+                {"id": "b", "op": "server_get", "args": {"server_id": 2}},
+            ]
+        ),
+        key=lambda r: r["id"],
+    )
+
+    assert ok.keys() == {"id", "op", "ok", "result", "elapsed"}
+    assert ok["id"] == "a" and ok["ok"] and ok["result"] == {"id": 1}
+    assert failed.keys() == {"id", "op", "ok", "error", "status", "elapsed"}
+    assert not failed["ok"] and failed["status"] == 404 and failed["op"] == "server_get"
+
+
+def test_user_id_defaults_to_the_current_user(stub, api, current_user):
+    stub.route("GET", "/users/42/ssh-keys", (200, {}, [{"id": 1}]))
+    stub.route("GET", "/users/7/ssh-keys", (200, {}, []))
+    op = "user_ssh_keys.ssh_keys_list"
+
+    # One at a time, so identical GETs are not coalesced
+    results = _run([{"op": op}, {"op": op}, {"op": op, "args": {"user_id": 7}}], max_workers=1)
+
+    assert all(r["ok"] for r in results)
+    assert sorted(r["path"] for r in stub.calls()) == [
+        "/users/42/ssh-keys",
+        "/users/42/ssh-keys",
+        "/users/7/ssh-keys",
+    ]
+    assert len(current_user) == 1
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        "servers._private",
+        "servers.get_client",
+        "base.get_client",
+        "pagination.paginate",
+        "_internal.anything",
+        "os.system",
+        "nonexistent",
+        "",
+    ],
+)
+def test_unknown_or_private_operations_are_rejected(stub, api, op):
+    [result] = _run([{"op": op}])
+
+    assert not result["ok"]
+    assert result["error"].startswith("ValueError: Unknown operation")
+    assert stub.calls() == []
+
+
+def test_bad_arguments_fail_before_any_request(stub, api):
+    [result] = _run([{"op": "servers.server_get", "args": {"id": 1}}])
+
+    assert result["error"].startswith("TypeError")
+    assert stub.calls() == []
+
+
+def test_stop_on_error_starts_no_new_operations(stub, api):
+    stub.route("GET", "/servers/2", (200, {}, {"id": 2}))
+    records = [{"op": "servers.server_get", "args": {"server_id": i}} for i in (1, 2, 3)]
+
+    stopped = _run(records, max_workers=1, stop_on_error=True)
+    full = _run(records, max_workers=1)
+
+    assert [r["ok"] for r in stopped] == [False]
+    assert [r["ok"] for r in full] == [False, True, False]
+
+
+def test_invalid_lines_are_reported_with_their_line_number():
+    records = list(read_operations(["# comment", "", "{not json", "[1]", '{"op": "x"}']))
+
+    assert [r["id"] for r in records] == [3, 4, 5]
+    assert "Invalid JSON" in records[0]["error"]
+    assert records[1]["error"] == "Operation must be a JSON object"
+
+
+def test_cli_streams_results_and_exits_1_on_failure(stub, api, tmp_path):
+    stub.route("GET", "/servers/1", (200, {}, {"id": 1}))
+    ops = tmp_path / "ops.jsonl"
+    ops.write_text(
+        "\n".join(
+            json.dumps({"id": i, "op": "servers.server_get", "args": {"server_id": i}})
+            for i in (1, 2)
+        )
+    )
+
+    result = CliRunner().invoke(cli, ["batch", "run", str(ops)])
+
+    assert result.exit_code == 1
+    assert sorted((r["id"], r["ok"]) for r in json.loads(result.stdout)) == [
+        (1, True),
+        (2, False),
+    ]
+    assert "1 ok, 1 failed" in result.stderr
@@ -0,0 +1,125 @@
+"""APIClient retries and observers against the stub server."""
+
+import time
+
+import pytest
+import requests
+
+from netcup_cli import client as client_module
+from netcup_cli.client import APIClient, RetryPolicy
+from netcup_cli.exceptions import APIError
+
+
+def _response(headers: dict[str, str]) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 503
+    resp.headers.update(headers)
+    return resp
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waited: list[float] = []
+    monkeypatch.setattr(client_module.time, "sleep", waited.append)
+    return waited
+
+
+def test_retry_after_is_capped_at_max_backoff():
+    policy = RetryPolicy(max_backoff=5.0)
+    assert policy.delay(1, _response({"Retry-After": "3600"})) == 5.0
+    assert policy.delay(1, _response({"Retry-After": "2"})) == 2.0
+
+
+def test_retry_after_http_date_is_capped():
+    policy = RetryPolicy(max_backoff=5.0)
+    resp = _response({"Retry-After": "Fri, 31 Dec 2099 23:59:59 GMT"})
+    assert policy.delay(1, resp) == 5.0
+
+
+def test_backoff_grows_exponentially_without_jitter():
+    policy = RetryPolicy(backoff=1.0, max_backoff=3.0, jitter=0.0)
+    assert [policy.delay(n) for n in (1, 2, 3)] == [1.0, 2.0, 3.0]
+
+
+def test_transient_status_is_retried(stub, sleeps):
+    replies = iter([(503, {"Retry-After": "120"}, {}), (502, {}, {}), (200, {}, {"id": 1})])
+    stub.route("GET", "/servers/1", lambda request: next(replies))
+    client = APIClient("t", stub.url, retry_policy=RetryPolicy(max_backoff=7.0, jitter=0.0))
+
+    resp = client.get("/servers/1")
+
+    assert resp.json() == {"id": 1}
+    assert resp.attempts == 3
+    assert len(stub.calls("GET", "/servers/1")) == 3
+    assert sleeps[0] == 7.0
+
+
+def test_retries_give_up_after_attempts(stub, sleeps):
+    stub.route("GET", "/servers", (503, {}, {}))
+    client = APIClient("t", stub.url, retry_policy=RetryPolicy(attempts=3, backoff=0.0))
+
+    with pytest.raises(APIError) as excinfo:
+        client.get("/servers")
+
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.attempts == 3
+    assert len(stub.calls()) == 3
+
+
+def test_post_is_retried_only_when_opted_in(stub, sleeps):
+    stub.route("POST", "/servers/1/snapshots", (503, {}, {}))
+    client = APIClient("t", stub.url, retry_policy=RetryPolicy(attempts=3, backoff=0.0))
+
+    with pytest.raises(APIError):
+        client.post("/servers/1/snapshots", json={})
+    assert len(stub.calls()) == 1
+
+    with pytest.raises(APIError):
+        client.post("/servers/1/snapshots", json={}, retry=True)
+    assert len(stub.calls()) == 4
+
+
+def test_client_error_is_not_retried(stub, sleeps):
+    stub.route("GET", "/servers/9", (404, {}, {"message": "missing"}))
+    client = APIClient("t", stub.url, retry_policy=RetryPolicy(attempts=3))
+
+    with pytest.raises(APIError) as excinfo:
+        client.get("/servers/9")
+
+    assert excinfo.value.status_code == 404
+    assert len(stub.calls()) == 1
+    assert sleeps == []
+
+
+def test_get_client_base_url_override_keeps_options():
+    from netcup_cli.api import base
+
+    policy = RetryPolicy(attempts=5)
+    base.configure_client(retry_policy=policy)
+    try:
+        shared = base.get_client()
+        other = base.get_client("http://example.invalid/api")
+        assert other.retry_policy is policy
+        assert other.session is shared.session
+        assert other.base_url == "http://example.invalid/api"
+    finally:
+        base._client_options.clear()
+        base.close_client()
+
+
+def test_observers_time_only_the_http_request(stub):
+    class SlowLimiter:
+        def acquire(self) -> float:
+            time.sleep(0.3)
+            return 0.3
+
+    stub.route("GET", "/servers", (200, {}, []))
+    client = APIClient("t", stub.url, rate_limiter=SlowLimiter())
+    seen: list[tuple] = []
+    client.observers.append(lambda *args: seen.append(args))
+
+    client.get("/servers")
+
+    [(method, status, elapsed)] = seen
+    assert (method, status) == ("GET", 200)
+    assert elapsed < 0.25
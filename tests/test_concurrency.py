@@ -0,0 +1,58 @@
+"""AIMD controller, fan-out helpers and connection reuse under fan-out."""
+
+import asyncio
+import time
+
+from netcup_cli import aio
+from netcup_cli.aio import base as aio_base
+from netcup_cli.concurrency import AIMDController, fan_out
+from netcup_cli.config import FANOUT_MAX_CONCURRENCY
+
+
+def test_controller_grows_while_healthy_and_halves_on_overload():
+    controller = AIMDController(initial=4, maximum=8)
+    for _ in range(40):
+        controller.observe("GET", 200, 0.01)
+    assert controller.limit == 8
+
+    time.sleep(0.01)
+    controller.observe("GET", 429, 0.001)
+
+    assert controller.limit == 4
+    assert controller.summary()["decreases"] == 1
+
+
+def test_widest_fan_out_reuses_its_connections(stub, api):
+    def slow(request):
+        time.sleep(0.05)
+        return 200, {}, {}
+
+    stub.route("GET", "/servers/1", slow)
+    for _ in range(2):
+        results = list(
+            fan_out(
+                lambda n: api.get("/servers/1", params={"n": n}),
+                range(FANOUT_MAX_CONCURRENCY),
+                max_workers=FANOUT_MAX_CONCURRENCY,
+            )
+        )
+        assert all(error is None for _, _, error in results)
+
+    # A pool smaller than the fan-out would open new connections in the second round
+    assert len({r["port"] for r in stub.calls()}) == FANOUT_MAX_CONCURRENCY
+
+
+def test_async_server_get_many_returns_results_and_errors(stub, api, monkeypatch):
+    monkeypatch.setattr(aio_base, "API_BASE_URL", stub.url)
+    for server_id in (1, 2, 4):
+        stub.route("GET", f"/servers/{server_id}", (200, {}, {"id": server_id}))
+    controller = AIMDController(initial=2)
+    try:
+        results = asyncio.run(aio.server_get_many([1, 2, 3, 4], controller=controller))
+    finally:
+        aio.close_async_client()
+
+    by_id = {server_id: (server, error) for server_id, server, error in results}
+    assert {i: s["id"] for i, (s, e) in by_id.items() if e is None} == {1: 1, 2: 2, 4: 4}
+    assert by_id[3][1].status_code == 404
+    assert controller.summary()["requests"] == 4
@@ -0,0 +1,80 @@
+"""Launcher routing and the daemon's handling of forwarded commands."""
+
+import socket
+
+import pytest
+
+from netcup_cli import config, daemon, launcher
+from netcup_cli.cli import maintenance_cmd
+
+
+@pytest.fixture
+def daemon_running(tmp_path, monkeypatch):
+    sock = tmp_path / "daemon.sock"
+    sock.touch()
+    monkeypatch.setattr(launcher, "daemon_socket_path", lambda: sock)
+    monkeypatch.delenv("NETCUP_NO_DAEMON")
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["servers", "list"],
+        ["-o", "json", "servers", "get", "1"],
+        ["users", "images", "download-url", "7", "disk.qcow2"],
+        ["tasks", "list", "--all"],
+    ],
+)
+def test_short_commands_are_forwarded(daemon_running, argv):
+    assert launcher._should_forward(argv)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["auth", "login"],
+        ["tasks", "wait", "abc"],
+        ["--retries", "3", "users", "images", "upload", "7", "disk.qcow2"],
+        ["users", "isos", "download", "7", "a.iso"],
+        ["inventory", "sync"],
+        ["failover", "switch", "1", "2"],
+        ["servers", "set-hostname", "1", "web", "--wait"],
+        ["servers", "get", "--all"],
+        ["rdns", "apply", "-"],
+    ],
+)
+def test_long_running_commands_run_locally(daemon_running, argv):
+    assert not launcher._should_forward(argv)
+
+
+def _frames(conn: socket.socket) -> dict[bytes, bytes]:
+    out: dict[bytes, bytes] = {b"1": b"", b"2": b""}
+    while True:
+        channel, size = daemon._HEADER.unpack(daemon._recv_exact(conn, daemon._HEADER.size))
+        data = daemon._recv_exact(conn, size)
+        if channel == b"x":
+            return {**out, b"x": data}
+        out[channel] += data
+
+
+def test_unexpected_error_is_reported_to_the_client(monkeypatch, capfd):
+    def broken():
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(maintenance_cmd, "get_maintenance", broken)
+    server, client = socket.socketpair()
+    with server, client:
+        code = daemon._run_command(server, {"argv": ["maintenance", "info"]})
+        daemon._send_frame(server, b"x", str(code).encode())
+
+        frames = _frames(client)
+
+    assert frames[b"x"] == b"1"
+    assert b"RuntimeError: boom" in frames[b"2"]
+    assert "RuntimeError: boom" in capfd.readouterr().err
+
+
+def test_token_cache_setting_is_read_per_call(monkeypatch):
+    assert config.token_cache_on_disk()
+    monkeypatch.setenv("NETCUP_TOKEN_CACHE", "0")
+    assert not config.token_cache_on_disk()
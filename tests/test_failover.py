@@ -0,0 +1,140 @@
+"""Failover switch planning and routing against the stub server."""
+
+import json
+
+from click.testing import CliRunner
+
+from netcup_cli.api import task_wait
+from netcup_cli.cli.main import cli
+from netcup_cli.failover import plan_switch, switch_failover
+from netcup_cli.inventory import Inventory
+
+USER = 7
+
+
+def _ip(id: int, ip: str, server: int, name: str) -> dict:
+    return {"id": id, "ip": ip, "cidrSuffix": 32, "server": {"id": server, "name": name}}
+
+
+def _serve(stub, live: dict[int, dict]) -> None:
+    """Failover IPv4 list (filtered by ip / serverId), PATCH routes and tasks."""
+
+    def list_v4(request):
+        query = request["query"]
+        records = list(live.values())
+        if "ip" in query:
+            records = [r for r in records if r["ip"] == query["ip"][0]]
+        if "serverId" in query:
+            records = [r for r in records if str(r["server"]["id"]) == query["serverId"][0]]
+        return 200, {}, records
+
+    def route(id):
+        def patch(request):
+            server = json.loads(request["body"])["serverId"]
+            live[id] = {**live[id], "server": {"id": server, "name": f"srv{server}"}}
+            return 202, {}, {"uuid": f"task-{id}", "state": "RUNNING"}
+
+        return patch
+
+    stub.route("GET", f"/users/{USER}/failoverips/v4", list_v4)
+    stub.route("GET", f"/users/{USER}/failoverips/v6", (200, {}, []))
+    for id in live:
+        stub.route("PATCH", f"/users/{USER}/failoverips/v4/{id}", route(id))
+        stub.route(
+            "GET", f"/tasks/task-{id}", (200, {}, {"uuid": f"task-{id}", "state": "FINISHED"})
+        )
+
+
+def _sync_inventory(records: list[dict]) -> None:
+    with Inventory() as inventory:
+        inventory.store("failoverips_v4", USER, records)
+        inventory.store("failoverips_v6", USER, [])
+
+
+def test_plan_reads_the_api_without_inventory(stub, api):
+    _serve(stub, {1: _ip(1, "192.0.2.1", 10, "srv10"), 2: _ip(2, "192.0.2.2", 11, "srv11")})
+
+    plan = plan_switch(USER, 10)
+
+    assert plan["source"] == "api"
+    assert [(r["id"], r["address"], r["source"]) for r in plan["routes"]] == [
+        (1, "192.0.2.1/32", "api")
+    ]
+
+
+def test_inventory_plan_is_routed_without_rereading(stub, api):
+    _sync_inventory([_ip(1, "192.0.2.1", 10, "srv10"), _ip(2, "192.0.2.2", 10, "srv10")])
+    _serve(stub, {1: _ip(1, "192.0.2.1", 10, "srv10"), 2: _ip(2, "192.0.2.2", 10, "srv10")})
+
+    result = switch_failover(USER, 10, 20, wait=False)
+
+    assert result["source"] == "inventory"
+    assert all(r["ok"] and r["state"] == "RUNNING" for r in result["routes"])
+    assert sorted(r["path"] for r in stub.calls()) == [
+        f"/users/{USER}/failoverips/v4/1",
+        f"/users/{USER}/failoverips/v4/2",
+    ]
+
+
+def test_polling_failure_still_reports_every_route(stub, api, monkeypatch):
+    monkeypatch.setattr(task_wait.time, "sleep", lambda seconds: None)
+    _sync_inventory([_ip(i, f"192.0.2.{i}", 10, "srv10") for i in (1, 2, 3)])
+    _serve(stub, {i: _ip(i, f"192.0.2.{i}", 10, "srv10") for i in (1, 2, 3)})
+    # First tick: tasks 2 and 3 still run, task 1 has finished; then the API fails
+    running = [{"uuid": f"task-{i}", "state": "RUNNING"} for i in (2, 3)]
+
+    def task_list(request):
+        if request["query"]["state"] == ["RUNNING"] and running:
+            return 200, {}, [running.pop(), running.pop()]
+        if len(stub.calls("GET", "/tasks")) <= 3:
+            return 200, {}, []
+        return 500, {}, {"message": "down"}
+
+    stub.route("GET", "/tasks", task_list)
+
+    result = switch_failover(USER, 10, 20)
+
+    routes = {r["id"]: r for r in result["routes"]}
+    assert "500" in result["error"]
+    assert routes[1]["ok"] and routes[1]["state"] == "FINISHED"
+    for id in (2, 3):
+        assert not routes[id]["ok"] and routes[id]["task"] == f"task-{id}"
+        assert routes[id]["error"] == result["error"]
+    assert set(result["timings"]) == {"plan", "route", "tasks", "total"}
+    with Inventory() as inventory:
+        servers = {r["id"]: r["server"]["id"] for r in inventory.load("failoverips_v4", USER)}
+    assert servers == {1: 20, 2: 10, 3: 10}
+
+
+def test_cli_exits_non_zero_after_a_polling_failure(stub, api, monkeypatch):
+    monkeypatch.setattr(task_wait.time, "sleep", lambda seconds: None)
+    _serve(stub, {i: _ip(i, f"192.0.2.{i}", 10, "srv10") for i in (1, 2)})
+    stub.route("GET", "/tasks", (500, {}, {"message": "down"}))
+
+    result = CliRunner().invoke(
+        cli, ["failover", "switch", "--user-id", str(USER), "--from", "10", "--to", "20"]
+    )
+
+    assert result.exit_code == 1
+    assert [r["id"] for r in json.loads(result.stdout)["routes"]] == [1, 2]
+    assert "Polling the tasks failed" in result.stderr
+
+
+def test_inventory_rows_are_refreshed_from_the_api(stub, api):
+    _sync_inventory([_ip(1, "192.0.2.1", 10, "srv10")])
+    _serve(stub, {1: _ip(1, "192.0.2.1", 10, "srv10")})
+
+    switch_failover(USER, 10, 20)
+
+    with Inventory() as inventory:
+        assert inventory.load("failoverips_v4", USER) == [_ip(1, "192.0.2.1", 20, "srv20")]
+    assert plan_switch(USER, 20)["routes"][0]["id"] == 1
+
+
+def test_stale_inventory_is_not_used(stub, api):
+    _sync_inventory([_ip(1, "192.0.2.1", 10, "srv10")])
+    _serve(stub, {1: _ip(1, "192.0.2.1", 20, "srv20")})
+
+    plan = plan_switch(USER, 10, max_age=0)
+
+    assert plan == {"source": "api", "routes": []}
@@ -0,0 +1,80 @@
+"""GET response cache: TTL hits, ETag revalidation and invalidation by writes."""
+
+import pytest
+
+from netcup_cli.client import APIClient
+from netcup_cli.http_cache import ResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with ResponseCache(tmp_path / "cache.sqlite3", ttls=((r"^/maintenance$", 300),)) as cache:
+        yield cache
+
+
+@pytest.fixture
+def etag_server(stub):
+    """GET /servers/1 with an ETag, answering 304 to a matching If-None-Match."""
+    state = {"etag": '"v1"', "body": {"id": 1, "hostname": "a"}}
+
+    def get(request):
+        if request["headers"].get("If-None-Match") == state["etag"]:
+            return 304, {"ETag": state["etag"]}, b""
+        return 200, {"ETag": state["etag"]}, state["body"]
+
+    def patch(request):
+        state.update(etag='"v2"', body={"id": 1, "hostname": "b"})
+        return 204, {}, None
+
+    stub.route("GET", "/servers/1", get)
+    stub.route("PATCH", "/servers/1", patch)
+    return stub
+
+
+def test_ttl_hit_sends_no_request(stub, cache):
+    stub.route("GET", "/maintenance", (200, {}, {"status": "ok"}))
+    client = APIClient("t", stub.url, cache=cache)
+
+    first = client.get("/maintenance")
+    second = client.get("/maintenance")
+
+    assert first.json() == second.json() == {"status": "ok"}
+    assert second.headers["X-Netcup-Cache"] == "hit"
+    assert len(stub.calls()) == 1
+
+
+def test_etag_revalidation_returns_the_cached_body(etag_server, cache):
+    client = APIClient("t", etag_server.url, cache=cache)
+
+    client.get("/servers/1")
+    resp = client.get("/servers/1")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"id": 1, "hostname": "a"}
+    assert resp.headers["X-Netcup-Cache"] == "revalidated"
+    [_, revalidation] = etag_server.calls("GET")
+    assert revalidation["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_patch_invalidates_the_resource(etag_server, cache):
+    client = APIClient("t", etag_server.url, cache=cache)
+
+    client.get("/servers/1")
+    client.patch("/servers/1", json={"hostname": "b"})
+    resp = client.get("/servers/1")
+
+    assert resp.json() == {"id": 1, "hostname": "b"}
+    assert "X-Netcup-Cache" not in resp.headers
+    assert "If-None-Match" not in etag_server.calls("GET")[-1]["headers"]
+
+
+def test_invalidate_drops_parent_collection_and_children(stub, cache):
+    stub.route("GET", "/servers", (200, {"ETag": '"l"'}, []))
+    stub.route("GET", "/servers/1/disks", (200, {"ETag": '"d"'}, []))
+    stub.route("GET", "/servers/2", (200, {"ETag": '"s"'}, {}))
+    client = APIClient("t", stub.url, cache=cache)
+    for path in ("/servers", "/servers/1/disks", "/servers/2"):
+        client.get(path)
+
+    assert cache.invalidate("/servers/1") == 2
+    assert cache.get(cache.key(f"{stub.url}/servers/2")) is not None
@@ -0,0 +1,98 @@
+"""Startup cost: the CLI must not import the API stack for commands that do not
+use it."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from netcup_cli.cli.main import cli
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+HEAVY_MODULES = (
+    "requests",
+    "netcup_cli.api",
+    "netcup_cli.client",
+    "netcup_cli.http_cache",
+    "netcup_cli.ratelimit",
+)
+
+PROBE = """
+import sys
+from netcup_cli.cli.main import cli
+
+@cli.command("noop")
+def noop():
+    pass
+
+cli(["--retries", "4", "--cache", "--rate-limit", "5", "noop"], standalone_mode=False)
+print(" ".join(m for m in {modules!r} if m in sys.modules))
+"""
+
+
+# Loaded only by the commands (and helpers) that use them
+COMMAND_MODULES = (
+    "sqlite3",
+    "netcup_cli.inventory",
+    "netcup_cli.api.task_wait",
+    "netcup_cli.rdns_apply",
+)
+
+HELP_PROBE = """
+import contextlib
+import io
+import sys
+from netcup_cli.cli.main import cli
+
+with contextlib.redirect_stdout(io.StringIO()):
+    for args in (["servers", "--help"], ["rdns", "apply", "--help"]):
+        cli(args, standalone_mode=False)
+print(" ".join(m for m in {modules!r} if m in sys.modules))
+"""
+
+
+def _run_probe(probe: str = PROBE, modules: tuple[str, ...] = HEAVY_MODULES) -> str:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(SRC), os.environ.get("PYTHONPATH", "")]),
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", probe.format(modules=modules)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_root_callback_does_not_import_the_api_stack():
+    assert _run_probe() == ""
+
+
+def test_command_help_does_not_import_helper_dependencies():
+    assert _run_probe(HELP_PROBE, COMMAND_MODULES) == ""
+
+
+def test_root_options_apply_when_the_client_is_built(api):
+    from netcup_cli.api.base import get_client
+
+    seen = {}
+
+    @cli.command("probe-client")
+    def probe_client():
+        client = get_client()
+        seen["attempts"] = client.retry_policy.attempts
+        seen["limiter"] = client.rate_limiter
+
+    try:
+        result = CliRunner().invoke(cli, ["--retries", "4", "--rate-limit", "5", "probe-client"])
+    finally:
+        cli.commands.pop("probe-client")
+
+    assert result.exit_code == 0, result.output
+    assert seen["attempts"] == 5
+    assert seen["limiter"] is not None
@@ -0,0 +1,108 @@
+"""SQLite inventory: storing, change detection, max age and --cached reads."""
+
+import pytest
+from click.testing import CliRunner
+
+from netcup_cli import inventory as inventory_module
+from netcup_cli.cli.main import cli
+from netcup_cli.inventory import Inventory, sync_inventory
+
+IFACES = [{"mac": "aa", "vlan": 1}, {"mac": "bb", "vlan": 2}]
+
+
+@pytest.fixture
+def inventory(tmp_path):
+    with Inventory(tmp_path / "inventory.sqlite3") as inventory:
+        yield inventory
+
+
+def test_store_and_load_keep_records_in_order(inventory):
+    records = [{"id": 3, "name": "c"}, {"id": 1, "name": "a"}]
+
+    assert inventory.store("servers", "", records) == {
+        "added": 2,
+        "changed": 0,
+        "removed": 0,
+        "unchanged": 0,
+    }
+    assert inventory.load("servers") == records
+    assert inventory.load("servers", "other") is None
+    assert inventory.load("vlans", 7) is None
+
+
+def test_store_writes_only_changes(inventory):
+    inventory.store("servers", "", [{"id": 1, "name": "a"}, {"id": 2}, {"id": 3}])
+
+    counts = inventory.store("servers", "", [{"id": 3}, {"id": 1, "name": "b"}, {"id": 4}])
+
+    assert counts == {"added": 1, "changed": 1, "removed": 1, "unchanged": 1}
+    assert inventory.load("servers") == [{"id": 3}, {"id": 1, "name": "b"}, {"id": 4}]
+
+
+def test_update_touches_only_cached_records(inventory):
+    inventory.store("failoverips_v4", 7, [{"id": 1, "server": 10}, {"id": 2, "server": 10}])
+
+    assert inventory.update("failoverips_v4", 7, [{"id": 2, "server": 20}, {"id": 9}]) == 1
+    assert inventory.load("failoverips_v4", 7) == [
+        {"id": 1, "server": 10},
+        {"id": 2, "server": 20},
+    ]
+
+
+def test_load_honours_max_age(inventory, monkeypatch):
+    inventory.store("vlans", 7, [{"vlanId": 1}])
+    synced = inventory_module.time.time()
+    monkeypatch.setattr(inventory_module.time, "time", lambda: synced + 120)
+
+    assert inventory.load("vlans", 7, max_age=300) == [{"vlanId": 1}]
+    assert inventory.load("vlans", 7, max_age=60) is None
+    assert inventory.status() == [{"kind": "vlans", "scope": "7", "records": 1, "ageSeconds": 120}]
+
+
+def test_sync_stores_servers_and_their_interfaces(stub, api):
+    stub.route("GET", "/servers", (200, {}, [{"id": 1}, {"id": 2}]))
+    stub.route("GET", "/servers/1/interfaces", (200, {}, IFACES))
+    stub.route("GET", "/servers/2/interfaces", (200, {}, []))
+
+    with Inventory() as inventory:
+        first = sync_inventory(7, inventory, kinds=["interfaces"])
+        second = sync_inventory(7, inventory, kinds=["interfaces"])
+        assert inventory.load("interfaces", 1) == IFACES
+
+    assert first["interfaces"]["added"] == 2
+    assert second["interfaces"]["unchanged"] == 2 and second["interfaces"]["added"] == 0
+
+
+def _list_interfaces(*args: str):
+    return CliRunner().invoke(cli, ["servers", "interfaces", "list", "1", *args])
+
+
+def test_cached_read_uses_fresh_inventory(stub, api):
+    with Inventory() as inventory:
+        inventory.store("interfaces", 1, IFACES)
+
+    result = _list_interfaces("--cached")
+
+    assert result.exit_code == 0, result.output
+    assert '"mac": "aa"' in result.stdout
+    assert stub.calls() == []
+
+
+def test_cached_read_falls_back_to_the_api_when_stale(stub, api):
+    stub.route("GET", "/servers/1/interfaces", (200, {}, [{"mac": "cc"}]))
+    with Inventory() as inventory:
+        inventory.store("interfaces", 1, IFACES)
+
+    result = _list_interfaces("--cached", "--max-age", "0")
+
+    assert result.exit_code == 0, result.output
+    assert '"mac": "cc"' in result.stdout
+    assert "querying API" in result.stderr
+
+
+def test_cached_read_rejects_no_rdns(stub, api):
+    result = _list_interfaces("--cached", "--no-rdns")
+
+    assert result.exit_code == 2
+    assert "--no-rdns" in result.stderr
+    assert stub.calls() == []
@@ -0,0 +1,78 @@
+"""JSON / NDJSON output and streaming into a closed pipe."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from netcup_cli import output
+from netcup_cli.cli.main import cli
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+@pytest.fixture(autouse=True)
+def reset_output_format():
+    yield
+    output.set_output_format("json")
+
+
+def test_ndjson_lists_become_one_line_per_item(stub, api):
+    servers = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    stub.route("GET", "/servers", (200, {}, servers))
+
+    result = CliRunner().invoke(cli, ["-o", "ndjson", "servers", "list"])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.splitlines() == ['{"id":1,"name":"a"}', '{"id":2,"name":"b"}']
+
+
+def test_ndjson_single_record_is_one_line(capsys):
+    output.set_output_format("ndjson")
+
+    output.print_json({"id": 1, "tags": ["x"]})
+
+    assert capsys.readouterr().out == '{"id":1,"tags":["x"]}\n'
+
+
+@pytest.mark.parametrize("items", [[], [{"id": 1}], [{"id": 1}, {"id": 2, "a": [1, 2]}]])
+def test_json_stream_matches_the_document(capsys, items):
+    output.print_json(items)
+    document = capsys.readouterr().out
+
+    output.print_json_stream(iter(items))
+
+    assert capsys.readouterr().out == document
+    assert json.loads(document) == items
+
+
+PIPE_PROBE = """
+import itertools
+from netcup_cli import output
+
+output.set_output_format("ndjson")
+output.print_json_stream({"id": i} for i in itertools.count())
+"""
+
+
+def test_closed_pipe_stops_the_stream_quietly():
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    proc = subprocess.Popen(
+        [sys.executable, "-c", PIPE_PROBE],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    lines = [proc.stdout.readline() for _ in range(3)]
+    proc.stdout.close()
+
+    # The generator is endless: only the broken pipe ends the process
+    _, stderr = proc.communicate(timeout=10)
+
+    assert [json.loads(line) for line in lines] == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert proc.returncode == 1
+    assert stderr == b""
@@ -0,0 +1,73 @@
+"""Lazy limit/offset pagination against the stub server."""
+
+import time
+
+import pytest
+
+from netcup_cli.api.pagination import paginate
+from netcup_cli.api.servers import iter_servers, server_list
+
+
+def _serve_servers(stub, count: int) -> None:
+    def servers(request):
+        limit = int(request["query"]["limit"][0])
+        offset = int(request["query"]["offset"][0])
+        return 200, {}, [{"id": i} for i in range(offset, min(offset + limit, count))]
+
+    stub.route("GET", "/servers", servers)
+
+
+def _pages(stub) -> list[tuple[int, int]]:
+    return [
+        (int(r["query"]["limit"][0]), int(r["query"]["offset"][0]))
+        for r in stub.calls("GET", "/servers")
+    ]
+
+
+@pytest.mark.parametrize(
+    ("count", "pages"),
+    [
+        (7, [(3, 0), (3, 3), (3, 6)]),
+        (6, [(3, 0), (3, 3), (3, 6)]),
+        (0, [(3, 0)]),
+    ],
+)
+def test_pages_end_at_the_first_short_page(stub, api, count, pages):
+    _serve_servers(stub, count)
+
+    records = list(iter_servers(page_size=3))
+
+    assert [r["id"] for r in records] == list(range(count))
+    assert _pages(stub) == pages
+
+
+def _wait_for_calls(stub, count: int) -> None:
+    deadline = time.monotonic() + 2
+    while len(stub.calls()) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_next_page_is_prefetched_while_the_current_one_is_consumed(stub, api):
+    _serve_servers(stub, 10)
+    records = iter_servers(page_size=4)
+
+    assert next(records) == {"id": 0}
+    _wait_for_calls(stub, 2)
+
+    assert _pages(stub) == [(4, 0), (4, 4)]
+    assert [r["id"] for r in records] == list(range(1, 10))
+    assert _pages(stub) == [(4, 0), (4, 4), (4, 8)]
+
+
+def test_without_prefetch_pages_are_fetched_on_demand(stub, api):
+    _serve_servers(stub, 10)
+    records = paginate(
+        lambda limit, offset: server_list(limit=limit, offset=offset), 4, prefetch=False
+    )
+
+    for expected in range(4):
+        assert next(records) == {"id": expected}
+    time.sleep(0.1)
+
+    assert _pages(stub) == [(4, 0)]
+    assert [r["id"] for r in records] == list(range(4, 10))
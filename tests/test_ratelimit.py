@@ -0,0 +1,100 @@
+"""Token-bucket rate limiter, per process and shared through a state file."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from netcup_cli import ratelimit
+from netcup_cli.ratelimit import RateLimiter
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+class FakeClock:
+    """Stands in for the time module: sleep() advances time() instantly."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ratelimit, "time", clock)
+    return clock
+
+
+def test_burst_is_free_then_requests_are_spaced(clock):
+    limiter = RateLimiter(rate=2, burst=3)
+
+    waits = [limiter.acquire() for _ in range(5)]
+
+    assert waits == [0, 0, 0, pytest.approx(0.5), pytest.approx(0.5)]
+
+
+def test_bucket_refills_at_rate_up_to_burst(clock):
+    limiter = RateLimiter(rate=4, burst=2)
+    limiter.acquire()
+    limiter.acquire()
+
+    clock.now += 0.25
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(0.25)
+
+    clock.now += 100
+    assert [limiter.acquire() for _ in range(3)] == [0, 0, pytest.approx(0.25)]
+
+
+def test_default_burst_and_invalid_rate():
+    assert RateLimiter(rate=5).burst == 5
+    assert RateLimiter(rate=0.5).burst == 1
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+@pytest.mark.skipif(ratelimit.fcntl is None, reason="needs flock")
+def test_limiters_sharing_a_state_file_share_the_budget(clock, tmp_path):
+    state = tmp_path / "state" / "rate_limit"
+    first = RateLimiter(rate=2, burst=2, state_path=state)
+    second = RateLimiter(rate=2, burst=2, state_path=state)
+
+    assert [first.acquire(), first.acquire()] == [0, 0]
+    assert second.acquire() == pytest.approx(0.5)
+    tokens, updated = (float(x) for x in state.read_text().split())
+    assert tokens == pytest.approx(-1) and updated == clock.now - 0.5
+
+
+PROCESS_PROBE = """
+import sys
+from pathlib import Path
+from netcup_cli.ratelimit import RateLimiter
+
+limiter = RateLimiter(rate=20, burst=1, state_path=Path(sys.argv[1]))
+for _ in range(10):
+    limiter.acquire()
+"""
+
+
+@pytest.mark.skipif(ratelimit.fcntl is None, reason="needs flock")
+def test_processes_sharing_a_state_file_share_the_rate(tmp_path):
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    args = [sys.executable, "-c", PROCESS_PROBE, str(tmp_path / "rate_limit")]
+
+    started = time.monotonic()
+    procs = [subprocess.Popen(args, env=env) for _ in range(2)]
+    assert [proc.wait(timeout=30) for proc in procs] == [0, 0]
+    elapsed = time.monotonic() - started
+
+    # 20 requests at 20/s with a burst of 1: at least 19 intervals of 50 ms (one
+    # process alone would need only 9)
+    assert elapsed >= 19 / 20
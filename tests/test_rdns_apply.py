@@ -0,0 +1,30 @@
+"""Parsing of rDNS mapping files."""
+
+import pytest
+
+from netcup_cli.rdns_apply import read_mappings
+
+
+def test_csv_rows_set_and_delete():
+    lines = ["ip,ptr", "# comment", "192.0.2.1,host.example.com.", "192.0.2.2,", ""]
+    text = "\n".join([*lines, "2001:db8::1,v6.example.com"])
+    assert read_mappings(text, "csv") == {
+        "192.0.2.1": "host.example.com",
+        "192.0.2.2": None,
+        "2001:db8::1": "v6.example.com",
+    }
+
+
+def test_csv_row_without_ptr_column_is_rejected():
+    with pytest.raises(ValueError, match="Line 3"):
+        read_mappings("192.0.2.1,a.example.com\n\n192.0.2.2\n", "csv")
+
+
+def test_conflicting_mappings_are_rejected():
+    with pytest.raises(ValueError, match="Conflicting"):
+        read_mappings("192.0.2.1,a.example.com\n192.0.2.1,b.example.com\n", "csv")
+
+
+def test_zone_records_relative_to_origin():
+    text = "$ORIGIN 2.0.192.in-addr.arpa.\n1 IN PTR host.example.com.\n"
+    assert read_mappings(text, "zone") == {"192.0.2.1": "host.example.com"}
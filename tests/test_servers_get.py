@@ -0,0 +1,65 @@
+"""servers get with several IDs / --all: parallel fetches and per-server failures."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from netcup_cli.api.servers import server_get_many
+from netcup_cli.cli.main import cli
+from netcup_cli.exceptions import APIError
+
+
+def _serve(stub, ids: range, failing: int) -> None:
+    for server_id in ids:
+        reply = (
+            (500, {}, {"message": "broken"})
+            if server_id == failing
+            else (200, {}, {"id": server_id})
+        )
+        stub.route("GET", f"/servers/{server_id}", reply)
+
+
+def _invoke(*args: str):
+    return CliRunner().invoke(cli, ["servers", "get", *args])
+
+
+@pytest.mark.parametrize("workers", [None, "1"])
+def test_one_failure_does_not_stop_the_others(stub, api, workers):
+    _serve(stub, range(1, 6), failing=1)
+
+    result = _invoke(*"1 2 3 4 5".split(), *(["--workers", workers] if workers else []))
+
+    assert result.exit_code == 1
+    assert sorted(s["id"] for s in json.loads(result.stdout)) == [2, 3, 4, 5]
+    assert "Server 1: " in result.stderr and "1 failed" in result.stderr
+    assert len(stub.calls("GET")) == 5
+
+
+def test_all_fetches_every_listed_server(stub, api):
+    stub.route("GET", "/servers", (200, {}, [{"id": i} for i in range(1, 4)]))
+    _serve(stub, range(1, 4), failing=2)
+
+    result = _invoke("--all")
+
+    assert result.exit_code == 1
+    assert sorted(s["id"] for s in json.loads(result.stdout)) == [1, 3]
+    assert "Server 2: " in result.stderr
+
+
+def test_all_succeeding_exits_zero(stub, api):
+    _serve(stub, range(1, 4), failing=0)
+
+    result = _invoke("1", "2", "3")
+
+    assert result.exit_code == 0
+    assert "0 failed" in result.stderr
+
+
+def test_library_yields_failures_instead_of_raising(stub, api):
+    _serve(stub, range(1, 4), failing=3)
+
+    results = {server_id: (data, error) for server_id, data, error in server_get_many([1, 2, 3])}
+
+    assert results[1][0] == {"id": 1} and results[2][0] == {"id": 2}
+    assert isinstance(results[3][1], APIError) and results[3][1].status_code == 500
@@ -0,0 +1,72 @@
+"""Coalescing of concurrent identical GETs."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from netcup_cli.client import APIClient
+from netcup_cli.exceptions import APIError
+
+THREADS = 10
+
+
+def _slow(reply):
+    def handler(request):
+        time.sleep(0.3)
+        return reply
+
+    return handler
+
+
+def _get_concurrently(client: APIClient, path: str, params: dict | None = None) -> list:
+    barrier = threading.Barrier(THREADS)
+
+    def get(_):
+        barrier.wait()
+        try:
+            return client.get(path, params=params)
+        except APIError as e:
+            return e
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        return list(pool.map(get, range(THREADS)))
+
+
+def test_identical_gets_share_one_request(stub):
+    stub.route("GET", "/servers/1", _slow((200, {}, {"id": 1})))
+    client = APIClient("t", stub.url)
+
+    responses = _get_concurrently(client, "/servers/1")
+
+    assert len(stub.calls()) == 1
+    assert all(resp is responses[0] for resp in responses)
+    assert responses[0].json() == {"id": 1}
+
+
+def test_errors_are_shared_too(stub):
+    stub.route("GET", "/servers/1", _slow((404, {}, {"message": "missing"})))
+    client = APIClient("t", stub.url)
+
+    results = _get_concurrently(client, "/servers/1")
+
+    assert len(stub.calls()) == 1
+    assert all(isinstance(r, APIError) and r.status_code == 404 for r in results)
+
+
+def test_different_params_are_not_coalesced(stub):
+    stub.route("GET", "/servers", _slow((200, {}, [])))
+    client = APIClient("t", stub.url)
+
+    with ThreadPoolExecutor(2) as pool:
+        list(pool.map(lambda n: client.get("/servers", params={"limit": n}), (1, 2)))
+
+    assert len(stub.calls()) == 2
+
+
+def test_single_flight_can_be_disabled(stub):
+    stub.route("GET", "/servers/1", _slow((200, {}, {"id": 1})))
+    client = APIClient("t", stub.url, single_flight=False, pool_maxsize=THREADS)
+
+    _get_concurrently(client, "/servers/1")
+
+    assert len(stub.calls()) == THREADS
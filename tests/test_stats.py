@@ -0,0 +1,88 @@
+"""Request statistics: endpoint templates and latency aggregation."""
+
+import pytest
+
+from netcup_cli import stats
+from netcup_cli.client import APIClient
+from netcup_cli.config import API_BASE_URL, AUTH_URL
+from netcup_cli.exceptions import APIError
+from netcup_cli.stats import RequestStats, path_template
+
+
+@pytest.mark.parametrize(
+    ("path", "template"),
+    [
+        ("/servers/123", "/servers/{id}"),
+        ("/servers/123/interfaces/AA:BB:cc:dd:ee:ff", "/servers/{id}/interfaces/{mac}"),
+        ("/tasks/0c2f7e1a-3b4d-4e5f-8a9b-0123456789ab", "/tasks/{uuid}"),
+        ("/rdns/ipv4/192.0.2.10", "/rdns/ipv4/{ip}"),
+        ("/rdns/ipv6/2001:db8::1", "/rdns/ipv6/{ip}"),
+        ("/users/7/images/disk.qcow2/parts/3", "/users/{id}/images/disk.qcow2/parts/{id}"),
+        (
+            "/servers/1/interfaces/aa:bb:cc:dd:ee:ff/firewall:reapply",
+            "/servers/{id}/interfaces/{mac}/firewall:reapply",
+        ),
+        ("/maintenance", "/maintenance"),
+    ],
+)
+def test_path_template_replaces_identifiers(path, template):
+    assert path_template(f"{API_BASE_URL}{path}?limit=10") == template
+
+
+def test_auth_urls_are_labelled():
+    assert path_template(f"{AUTH_URL}/token") == "oidc:/token"
+
+
+def _record(path: str, total: float, status: int | None = 200, size: int = 10) -> dict:
+    return {"method": "GET", "path": path, "status": status, "bytes": size, "total": total}
+
+
+def test_summary_percentiles_and_ordering():
+    collector = RequestStats()
+    for n in range(1, 21):
+        collector.add(_record("/servers/{id}", n / 100))
+    collector.add(_record("/tasks", 2.0, status=503))
+    collector.add(_record("/tasks", 1.0, status=None, size=0))
+
+    tasks, servers = collector.summary()
+
+    assert tasks["endpoint"] == "GET /tasks" and tasks["errors"] == 2
+    assert servers == {
+        "endpoint": "GET /servers/{id}",
+        "count": 20,
+        "errors": 0,
+        "bytes": 200,
+        "p50": 0.10,
+        "p95": 0.19,
+        "max": 0.20,
+        "sum": pytest.approx(2.10),
+    }
+
+
+def test_single_request_percentiles():
+    collector = RequestStats()
+    collector.add(_record("/maintenance", 0.3))
+
+    [row] = collector.summary()
+
+    assert row["p50"] == row["p95"] == row["max"] == 0.3
+
+
+def test_requests_are_grouped_by_template(stub):
+    for server_id in (1, 2, 3):
+        stub.route("GET", f"/servers/{server_id}", (200, {}, {"id": server_id}))
+    collector = stats.enable()
+    try:
+        client = APIClient("t", stub.url)
+        for server_id in (1, 2, 3):
+            client.get(f"/servers/{server_id}")
+        with pytest.raises(APIError):
+            client.get("/servers/9")
+    finally:
+        stats.disable()
+
+    [row] = collector.summary()
+    assert row["endpoint"] == "GET /servers/{id}"
+    assert row["count"] == 4 and row["errors"] == 1
+    assert all(r["ttfb"] is not None and r["total"] >= r["ttfb"] for r in collector.records)
+    assert "4 requests" in collector.report()
@@ -0,0 +1,69 @@
+"""--wait/--timeout on task-returning commands."""
+
+import pytest
+from click.testing import CliRunner
+
+from netcup_cli.api import task_wait
+from netcup_cli.cli.main import cli
+
+TASK = {"uuid": "t1", "state": "RUNNING"}
+
+
+@pytest.fixture
+def run(api, monkeypatch):
+    monkeypatch.setattr(task_wait.time, "sleep", lambda seconds: None)
+
+    def invoke(*args: str):
+        return CliRunner().invoke(cli, list(args), catch_exceptions=False)
+
+    return invoke
+
+
+@pytest.mark.parametrize(
+    ("args", "method", "path"),
+    [
+        (["servers", "set-hostname", "1", "host"], "PATCH", "/servers/1"),
+        (["servers", "set-nickname", "1", "nick"], "PATCH", "/servers/1"),
+        (
+            ["servers", "interfaces", "delete", "1", "aa:bb"],
+            "DELETE",
+            "/servers/1/interfaces/aa:bb",
+        ),
+        (
+            ["servers", "firewall", "reapply", "1", "aa:bb"],
+            "POST",
+            "/servers/1/interfaces/aa:bb/firewall:reapply",
+        ),
+        (
+            ["users", "failoverips", "v4", "route", "--user-id", "7", "3", "1"],
+            "PATCH",
+            "/users/7/failoverips/v4/3",
+        ),
+    ],
+)
+def test_wait_polls_the_returned_task(stub, run, args, method, path):
+    stub.route(method, path, (202, {}, TASK))
+    stub.route("GET", "/tasks/t1", (200, {}, {"uuid": "t1", "state": "ERROR"}))
+
+    result = run(*args, "--wait")
+
+    assert result.exit_code == 3
+    assert '"ERROR"' in result.output
+
+
+def test_no_content_prints_ok(stub, run):
+    stub.route("PATCH", "/servers/1", (204, {}, None))
+
+    result = run("servers", "set-hostname", "1", "host")
+
+    assert result.exit_code == 0
+    assert result.output == "OK\n"
+
+
+def test_empty_result_is_printed(stub, run):
+    stub.route("PATCH", "/servers/1", (200, {}, {}))
+
+    result = run("servers", "power", "1", "on")
+
+    assert result.exit_code == 0
+    assert result.output.strip() == "{}"
@@ -0,0 +1,143 @@
+"""Adaptive task polling, wait_for_task and TaskWatcher against the stub server."""
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+from click.testing import CliRunner
+
+from netcup_cli.api import task_wait
+from netcup_cli.api.task_wait import TaskWatcher, next_poll_interval, wait_for_task
+from netcup_cli.cli.main import cli
+from netcup_cli.exceptions import TaskTimeoutError
+
+TASKS = {
+    "a": {"uuid": "a", "state": "RUNNING"},
+    "b": {"uuid": "b", "state": "PENDING"},
+    "c": {"uuid": "c", "state": "ROLLBACK"},
+    "d": {"uuid": "d", "state": "FINISHED"},
+}
+
+
+def _serve_tasks(stub) -> None:
+    def task_list(request):
+        state = request["query"]["state"][0]
+        if state == "ROLLBACK":
+            return 400, {}, {"message": "ROLLBACK is not supported"}
+        return 200, {}, [t for t in TASKS.values() if t["state"] == state]
+
+    stub.route("GET", "/tasks", task_list)
+    for uuid, task in TASKS.items():
+        stub.route("GET", f"/tasks/{uuid}", (200, {}, task))
+
+
+def _listed_states(stub) -> list[str]:
+    return [r["query"]["state"][0] for r in stub.calls("GET", "/tasks")]
+
+
+def test_unfinished_tasks_come_from_the_lists(stub, api):
+    _serve_tasks(stub)
+    watcher = TaskWatcher(["a", "b", "c", "d"])
+
+    finished = watcher.poll()
+
+    assert [t["uuid"] for t in finished] == ["d"]
+    assert sorted(watcher.pending) == ["a", "b", "c"]
+    assert [r["path"] for r in stub.calls("GET") if r["path"] != "/tasks"] == [
+        "/tasks/c",
+        "/tasks/d",
+    ]
+    assert watcher.pending["c"]["state"] == "ROLLBACK"
+    assert "ROLLBACK" not in _listed_states(stub)
+    assert _listed_states(stub) == ["RUNNING", "PENDING", "WAITING_FOR_CANCEL"]
+
+
+def test_listing_stops_once_every_task_is_seen(stub, api):
+    _serve_tasks(stub)
+    watcher = TaskWatcher(["a", "b"])
+
+    assert watcher.poll() == []
+    assert _listed_states(stub) == ["RUNNING", "PENDING"]
+    assert len(stub.calls()) == 2
+
+
+def test_single_task_is_fetched_directly(stub, api):
+    _serve_tasks(stub)
+    watcher = TaskWatcher(["b"])
+
+    watcher.poll()
+
+    assert [r["path"] for r in stub.calls()] == ["/tasks/b"]
+
+
+def _iso(offset: float) -> str:
+    return datetime.fromtimestamp(time.time() + offset, timezone.utc).isoformat()
+
+
+def test_interval_without_progress_grows_from_the_minimum():
+    task = {"uuid": "a", "state": "RUNNING"}
+
+    assert next_poll_interval(task, None, 1, 30) == 1
+    assert next_poll_interval(task, 2, 1, 30) == 3
+    assert next_poll_interval(task, 25, 1, 30) == 30
+
+
+def test_interval_is_half_the_expected_remaining_time():
+    def progress(**fields) -> dict:
+        return {"uuid": "a", "state": "RUNNING", "taskProgress": fields}
+
+    assert next_poll_interval(progress(expectedFinishedAt=_iso(20)), None, 1, 30) == (
+        pytest.approx(10, abs=0.1)
+    )
+    assert next_poll_interval(progress(expectedFinishedAt=_iso(600)), None, 1, 30) == 30
+    assert next_poll_interval(progress(expectedFinishedAt=_iso(-5)), None, 1, 30) == 1
+    extrapolated = {**progress(progressInPercent=50), "startedAt": _iso(-16)}
+    assert next_poll_interval(extrapolated, None, 1, 30) == pytest.approx(8, abs=0.1)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept: list[float] = []
+    monkeypatch.setattr(task_wait.time, "sleep", slept.append)
+    return slept
+
+
+def test_wait_for_task_polls_until_a_final_state(stub, api, sleeps):
+    states = iter(["RUNNING", "RUNNING", "FINISHED"])
+    stub.route("GET", "/tasks/t1", lambda request: (200, {}, {"uuid": "t1", "state": next(states)}))
+    seen = []
+
+    task = wait_for_task("t1", on_update=lambda t: seen.append(t["state"]))
+
+    assert task["state"] == "FINISHED"
+    assert seen == ["RUNNING", "RUNNING", "FINISHED"]
+    assert sleeps == [1.0, 1.5]
+
+
+def test_wait_for_task_starts_from_a_returned_taskinfo(stub, api, sleeps):
+    stub.route("GET", "/tasks/t1", (200, {}, {"uuid": "t1", "state": "ERROR"}))
+
+    task = wait_for_task({"uuid": "t1", "state": "PENDING"})
+
+    assert task["state"] == "ERROR"
+    assert len(stub.calls()) == 1
+
+
+def test_wait_for_task_timeout_carries_the_last_task(stub, api, sleeps):
+    stub.route("GET", "/tasks/t1", (200, {}, {"uuid": "t1", "state": "RUNNING"}))
+
+    with pytest.raises(TaskTimeoutError) as excinfo:
+        wait_for_task("t1", timeout=0)
+
+    assert excinfo.value.task == {"uuid": "t1", "state": "RUNNING"}
+
+
+@pytest.mark.parametrize("order", [("err", "can"), ("can", "err")])
+def test_a_failed_task_is_not_hidden_by_a_canceled_one(stub, api, sleeps, order):
+    stub.route("GET", "/tasks", (200, {}, []))
+    stub.route("GET", "/tasks/err", (200, {}, {"uuid": "err", "state": "ERROR"}))
+    stub.route("GET", "/tasks/can", (200, {}, {"uuid": "can", "state": "CANCELED"}))
+
+    result = CliRunner().invoke(cli, ["tasks", "wait", "--quiet", *order])
+
+    assert result.exit_code == 3
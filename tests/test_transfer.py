@@ -0,0 +1,247 @@
+"""Multipart upload and ranged download of user images against the stub server,
+which also plays the S3 object store behind the presigned URLs."""
+
+import json
+import os
+import re
+
+import pytest
+
+from netcup_cli import transfer
+from netcup_cli.exceptions import APIError
+
+USER = 7
+KEY = "disk.qcow2"
+
+
+@pytest.fixture
+def small_parts(monkeypatch):
+    monkeypatch.setattr(transfer, "UPLOAD_MIN_PART_SIZE", 1024)
+    monkeypatch.setattr(transfer, "_MIB", 1024)
+
+
+class FakeMultipart:
+    """SCP multipart endpoints plus presigned part URLs; `fail` holds
+    (upload_id, part) pairs whose next PUT is answered 403."""
+
+    def __init__(self, stub, upload_ids: list[str], max_parts: int = 8):
+        self.stub = stub
+        self.started: list[str] = []
+        self.parts: dict[str, dict[int, bytes]] = {u: {} for u in upload_ids}
+        self.completed: dict[str, list] = {}
+        self.expired: set[str] = set()
+        self.fail: set[tuple[str, int]] = set()
+        ids = iter(upload_ids)
+        base = f"/users/{USER}/images/{KEY}"
+
+        def start(request):
+            self.started.append(next(ids))
+            return 200, {}, {"uploadId": self.started[-1]}
+
+        stub.route("POST", base, start)
+        for upload_id in upload_ids:
+            stub.route("PUT", f"{base}/{upload_id}", self._complete(upload_id))
+            for number in range(1, max_parts + 1):
+                stub.route(
+                    "GET", f"{base}/{upload_id}/parts/{number}", self._url(upload_id, number)
+                )
+                stub.route("PUT", f"/s3/{upload_id}/{number}", self._put(upload_id, number))
+
+    def _url(self, upload_id: str, number: int):
+        def handler(request):
+            if upload_id in self.expired:
+                return 404, {}, {"message": "no such upload"}
+            return 200, {}, {"url": f"{self.stub.url}/s3/{upload_id}/{number}"}
+
+        return handler
+
+    def _put(self, upload_id: str, number: int):
+        def handler(request):
+            if (upload_id, number) in self.fail:
+                self.fail.discard((upload_id, number))
+                return 403, {}, "denied"
+            self.parts[upload_id][number] = request["body"]
+            return 200, {"ETag": f'"{upload_id}-{number}"'}, b""
+
+        return handler
+
+    def _complete(self, upload_id: str):
+        def handler(request):
+            self.completed[upload_id] = json.loads(request["body"])
+            return 200, {}, None
+
+        return handler
+
+    def assembled(self, upload_id: str) -> bytes:
+        return b"".join(self.parts[upload_id][p["partNumber"]] for p in self.completed[upload_id])
+
+    def put_parts(self, upload_id: str) -> list[int]:
+        return [
+            int(r["path"].rsplit("/", 1)[1])
+            for r in self.stub.calls("PUT")
+            if r["path"].startswith(f"/s3/{upload_id}/")
+        ]
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / KEY
+    path.write_bytes(os.urandom(10 * 1024 + 123))
+    return path
+
+
+def test_upload_sends_parts_and_completes_in_order(stub, api, small_parts, image):
+    s3 = FakeMultipart(stub, ["u1"])
+
+    result = transfer.upload_file("images", USER, KEY, image, part_size=4096, workers=3)
+
+    assert result["parts"] == 3 and result["resumedParts"] == 0
+    assert [p["partNumber"] for p in s3.completed["u1"]] == [1, 2, 3]
+    assert [p["ETag"] for p in s3.completed["u1"]] == ['"u1-1"', '"u1-2"', '"u1-3"']
+    assert s3.assembled("u1") == image.read_bytes()
+    assert not transfer.upload_state_path("images", USER, KEY, image).exists()
+
+
+def test_interrupted_upload_resumes_missing_parts(stub, api, small_parts, image):
+    s3 = FakeMultipart(stub, ["u1"])
+    s3.fail.add(("u1", 2))
+
+    with pytest.raises(APIError):
+        transfer.upload_file("images", USER, KEY, image, part_size=4096, workers=1)
+    assert transfer.upload_state_path("images", USER, KEY, image).exists()
+    first_run = s3.put_parts("u1")
+
+    result = transfer.upload_file("images", USER, KEY, image, part_size=4096, workers=1)
+
+    assert s3.started == ["u1"]
+    assert result["resumedParts"] >= 1
+    second_run = s3.put_parts("u1")[len(first_run) :]
+    assert 1 not in second_run and 2 in second_run
+    assert s3.assembled("u1") == image.read_bytes()
+
+
+def test_expired_upload_is_restarted(stub, api, small_parts, image):
+    s3 = FakeMultipart(stub, ["u1", "u2"])
+    s3.fail.add(("u1", 2))
+    with pytest.raises(APIError):
+        transfer.upload_file("images", USER, KEY, image, part_size=4096, workers=1)
+    s3.expired.add("u1")
+
+    result = transfer.upload_file("images", USER, KEY, image, part_size=4096, workers=2)
+
+    assert s3.started == ["u1", "u2"]
+    assert result["resumedParts"] == 0
+    assert s3.assembled("u2") == image.read_bytes()
+
+
+def test_expired_upload_without_completed_parts_is_restarted(stub, api, small_parts, image):
+    s3 = FakeMultipart(stub, ["u1", "u2"])
+    s3.fail.add(("u1", 1))
+    with pytest.raises(APIError):
+        transfer.upload_file("images", USER, KEY, image, part_size=4096, workers=1)
+    state_path = transfer.upload_state_path("images", USER, KEY, image)
+    assert json.loads(state_path.read_text())["parts"] == {}
+    s3.expired.add("u1")
+
+    result = transfer.upload_file("images", USER, KEY, image, part_size=4096, workers=1)
+
+    assert s3.started == ["u1", "u2"]
+    assert result["resumedParts"] == 0
+    assert s3.assembled("u2") == image.read_bytes()
+
+
+def test_fresh_upload_is_not_restarted_after_a_404(stub, api, small_parts, image):
+    s3 = FakeMultipart(stub, ["u1", "u2"])
+    s3.expired.add("u1")
+
+    with pytest.raises(APIError) as e:
+        transfer.upload_file("images", USER, KEY, image, part_size=4096, workers=1)
+
+    assert e.value.status_code == 404
+    assert s3.started == ["u1"]
+
+
+def test_changed_file_is_not_resumed(stub, api, small_parts, image):
+    s3 = FakeMultipart(stub, ["u1", "u2"])
+    s3.fail.add(("u1", 2))
+    with pytest.raises(APIError):
+        transfer.upload_file("images", USER, KEY, image, part_size=4096, workers=1)
+    image.write_bytes(os.urandom(9000))
+
+    transfer.upload_file("images", USER, KEY, image, part_size=4096)
+
+    assert s3.started == ["u1", "u2"]
+    assert s3.assembled("u2") == image.read_bytes()
+
+
+class FakeObject:
+    """A stored image and its presigned URL, honouring single byte ranges."""
+
+    def __init__(self, stub, data: bytes, *, ranges: bool = True):
+        self.data = data
+        self.fail: set[int] = set()
+        self.stub = stub
+        stub.route(
+            "GET",
+            f"/users/{USER}/images",
+            (200, {}, [{"key": KEY, "sizeInB": len(data), "lastModified": "2026-01-01T00:00:00Z"}]),
+        )
+        stub.route(
+            "GET",
+            f"/users/{USER}/images/{KEY}",
+            (200, {}, {"presignedUrl": f"{stub.url}/s3/object", "headers": {"X-Test": ["a", "b"]}}),
+        )
+        stub.route("GET", "/s3/object", self._get if ranges else (200, {}, data))
+
+    def _get(self, request):
+        start, end = map(
+            int, re.fullmatch(r"bytes=(\d+)-(\d+)", request["headers"]["Range"]).groups()
+        )
+        if start in self.fail:
+            self.fail.discard(start)
+            return 403, {}, "denied"
+        body = self.data[start : end + 1]
+        return 206, {"Content-Range": f"bytes {start}-{end}/{len(self.data)}"}, body
+
+    def ranges(self) -> list[str]:
+        return [r["headers"]["Range"] for r in self.stub.calls("GET", "/s3/object")]
+
+
+def test_ranged_download_is_byte_exact(stub, api, small_parts, tmp_path):
+    data = os.urandom(10 * 1024 + 77)
+    s3 = FakeObject(stub, data)
+
+    result = transfer.download_file("images", USER, KEY, tmp_path, chunk_size=3000, workers=4)
+
+    assert (tmp_path / KEY).read_bytes() == data
+    assert result["chunks"] == 4 and result["size"] == len(data)
+    assert sorted(s3.ranges()) == sorted(
+        f"bytes={o}-{min(o + 3000, len(data)) - 1}" for o in range(0, len(data), 3000)
+    )
+    assert all(r["headers"]["X-Test"] == "a, b" for r in stub.calls("GET", "/s3/object"))
+    assert not (tmp_path / f"{KEY}.part").exists()
+
+
+def test_interrupted_download_resumes_missing_chunks(stub, api, small_parts, tmp_path):
+    data = os.urandom(9000)
+    s3 = FakeObject(stub, data)
+    s3.fail.add(3000)
+
+    with pytest.raises(APIError):
+        transfer.download_file("images", USER, KEY, tmp_path, chunk_size=3000, workers=1)
+    assert (tmp_path / f"{KEY}.part").exists()
+    first_run = len(s3.ranges())
+
+    result = transfer.download_file("images", USER, KEY, tmp_path, chunk_size=3000, workers=1)
+
+    assert (tmp_path / KEY).read_bytes() == data
+    assert result["resumedChunks"] >= 1
+    assert "bytes=0-2999" not in s3.ranges()[first_run:]
+
+
+def test_server_ignoring_ranges_is_an_error(stub, api, small_parts, tmp_path):
+    FakeObject(stub, os.urandom(9000), ranges=False)
+
+    with pytest.raises(APIError, match="range"):
+        transfer.download_file("images", USER, KEY, tmp_path, chunk_size=3000)
+    assert not (tmp_path / KEY).exists()
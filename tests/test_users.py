@@ -0,0 +1,51 @@
+"""Resolving the current user ID without a userinfo round trip."""
+
+import base64
+import json
+
+import pytest
+
+from netcup_cli import auth
+from netcup_cli.api import users
+
+USERINFO = "/realms/scp/protocol/openid-connect/userinfo"
+
+
+def _jwt(claims: dict) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"eyJhbGciOiJub25lIn0.{payload}.sig"
+
+
+@pytest.fixture
+def userinfo(stub, monkeypatch):
+    """Userinfo on the stub server answering id 42; tokens carry `claims`."""
+    claims: dict = {}
+    monkeypatch.setattr(users, "BASE_URL", stub.url)
+    monkeypatch.setattr(users, "get_access_token", lambda: _jwt(claims))
+    stub.route("GET", USERINFO, (200, {}, {"id": 42, "email": "a@example.com"}))
+    stub.claims = claims
+    return stub
+
+
+def test_id_comes_from_the_token_claim(userinfo):
+    userinfo.claims["id"] = "17"
+
+    assert users.get_current_user_id() == 17
+    assert userinfo.calls() == []
+
+
+def test_id_comes_from_the_credentials_without_a_claim(userinfo):
+    auth.save_credentials("refresh-token", user_id=23)
+
+    assert users.get_current_user_id() == 23
+    assert userinfo.calls() == []
+
+
+def test_userinfo_is_asked_only_the_first_time(userinfo):
+    auth.save_credentials("refresh-token")
+
+    assert users.get_current_user_id() == 42
+    assert users.get_current_user_id() == 42
+
+    assert len(userinfo.calls("GET", USERINFO)) == 1
+    assert auth.load_credentials() == {"refresh_token": "refresh-token", "user_id": 42}